@@ -5,8 +5,8 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QStackedWidget, QStackedLayout, QFrame
 )
-from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QIcon, QPainter, QPainterPath, QRegion
+from PyQt6.QtCore import Qt, QRectF
 
 # --- Импортируем только РЕАЛЬНЫЙ фон ---
 from src.winspector.gui.widgets.neural_background import NeuralBackgroundWidget
@@ -19,17 +19,44 @@ class PulsingButtonMock(QLabel):
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setStyleSheet("background-color: #0078D4; color: white; border-radius: 110px;")
 
+def rounded_rect_path(rect: QRectF) -> QPainterPath:
+    """Скругленный прямоугольник с тем же радиусом углов, что и у фона."""
+    path = QPainterPath()
+    radius = NeuralBackgroundWidget.CORNER_RADIUS
+    path.addRoundedRect(rect, radius, radius)
+    return path
+
+# --- Непрозрачный корневой контейнер ---
+class OpaqueContainer(QWidget):
+    """
+    Заливает окно фоновым цветом вместо WA_TranslucentBackground.
+    Полупрозрачность нужна только "стеклу" (#GlassContainer), которое
+    рисуется поверх фона, поэтому само окно может оставаться непрозрачным
+    и обновляться через обычный backing store без альфа-композиции.
+
+    Заливка ограничена скругленным прямоугольником, а углы за его пределами
+    отсекает маска окна (см. DebugWindow.resizeEvent), иначе без
+    прозрачности они выглядели бы квадратными блоками BG_COLOR.
+    """
+    def __init__(self):
+        super().__init__()
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setClipPath(rounded_rect_path(QRectF(self.rect())))
+        painter.fillRect(event.rect(), NeuralBackgroundWidget.BG_COLOR)
+
 class DebugWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("UI Debug Window - Testing NeuralBackground")
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setMinimumSize(850, 700)
         self.resize(850, 700)
 
         # 1. Главный контейнер
-        container = QWidget()
+        container = OpaqueContainer()
         self.setCentralWidget(container)
 
         # 2. Корневой layout (фон + передний план)
@@ -74,6 +101,12 @@ class DebugWindow(QMainWindow):
 
         # TitleBar пока не добавляем
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Окно непрозрачное, поэтому скругленные углы задаются маской
+        path = rounded_rect_path(QRectF(self.rect()))
+        self.setMask(QRegion(path.toFillPolygon().toPolygon()))
+
     def _create_home_page(self) -> QWidget:
         page = QWidget()
         layout = QHBoxLayout(page)
@@ -4,19 +4,27 @@
 
 Этот скрипт выполняет полный цикл сборки:
 1. Компилирует ресурсы Qt (.qrc -> .py).
-2. Динамически генерирует .spec файл из шаблона.
+2. Упаковывает базу знаний в ZIP-архив и динамически генерирует .spec файл из шаблона.
 3. Запускает PyInstaller с сгенерированным .spec файлом.
 4. Создает готовый к распространению ZIP-архив.
 5. Поддерживает флаги для отладочной и релизной сборок.
 """
+import ast
+import json
 import os
 import shutil
+import string
 import subprocess
 import sys
-import re
 import logging
+import threading
 from pathlib import Path
 import argparse
+import zipfile
+
+import yaml
+
+import compile_resources
 
 # --- 1. НАСТРОЙКА ЛОГИРОВАНИЯ ---
 logging.basicConfig(
@@ -32,23 +40,40 @@ logging.basicConfig(
 APP_NAME = "WinSpectorPro"
 ENTRY_POINT = "src/main.py"
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+# POSIX-представление корня вычисляется один раз: пути в .spec файле
+# всегда записываются с прямыми слешами
+PROJECT_ROOT_POSIX = PROJECT_ROOT.as_posix()
 DIST_PATH = PROJECT_ROOT / "dist"
-BUILD_PATH = PROJECT_ROOT / "build"
+# Рабочую директорию PyInstaller можно вынести на RAM-диск, указав путь к нему
+# в переменной окружения WINSPECTOR_RAM_BUILD: анализ зависимостей и запись
+# тысяч .pyc файлов упираются в дисковый ввод-вывод.
+_RAM_BUILD_ROOT = os.environ.get("WINSPECTOR_RAM_BUILD")
+BUILD_PATH = Path(_RAM_BUILD_ROOT) / f"{APP_NAME}-build" if _RAM_BUILD_ROOT else PROJECT_ROOT / "build"
 ICON_PATH = PROJECT_ROOT / "assets" / "app.ico"
+# Хуки PyInstaller со скрытыми импортами приложения
+HOOKS_PATH = PROJECT_ROOT / "scripts" / "build_hooks"
+KB_SOURCE_PATH = PROJECT_ROOT / "src" / "winspector" / "data" / "knowledge_base"
+# База знаний поставляется одним архивом, а не деревом файлов
+KB_ARCHIVE_PATH = BUILD_PATH / "knowledge_base.zip"
 
 def get_project_version() -> str:
-    """Читает версию из __init__.py с помощью регулярного выражения."""
+    """Читает версию из __init__.py, разбирая его синтаксическое дерево."""
     init_py_path = PROJECT_ROOT / "src" / "winspector" / "__init__.py"
     try:
-        content = init_py_path.read_text(encoding="utf-8")
-        match = re.search(r"^__version__\s*=\s*['\"]([^'\"]*)['\"]", content, re.M)
-        if match:
-            return match.group(1)
+        tree = ast.parse(init_py_path.read_text(encoding="utf-8"))
+        for node in tree.body:
+            if (
+                isinstance(node, ast.Assign)
+                and any(isinstance(t, ast.Name) and t.id == "__version__" for t in node.targets)
+                and isinstance(node.value, ast.Constant)
+                and isinstance(node.value.value, str)
+            ):
+                return node.value.value
         raise RuntimeError("Не удалось найти __version__ в файле.")
     except FileNotFoundError:
         logging.error(f"❌ Ошибка: Не удалось найти {init_py_path} для определения версии.")
         sys.exit(1)
-    except RuntimeError as e:
+    except (RuntimeError, SyntaxError) as e:
         logging.error(f"❌ Ошибка: {e}")
         sys.exit(1)
 
@@ -57,13 +82,8 @@ APP_VERSION = get_project_version()
 # Конфигурация для .spec файла
 SPEC_CONFIG = {
     "datas": [
-        ("src/winspector/data/knowledge_base", "winspector/data/knowledge_base"),
-        ("src/winspector/resources/styles", "winspector/resources/styles"),
-        ("assets", "assets"),
-    ],
-    "hiddenimports": [
-        "pygments", "google.generativeai.protos", "grpc._cython", "qasync",
-        "PyQt6.sip", "PyQt6.Qt6", "PyQt6.QtGui", "PyQt6.QtWidgets", "PyQt6.QtCore",
+        (KB_ARCHIVE_PATH.as_posix(), "winspector/data"),
+        (f"{PROJECT_ROOT_POSIX}/assets", "assets"),
     ],
     "excludes": [
         "pytest", "PyQt5", "PySide6", "tkinter", "unittest", "pydoc", "pydoc_data",
@@ -73,43 +93,60 @@ SPEC_CONFIG = {
 # --- 3. ФУНКЦИИ-ПОМОЩНИКИ ---
 
 def run_command(command: list, description: str):
-    """Выполняет команду и логирует ее вывод, принудительно используя UTF-8."""
+    """
+    Выполняет команду и логирует ее вывод построчно по мере поступления,
+    принудительно используя UTF-8. Вывод не накапливается в памяти целиком,
+    поэтому прогресс долгих шагов (например, анализа PyInstaller) виден сразу.
+    """
     logging.info(f"Начало: {description}...")
+    env = os.environ.copy()
+    env["PYTHONIOENCODING"] = "utf-8"
+
     try:
-        # ### УЛУЧШЕНИЕ: Создаем копию переменных окружения и устанавливаем кодировку ###
-        env = os.environ.copy()
-        env["PYTHONIOENCODING"] = "utf-8"
-        
-        # ### ИЗМЕНЕНИЕ: Убираем text=True и encoding, будем декодировать вручную ###
-        process = subprocess.run(
-            command, check=True, capture_output=True, env=env
+        # stderr объединяем с stdout, чтобы сохранить порядок сообщений
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env
         )
-        
-        # Декодируем вывод с игнорированием ошибок на всякий случай
-        stdout = process.stdout.decode('utf-8', errors='ignore')
-        stderr = process.stderr.decode('utf-8', errors='ignore')
-
-        if stdout:
-            logging.info(stdout)
-        if stderr:
-            logging.warning(stderr) # Логируем stderr как предупреждение
-
-        logging.info(f"Успешно: {description}.")
-
-    except subprocess.CalledProcessError as e:
-        logging.error(f"❌ ОШИБКА: {description} завершился с ошибкой.")
-        # Декодируем вывод из исключения тоже
-        stdout = e.stdout.decode('utf-8', errors='ignore')
-        stderr = e.stderr.decode('utf-8', errors='ignore')
-        if stdout:
-            logging.error(stdout)
-        if stderr:
-            logging.error(stderr)
-        sys.exit(1)
     except FileNotFoundError:
         logging.error(f"❌ Ошибка: Команда '{command[0]}' не найдена. Убедитесь, что она установлена и доступна в PATH.")
         sys.exit(1)
 
+    with process:
+        for raw_line in process.stdout:
+            # Декодируем вывод с игнорированием ошибок на всякий случай
+            line = raw_line.decode('utf-8', errors='ignore').rstrip()
+            if line:
+                logging.info(line)
+
+    if process.returncode != 0:
+        logging.error(f"❌ ОШИБКА: {description} завершился с ошибкой (код {process.returncode}).")
+        sys.exit(1)
+
+    logging.info(f"Успешно: {description}.")
+
+def bundle_knowledge_base() -> Path:
+    """
+    Упаковывает базу знаний в один ZIP-архив для включения в сборку.
+
+    YAML-файлы разбираются один раз здесь и сохраняются в архив как JSON:
+    декодер json из стандартной библиотеки на порядки быстрее PyYAML,
+    поэтому приложению не нужно разбирать YAML при каждом запуске.
+    """
+    if not KB_SOURCE_PATH.is_dir():
+        logging.error(f"❌ Директория базы знаний не найдена: {KB_SOURCE_PATH}")
+        sys.exit(1)
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with zipfile.ZipFile(KB_ARCHIVE_PATH, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for yaml_file in sorted(KB_SOURCE_PATH.glob("*.yaml")):
+            data = yaml.load(yaml_file.read_bytes(), Loader=loader)
+            archive.writestr(
+                f"{yaml_file.stem}.json",
+                json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+            )
+    logging.info(f"📦 База знаний конвертирована в JSON и упакована: {KB_ARCHIVE_PATH}")
+    return KB_ARCHIVE_PATH
+
 def get_version_file_info() -> Path:
     """Создает временный файл с информацией о версии для Windows."""
     version_file_content = f"""
@@ -158,25 +195,30 @@ def generate_spec_from_template(is_debug: bool, version_file_path: Path) -> Path
         logging.error(f"❌ Шаблон '{template_path}' не найден!")
         sys.exit(1)
 
-    template_content = template_path.read_text(encoding="utf-8")
+    template = string.Template(template_path.read_text(encoding="utf-8"))
 
-    datas_list = [
-        f"('{str(PROJECT_ROOT / src).replace(os.sep, '/')}', '{dest}')"
-        for src, dest in SPEC_CONFIG['datas']
-    ]
+    datas_list = [f"('{src}', '{dest}')" for src, dest in SPEC_CONFIG['datas']]
 
-    spec_content = template_content.format(
-        entry_point=(PROJECT_ROOT / ENTRY_POINT).as_posix(),
-        project_root=PROJECT_ROOT.as_posix(),
-        datas=",".join(datas_list),
-        hiddenimports=SPEC_CONFIG['hiddenimports'],
-        excludes=SPEC_CONFIG['excludes'],
-        app_name=APP_NAME,
-        debug='True' if is_debug else 'False',
-        console='True' if is_debug else 'False',
-        icon_path=ICON_PATH.as_posix(),
-        version_file_path=version_file_path.as_posix(),
-    )
+    # Плейсхолдеры имеют вид $name, поэтому фигурные скобки в Python-коде
+    # шаблона не конфликтуют с подстановкой. Отсутствующий ключ - ошибка сборки.
+    try:
+        spec_content = template.substitute(
+            entry_point=f"{PROJECT_ROOT_POSIX}/{ENTRY_POINT}",
+            project_root=PROJECT_ROOT_POSIX,
+            datas=",".join(datas_list),
+            hooks_path=HOOKS_PATH.as_posix(),
+            excludes=repr(SPEC_CONFIG['excludes']),
+            app_name=APP_NAME,
+            debug=repr(is_debug),
+            console=repr(is_debug),
+            # Отладочной сборке assert-ы и docstring-и нужны, релизной - нет
+            optimize=repr(0 if is_debug else 2),
+            icon_path=ICON_PATH.as_posix(),
+            version_file_path=version_file_path.as_posix(),
+        )
+    except (KeyError, ValueError) as e:
+        logging.error(f"❌ Ошибка подстановки в шаблоне '{template_path}': {e}")
+        sys.exit(1)
 
     spec_path.write_text(spec_content, encoding='utf-8')
     logging.info(f"Файл спецификации сохранен: {spec_path}")
@@ -206,6 +248,41 @@ def create_distribution_archive():
     )
     logging.info("Архив успешно создан.")
 
+def discard_directory(path: Path) -> threading.Thread | None:
+    """
+    Убирает директорию с пути сборки, не дожидаясь ее удаления.
+
+    Переименование внутри того же родительского каталога выполняется
+    мгновенно, а само удаление десятков тысяч файлов старой сборки идет
+    в фоновом потоке параллельно со следующими шагами. Если переименовать
+    не удалось (например, файл занят), директория удаляется синхронно.
+    Остатки прерванных прошлых сборок (.<имя>-trash-<pid>) удаляются тем же
+    фоновым потоком.
+    """
+    trash_path = path.with_name(f".{path.name}-trash-{os.getpid()}")
+    # Совпадение PID с прерванной сборкой: имя нужно освободить до переименования
+    if trash_path.exists():
+        shutil.rmtree(trash_path, ignore_errors=True)
+    to_remove = list(path.parent.glob(f".{path.name}-trash-*"))
+
+    if path.exists():
+        try:
+            path.rename(trash_path)
+            to_remove.append(trash_path)
+        except OSError:
+            shutil.rmtree(path)
+
+    if not to_remove:
+        return None
+
+    def remove_all() -> None:
+        for trash in to_remove:
+            shutil.rmtree(trash, ignore_errors=True)
+
+    thread = threading.Thread(target=remove_all)
+    thread.start()
+    return thread
+
 def main():
     """Основная функция сборки."""
     parser = argparse.ArgumentParser(description="Скрипт сборки WinSpector Pro.")
@@ -218,20 +295,24 @@ def main():
     logging.info(f"🚀 Начало сборки WinSpector Pro v{APP_VERSION} ({build_type})...")
 
     # 1. Очистка
-    if DIST_PATH.exists(): shutil.rmtree(DIST_PATH)
-    if BUILD_PATH.exists(): shutil.rmtree(BUILD_PATH)
+    cleanup_threads = [t for t in (discard_directory(DIST_PATH), discard_directory(BUILD_PATH)) if t]
     DIST_PATH.mkdir(exist_ok=True)
-    BUILD_PATH.mkdir(exist_ok=True)
+    BUILD_PATH.mkdir(parents=True, exist_ok=True)
+    if _RAM_BUILD_ROOT:
+        logging.info(f"💾 Рабочая директория сборки: {BUILD_PATH}")
 
     # 2. Пред-сборочные шаги
-    run_command([sys.executable, "scripts/compile_resources.py"], "Компиляция файлов ресурсов Qt")
+    logging.info("Начало: Компиляция файлов ресурсов Qt...")
+    compile_resources.main()
+    bundle_knowledge_base()
     version_file = get_version_file_info()
 
     # 3. Генерация .spec файла
     spec_file = generate_spec_from_template(args.debug, version_file)
 
     # 4. Запуск PyInstaller
-    run_command([sys.executable, "-m", "PyInstaller", str(spec_file), "--noconfirm"], 
+    run_command([sys.executable, "-m", "PyInstaller", str(spec_file), "--noconfirm",
+                 "--workpath", str(BUILD_PATH / "pyinstaller"), "--distpath", str(DIST_PATH)],
                 "Сборка приложения с PyInstaller")
     
     # 5. Пост-сборочные шаги
@@ -245,6 +326,10 @@ def main():
         if spec_file.exists(): spec_file.unlink()
         logging.info(f"   - Временные файлы удалены.")
 
+    # Дожидаемся удаления результатов предыдущей сборки
+    for thread in cleanup_threads:
+        thread.join()
+
     logging.info("🏁 Готово!")
 
 if __name__ == "__main__":
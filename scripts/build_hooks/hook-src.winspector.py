@@ -0,0 +1,21 @@
+# scripts/build_hooks/hook-src.winspector.py
+"""
+Хук PyInstaller для пакета приложения.
+
+Собирает скрытые импорты, которые анализатор не находит сам, в одном месте,
+чтобы они обрабатывались за один проход вместе с графом импортов пакета.
+"""
+from PyInstaller.utils.hooks import collect_submodules
+
+hiddenimports = [
+    "pygments",
+    "qasync",
+    "grpc._cython",
+    # Qt-модули, которые используются приложением напрямую. Собирать весь
+    # PyQt6 через collect_submodules не нужно: это раздует сборку десятками
+    # неиспользуемых модулей Qt.
+    "PyQt6.sip", "PyQt6.Qt6", "PyQt6.QtCore", "PyQt6.QtGui", "PyQt6.QtWidgets", "PyQt6.QtOpenGLWidgets",
+]
+hiddenimports += collect_submodules("google.generativeai.protos")
+# Явно собираем все подмодули win32com, это надежнее, чем просто hook
+hiddenimports += collect_submodules("win32com")
@@ -1,6 +1,8 @@
 # scripts/compile_resources.py
+import importlib.util
 import subprocess
 import sys
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
 # --- КОНФИГУРАЦИЯ ---
@@ -9,46 +11,99 @@ RESOURCES_DIR = PROJECT_ROOT / "src" / "winspector" / "resources"
 QRC_FILE = RESOURCES_DIR / "assets.qrc"
 OUTPUT_FILE = RESOURCES_DIR / "assets_rc.py"
 
-# Точный путь к компилятору, который мы нашли.
-RCC_PATH = PROJECT_ROOT / "venv/Lib/site-packages/qt6_applications/Qt/bin/rcc.exe"
+PYSIDE_IMPORT = b"from PySide6 import QtCore"
+PYQT_IMPORT = b"from PyQt6 import QtCore"
 
-def main():
-    """Компилирует .qrc и автоматически исправляет сгенерированный файл."""
+# Запасной путь к компилятору в локальном venv проекта.
+FALLBACK_RCC_PATH = PROJECT_ROOT / "venv/Lib/site-packages/qt6_applications/Qt/bin/rcc.exe"
+
+def find_rcc_tool() -> Path:
+    """
+    Находит rcc из пакета qt6_applications текущего интерпретатора.
+    Компилятор запускается напрямую списком аргументов, без cmd.exe,
+    поэтому пути с пробелами не требуют экранирования.
+    """
+    spec = importlib.util.find_spec("qt6_applications")
+    if spec and spec.submodule_search_locations:
+        for location in spec.submodule_search_locations:
+            bin_dir = Path(location) / "Qt" / "bin"
+            for name in ("rcc.exe", "rcc"):
+                if (bin_dir / name).exists():
+                    return bin_dir / name
+    return FALLBACK_RCC_PATH
+
+def get_qrc_inputs(qrc_file: Path) -> list[Path]:
+    """Возвращает .qrc файл и все файлы, на которые он ссылается."""
+    inputs = [qrc_file]
+    root = ET.parse(qrc_file).getroot()
+    for file_node in root.iter("file"):
+        if file_node.text:
+            # Пути в <file> указываются относительно самого .qrc
+            inputs.append((qrc_file.parent / file_node.text.strip()).resolve())
+    return inputs
+
+def is_output_up_to_date(qrc_file: Path, output_file: Path) -> bool:
+    """
+    Проверяет, новее ли скомпилированный файл, чем .qrc и все его ресурсы.
+    Если какой-то из входных файлов отсутствует, считаем кэш недействительным,
+    чтобы rcc сам сообщил об ошибке.
+    """
+    if not output_file.exists():
+        return False
+    try:
+        newest_input = max(path.stat().st_mtime for path in get_qrc_inputs(qrc_file))
+    except (OSError, ET.ParseError):
+        return False
+    return output_file.stat().st_mtime > newest_input
+
+def main(force: bool = False):
+    """
+    Компилирует .qrc и автоматически исправляет сгенерированный файл.
+    Может вызываться напрямую из build.py, без запуска отдельного интерпретатора.
+    """
     print("🚀 Компиляция файлов ресурсов Qt (.qrc)...")
 
-    if not RCC_PATH.exists():
-        print(f"❌ Критическая ошибка: Компилятор не найден по пути: {RCC_PATH}")
+    if not force and QRC_FILE.exists() and is_output_up_to_date(QRC_FILE, OUTPUT_FILE):
+        print(f"✅ Ресурсы не изменились, используется кэш: {OUTPUT_FILE.name}")
+        return
+
+    rcc_path = find_rcc_tool()
+    if not rcc_path.exists():
+        print(f"❌ Критическая ошибка: Компилятор не найден по пути: {rcc_path}")
         sys.exit(1)
         
     if not QRC_FILE.exists():
         print(f"❌ Ошибка: Файл ресурсов не найден по пути: {QRC_FILE}")
         sys.exit(1)
 
-    print(f"   - Используется компилятор: {RCC_PATH}")
+    print(f"   - Используется компилятор: {rcc_path}")
     
-    command = [ str(RCC_PATH), str(QRC_FILE), "-g", "python", "-o", str(OUTPUT_FILE) ]
+    # Без -o rcc пишет результат в stdout: исправляем импорт в памяти
+    # и записываем файл на диск один раз. Данные ресурсов сжимаются
+    # с максимальным уровнем, если это дает выигрыш не менее 70%.
+    command = [
+        str(rcc_path), str(QRC_FILE), "-g", "python",
+        "--compress", "9", "--threshold", "70",
+    ]
 
     try:
-        subprocess.run(command, check=True)
+        result = subprocess.run(command, check=True, capture_output=True)
         print("✅ Компиляция ресурсов успешно завершена.")
         
         # --- Автоматическое исправление ---
-        print("   - Автоматическое исправление импорта...")
-        with open(OUTPUT_FILE, 'r+', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        content = result.stdout
+        if PYSIDE_IMPORT in content:
             # Заменяем импорт PySide6 на PyQt6
-            new_content = content.replace("from PySide6 import QtCore", "from PyQt6 import QtCore")
-            if new_content != content:
-                f.seek(0)
-                f.write(new_content)
-                f.truncate()
-                print("   - ✅ Импорт исправлен на PyQt6.")
-            else:
-                print("   - ✅ Исправление не потребовалось, импорт уже корректен.")
+            content = content.replace(PYSIDE_IMPORT, PYQT_IMPORT)
+            print("   - ✅ Импорт исправлен на PyQt6.")
+        OUTPUT_FILE.write_bytes(content)
 
     except (subprocess.CalledProcessError, FileNotFoundError) as e:
         print("\n❌ КРИТИЧЕСКАЯ ОШИБКА КОМПИЛЯЦИИ РЕСУРСОВ")
+        stderr = getattr(e, "stderr", None)
+        if stderr:
+            print(stderr.decode("utf-8", errors="ignore"))
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(force="--force" in sys.argv)
\ No newline at end of file
@@ -11,10 +11,11 @@
 """
 import sys
 import os
+import ctypes
 import traceback
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, NoReturn
+from typing import NoReturn
 import multiprocessing
 
 # --- 1. Константы и флаги ---
@@ -26,12 +27,13 @@ MIN_PYTHON_VERSION = (3, 10)
 # --- 2. Функции проверки и аварийного логирования ---
 
 def _show_critical_error_message(title: str, message: str) -> None:
-    """Пытается показать ошибку в GUI, если это возможно."""
+    """
+    Показывает ошибку в системном окне Windows.
+    Не использует Qt: на этом пути Qt может быть как раз тем, что не загрузилось.
+    """
     try:
-        from PyQt6.QtWidgets import QApplication, QMessageBox
-        app = QApplication.instance() or QApplication(sys.argv)
-        QMessageBox.critical(None, title, message)
-    except ImportError:
+        ctypes.windll.user32.MessageBoxW(None, message, title, 0x10) # MB_ICONERROR
+    except (AttributeError, OSError):
         print(f"Критическая ошибка: {title}\n{message}", file=sys.stderr)
 
 def check_environment() -> None:
@@ -58,14 +60,30 @@ def emergency_log(error_message: str) -> None:
         log_dir.mkdir(exist_ok=True)
         
         log_file = log_dir / "winspector_crash.log"
-        with log_file.open("a", encoding="utf-8") as f:
-            f.write(f"--- CRASH AT {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} ---\n")
-            f.write(error_message + "\n\n")
+        # Запись одним блоком байтов в небуферизованный файл в режиме
+        # дозаписи: один системный вызов write и никакого текстового кодека.
+        ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S').encode()
+        msg = error_message.encode("utf-8", errors="replace")
+        payload = b"--- CRASH AT " + ts + b" ---\n" + msg + b"\n\n"
+        with open(log_file, "ab", buffering=0) as f:
+            f.write(payload)
     except Exception as e:
         print(f"Не удалось записать аварийный лог: {e}", file=sys.stderr)
         print(f"Оригинальная ошибка:\n{error_message}", file=sys.stderr)
 
 
+def _list_dir_names(path: Path) -> frozenset:
+    """
+    Возвращает имена файлов директории за один проход os.scandir.
+    Это заменяет отдельный вызов exists() (и системный вызов) на каждый файл.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
 # --- 3. Основная функция-лаунчер ---
 
 def run_app() -> NoReturn:
@@ -75,41 +93,37 @@ def run_app() -> NoReturn:
     """
     check_environment()
     
-    app_paths: Dict[str, Path]
-    
     try:
         if IS_FROZEN:
-            # Режим .exe
+            # Режим .exe: _MEIPASS уже абсолютный путь, resolve() не нужен
             base_path = Path(sys._MEIPASS)
             log_dir = Path(sys.executable).parent / 'logs'
             assets_dir = base_path / 'assets'
-            # Путь к данным внутри .exe
-            kb_path = base_path / 'winspector' / 'data' / 'knowledge_base'
+            # Путь к данным внутри .exe: база знаний упакована в один архив
+            kb_path = base_path / 'winspector' / 'data' / 'knowledge_base.zip'
         else:
-            # Режим разработки
+            # Режим разработки. resolve() выполняется один раз, остальные
+            # пути строятся от уже разрешенного base_path.
             base_path = Path(__file__).parent.resolve() # -> C:/.../WinSpector_Pro_v1.0.0/src
-            log_dir = base_path.parent / 'logs'
-            assets_dir = base_path.parent / 'assets'
-            
-            # ####################################################################
-            # ### ФИНАЛЬНОЕ ИСПРАВЛЕНИЕ ЗДЕСЬ ###
-            # ####################################################################
+            project_root = base_path.parent
+            log_dir = project_root / 'logs'
+            assets_dir = project_root / 'assets'
             # Строим путь: src -> winspector -> data -> knowledge_base
             kb_path = base_path / 'winspector' / 'data' / 'knowledge_base'
 
-        if not IS_FROZEN:
-            src_root = str(base_path.parent)
+            src_root = str(project_root)
             if src_root not in sys.path:
                 sys.path.insert(0, src_root)
         
-        from src.winspector.application import main as app_main
-
-        app_paths = {
-            "base": base_path,
-            "logs": log_dir,
-            "assets": assets_dir,
-            "kb_path": kb_path,
-        }
+        from src.winspector.application import AppPaths, main as app_main
+
+        app_paths = AppPaths(
+            base=base_path,
+            logs=log_dir,
+            assets=assets_dir,
+            kb_path=kb_path,
+            asset_names=_list_dir_names(assets_dir),
+        )
         
         sys.exit(app_main(app_paths))
 
@@ -8,11 +8,9 @@
 и обеспечить консистентный запуск приложения.
 """
 
-import runpy
 import sys
 
 # Проверяем, был ли файл запущен напрямую (что не рекомендуется).
-# Конструкция `if __name__ == "__main__":` ниже обрабатывает основной случай.
 if __name__ != "__main__":
     # Этот блок кода не должен выполняться при нормальном запуске.
     # Он здесь для полноты и как защита от неправильного импорта.
@@ -23,25 +21,19 @@ if __name__ != "__main__":
     sys.exit(1)
 
 
-# Используем runpy для запуска 'src/main.py' как главного скрипта.
-# Это гарантирует, что вся логика настройки путей и проверок из 'main.py'
-# будет выполнена точно так же, как при запуске `python src/main.py`.
-#
-# `run_path` выполняет код по указанному пути в новом модуле,
-# эффективно имитируя прямой запуск этого файла.
+# Лаунчер импортируется как обычный модуль: в отличие от runpy.run_path,
+# это использует кэш байт-кода в __pycache__ и не компилирует файл заново.
 try:
-    # Предполагается, что `python -m winspector` запускается из корня проекта,
+    # Предполагается, что запуск выполняется из корня проекта,
     # где находится папка `src`.
-    runpy.run_path("src/main.py", run_name="__main__")
-except FileNotFoundError:
+    from src.main import run_app
+except ImportError as e:
     print(
-        "Ошибка: Не удалось найти 'src/main.py'.\n"
+        f"Ошибка: Не удалось импортировать лаунчер 'src/main.py': {e}\n"
         "Пожалуйста, запускайте приложение из корневой директории проекта, "
         "содержащей папку 'src'.",
         file=sys.stderr
     )
     sys.exit(1)
-except Exception as e:
-    # Отлавливаем любые другие неожиданные ошибки во время запуска
-    print(f"Непредвиденная ошибка при запуске через '__main__.py': {e}", file=sys.stderr)
-    sys.exit(1)
\ No newline at end of file
+
+run_app()
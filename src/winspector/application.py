@@ -2,68 +2,116 @@
 """
 Основной модуль приложения WinSpector Pro.
 Содержит класс Application, который инкапсулирует всю логику запуска.
+
+Тяжелые зависимости (PyQt6, qasync, ядро и GUI) импортируются лениво,
+после проверки прав администратора: если приложению нужно перезапуститься
+с повышенными правами, текущий процесс завершается, не загружая Qt.
 """
+from __future__ import annotations
+
 import sys
 import os
+import atexit
 import ctypes
+from ctypes import wintypes
 import logging
 import asyncio
-from logging.handlers import RotatingFileHandler
+import queue
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Optional, TYPE_CHECKING
+
+MB_ICONERROR = 0x10
+MB_ICONWARNING = 0x30
+ERROR_ALREADY_EXISTS = 183
 
 # --- Аварийный MessageBox, не зависящий от PyQt ---
-def emergency_message_box(title: str, message: str):
+def emergency_message_box(title: str, message: str, icon: int = MB_ICONERROR):
     """Показывает системное окно с сообщением. Используется при сбоях до инициализации QApplication."""
-    ctypes.windll.user32.MessageBoxW(0, message, title, 0x10) # MB_ICONERROR
+    ctypes.windll.user32.MessageBoxW(0, message, title, icon)
 
-try:
-    from PyQt6.QtWidgets import QApplication, QMessageBox
-    from PyQt6.QtCore import QSharedMemory, QTimer
-    from PyQt6.QtGui import QIcon
-    from dotenv import load_dotenv
-    import qasync
-except ImportError as e:
+def _exit_on_missing_dependency(e: ImportError):
+    """Сообщает об отсутствующей зависимости и завершает процесс."""
     error_msg = f"КРИТИЧЕСКАЯ ОШИБКА: Не найдены основные зависимости: {e}\n\n" \
                 f"Пожалуйста, установите их командой 'pip install -r requirements.txt'."
     emergency_message_box("Ошибка зависимостей", error_msg)
     sys.exit(1)
 
-load_dotenv()
-
 from src.winspector import APP_NAME, ORG_NAME, APP_VERSION
-from src.winspector.core import WinSpectorCore
-from src.winspector.gui import MainWindow
+from src.winspector.utils.admin import check_admin_rights, relaunch_as_admin, set_app_user_model_id
+
+if TYPE_CHECKING:
+    import qasync
+    from PyQt6.QtWidgets import QApplication
+    from src.winspector.core import WinSpectorCore
+    from src.winspector.gui import MainWindow
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True, slots=True)
+class AppPaths:
+    """Пути приложения, вычисляемые лаунчером один раз при запуске."""
+    base: Path
+    logs: Path
+    assets: Path
+    kb_path: Path
+    # Имена файлов в assets, собранные лаунчером одним проходом os.scandir
+    asset_names: frozenset[str] = frozenset()
+
+    def asset(self, name: str) -> Optional[Path]:
+        """Возвращает путь к файлу из assets или None, если такого файла нет."""
+        return self.assets / name if name in self.asset_names else None
+
+
+def _build_core_config(app_paths: AppPaths) -> dict:
+    """Собирает конфигурацию ядра из заранее вычисленных путей приложения."""
+    return {
+        'kb_path': app_paths.kb_path,
+        'app_config': {'ai_ping_timeout': 10, 'ai_cache_ttl': 3600}
+    }
+
+
 class Application:
     """
     Класс, инкапсулирующий жизненный цикл приложения WinSpector Pro.
     """
-    def __init__(self, app_paths: Dict[str, Path]):
+    def __init__(self, app_paths: AppPaths):
         self.app_paths = app_paths
         self.q_app: Optional[QApplication] = None
-        self.shared_memory: Optional[QSharedMemory] = None
+        # Дескриптор именованного мьютекса single-instance. Держим его открытым
+        # до _shutdown; при аварийном завершении ОС закроет его сама.
+        self.instance_mutex: Optional[int] = None
         self.core_instance: Optional[WinSpectorCore] = None
         self.main_window: Optional[MainWindow] = None
         self.log_file_path: Optional[Path] = None
+        self.log_listener: Optional[QueueListener] = None
 
         self._setup_exception_hook()
 
     def initialize(self) -> bool:
         """Выполняет всю предварительную настройку приложения."""
+        self._load_environment()
         self._setup_logging()
 
-        if not self._check_admin_rights():
+        if not check_admin_rights():
             self._relaunch_as_admin()
             return False
 
-        self.q_app = QApplication(sys.argv)
-        
+        # Проверка выполняется до загрузки Qt: второй копии не нужно
+        # инициализировать QApplication только для того, чтобы завершиться.
         if not self._check_single_instance():
-            QMessageBox.warning(None, "Приложение уже запущено", f"{APP_NAME} уже работает.")
+            emergency_message_box("Приложение уже запущено", f"{APP_NAME} уже работает.", MB_ICONWARNING)
             return False
+
+        try:
+            from PyQt6.QtWidgets import QApplication
+            import qasync  # noqa: F401 - проверяем наличие до создания окна
+        except ImportError as e:
+            _exit_on_missing_dependency(e)
+
+        self.q_app = QApplication(sys.argv)
             
         self._apply_styles()
         self._set_app_icon()
@@ -87,31 +135,80 @@ class Application:
         with loop:
             exit_code = loop.run_forever()
         
+        self._stop_logging()
         return exit_code
 
+    @staticmethod
+    def _load_environment():
+        """Загружает переменные окружения из .env (в том числе LOG_LEVEL)."""
+        try:
+            from dotenv import load_dotenv
+        except ImportError as e:
+            _exit_on_missing_dependency(e)
+        load_dotenv()
+
     def _setup_logging(self):
-        log_dir = self.app_paths["logs"]
+        log_dir = self.app_paths.logs
         log_dir.mkdir(parents=True, exist_ok=True)
         self.log_file_path = log_dir / 'winspector.log'
         
+        # Режим отладки: WINSPECTOR_DEBUG=1 или запуск из исходников.
+        # В собранном приложении консоль не используется, и запись в нее
+        # была бы чистыми накладными расходами.
+        debug_requested = os.getenv("WINSPECTOR_DEBUG") == "1"
+        is_debug = debug_requested or not getattr(sys, 'frozen', False)
+
         # ### УЛУЧШЕНИЕ: Конфигурируемый уровень логирования ###
-        log_level_str = os.getenv("LOG_LEVEL", "INFO").upper()
+        log_level_str = os.getenv("LOG_LEVEL", "DEBUG" if debug_requested else "INFO").upper()
         log_level = getattr(logging, log_level_str, logging.INFO)
 
         file_handler = RotatingFileHandler(self.log_file_path, maxBytes=5*1024*1024, backupCount=3, encoding='utf-8')
-        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - [%(name)s:%(lineno)d] - %(message)s'))
-        
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(logging.Formatter('[%(levelname)s] %(message)s'))
+        if is_debug:
+            file_format = '%(asctime)s - %(levelname)s - [%(name)s:%(lineno)d] - %(message)s'
+        else:
+            # Атрибуты LogRecord, которые не использует ни один форматтер:
+            # в релизе не собираем их при каждом вызове логгера.
+            logging.logThreads = False
+            logging.logProcesses = False
+            logging.logMultiprocessing = False
+            logging.logAsyncioTasks = False  # Python 3.12+, в более ранних версиях игнорируется
+            file_format = '%(asctime)s - %(levelname)s - [%(name)s] - %(message)s'
+        file_handler.setFormatter(logging.Formatter(file_format))
+        handlers: list[logging.Handler] = [file_handler]
+
+        if is_debug:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(logging.Formatter('[%(levelname)s] %(message)s'))
+            handlers.append(console_handler)
         
+        # Запись в файл и консоль выполняется в фоновом потоке QueueListener,
+        # а потоки приложения лишь кладут записи в очередь.
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self.log_listener.start()
+        atexit.register(self._stop_logging)
+
         root_logger = logging.getLogger()
         root_logger.setLevel(log_level)
         if root_logger.hasHandlers():
             root_logger.handlers.clear()
-        root_logger.addHandler(file_handler)
-        root_logger.addHandler(console_handler)
+        root_logger.addHandler(QueueHandler(log_queue))
         logger.info(f"Система логирования для {APP_NAME} v{APP_VERSION} инициализирована. Уровень: {log_level_str}")
 
+    def _stop_logging(self):
+        """Дописывает оставшиеся в очереди записи и останавливает поток логирования."""
+        if self.log_listener:
+            self.log_listener.stop()
+            # Записи, появившиеся после остановки, пишем напрямую, а не
+            # в очередь, которую больше никто не читает.
+            root_logger = logging.getLogger()
+            for handler in list(root_logger.handlers):
+                if isinstance(handler, QueueHandler):
+                    root_logger.removeHandler(handler)
+            for handler in self.log_listener.handlers:
+                root_logger.addHandler(handler)
+            self.log_listener = None
+
     def _setup_exception_hook(self):
         self.original_hook = sys.excepthook
         sys.excepthook = self._handle_exception
@@ -120,6 +217,7 @@ class Application:
         logger.critical("Перехвачено необработанное исключение:", exc_info=(exc_type, exc, tb))
         
         if self.q_app and not self.q_app.property("is_shutting_down"):
+            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.critical(None, "Критическая ошибка", f"Произошла непредвиденная ошибка: {exc}\n\nПодробности в файле winspector.log.")
         else:
             emergency_message_box("Критическая ошибка", f"Произошла непредвиденная ошибка: {exc}\n\nПодробности записаны в лог-файл.")
@@ -128,61 +226,112 @@ class Application:
             self.q_app.quit()
 
     def _check_single_instance(self) -> bool:
-        """Проверяет, не запущена ли уже другая копия приложения."""
-        lock_key = f"{ORG_NAME}_{APP_NAME}_Instance_Lock"
-        self.shared_memory = QSharedMemory(lock_key)
-        if not self.shared_memory.create(1):
+        """
+        Проверяет, не запущена ли уже другая копия приложения.
+
+        Использует именованный мьютекс ядра Windows: в отличие от сегмента
+        QSharedMemory, он освобождается ОС автоматически, даже если процесс
+        был аварийно завершен.
+        """
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.CreateMutexW.argtypes = (wintypes.LPVOID, wintypes.BOOL, wintypes.LPCWSTR)
+        kernel32.CreateMutexW.restype = wintypes.HANDLE
+
+        # Local\ - пространство имен текущего сеанса: как и прежде, вторая
+        # копия блокируется только в пределах сеанса пользователя, а другие
+        # сеансы (быстрое переключение пользователей, RDP) запускаются независимо.
+        lock_name = f"Local\\{ORG_NAME}_{APP_NAME}_Instance_Lock"
+        handle = kernel32.CreateMutexW(None, False, lock_name)
+        if not handle:
+            # Не удалось создать мьютекс - не блокируем запуск из-за этого
+            logger.warning(f"Не удалось создать мьютекс single-instance (код {ctypes.get_last_error()}).")
+            return True
+
+        if ctypes.get_last_error() == ERROR_ALREADY_EXISTS:
+            kernel32.CloseHandle(handle)
             logger.warning("Попытка запуска второй копии приложения. Выход.")
             return False
-        
-        # Освобождаем память при выходе, чтобы "замок" снялся
-        self.q_app.aboutToQuit.connect(self.shared_memory.detach)
+
+        self.instance_mutex = handle
         return True
 
+    def _release_single_instance(self):
+        """
+        Закрывает дескриптор мьютекса single-instance. Мьютекс создается без
+        владельца, поэтому ReleaseMutex не нужен - достаточно CloseHandle.
+        """
+        if self.instance_mutex:
+            kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+            kernel32.CloseHandle(wintypes.HANDLE(self.instance_mutex))
+            self.instance_mutex = None
+
     def _apply_styles(self):
-        qss_path = self.app_paths.get("base") / "winspector" / "resources" / "styles" / "main.qss"
-        if qss_path.exists():
-            try:
-                with open(qss_path, "r", encoding="utf-8") as f:
-                    self.q_app.setStyleSheet(f.read())
-                logger.info("Таблица стилей успешно загружена и применена.")
-            except Exception as e:
-                logger.error(f"Не удалось загрузить таблицу стилей: {e}")
-        else:
-            logger.warning(f"Файл стилей не найден: {qss_path}")
+        """
+        Применяет таблицу стилей, встроенную в скомпилированные ресурсы Qt.
+        Данные уже находятся в памяти процесса, поэтому обращения к диску нет.
+        """
+        from PyQt6.QtCore import QFile, QIODevice
+        from src.winspector.resources import assets_rc  # noqa: F401 - регистрирует ресурсы
+
+        qss_resource = ":/styles/main.qss"
+        qss_file = QFile(qss_resource)
+        if not qss_file.open(QIODevice.OpenModeFlag.ReadOnly):
+            logger.warning(f"Таблица стилей не найдена в ресурсах: {qss_resource}")
+            return
+        try:
+            self.q_app.setStyleSheet(bytes(qss_file.readAll()).decode("utf-8"))
+            logger.info("Таблица стилей успешно загружена и применена.")
+        except UnicodeDecodeError as e:
+            logger.error(f"Не удалось загрузить таблицу стилей: {e}")
+        finally:
+            qss_file.close()
 
     def _set_app_icon(self):
-        icon_path = self.app_paths.get("assets") / "app.ico"
-        if icon_path.exists():
-            self.q_app.setWindowIcon(QIcon(str(icon_path)))
-        else:
-            logger.warning(f"Файл иконки не найден по пути: {icon_path}")
+        """
+        Устанавливает иконку приложения из ресурсов Qt (assets_rc уже
+        зарегистрирован в _apply_styles), без чтения и разбора .ico с диска.
+        Если в ресурсах иконки нет (устаревший assets_rc.py), она загружается
+        из папки assets. Окна без собственной иконки наследуют её от QApplication.
+        """
+        from PyQt6.QtGui import QIcon
+
+        app_icon = QIcon(":/app.ico")
+        if app_icon.isNull():
+            icon_path = self.app_paths.asset("app.ico")
+            if icon_path is None:
+                logger.warning(f"Иконка не найдена ни в ресурсах Qt, ни в {self.app_paths.assets}")
+                return
+            logger.warning(f"Иконка :/app.ico не найдена в ресурсах Qt, используется файл {icon_path}")
+            app_icon = QIcon(str(icon_path))
+        self.q_app.setWindowIcon(app_icon)
 
     def _set_app_user_model_id(self):
         """Устанавливает AppUserModelID для корректного отображения иконки в панели задач."""
-        try:
-            myappid = f'{ORG_NAME}.{APP_NAME}.{APP_VERSION}'
-            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
+        myappid = f'{ORG_NAME}.{APP_NAME}.{APP_VERSION}'
+        if set_app_user_model_id(myappid):
             logger.info(f"Установлен AppUserModelID: {myappid}")
-        except (AttributeError, TypeError) as e:
-            logger.warning(f"Не удалось установить AppUserModelID: {e}")
 
     def _initialize_core(self):
+        from src.winspector.core import WinSpectorCore
+
         logger.info("Инициализация ядра WinSpectorCore...")
-        core_config = {
-            'kb_path': self.app_paths.get('kb_path'),
-            'app_config': {'ai_ping_timeout': 10, 'ai_cache_ttl': 3600}
-        }
-        self.core_instance = WinSpectorCore(config=core_config)
+        self.core_instance = WinSpectorCore(config=_build_core_config(self.app_paths))
 
     def _initialize_gui(self):
+        from src.winspector.gui import MainWindow
+
         logger.info("Создание главного окна MainWindow...")
         self.main_window = MainWindow(core_instance=self.core_instance, app_paths=self.app_paths)
 
     def _setup_async_loop(self) -> qasync.QEventLoop:
-        if sys.platform == "win32":
+        import qasync
+
+        # Политика по умолчанию в Windows - Proactor: только она поддерживает
+        # асинхронные подпроцессы. Selector оставлен как запасной вариант
+        # на случай проблем с конкретной версией qasync.
+        if sys.platform == "win32" and os.getenv("WINSPECTOR_SELECTOR_LOOP") == "1":
             asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-        
+
         loop = qasync.QEventLoop(self.q_app)
         asyncio.set_event_loop(loop)
         self.q_app.aboutToQuit.connect(lambda: loop.create_task(self._shutdown()))
@@ -192,27 +341,30 @@ class Application:
         logger.info("Начало процедуры завершения работы...")
         if self.core_instance:
             await self.core_instance.shutdown()
+        # Новая копия приложения может запускаться, пока эта дописывает логи
+        self._release_single_instance()
         logger.info("Завершение работы.")
+        # Дописываем очередь логов, пока цикл событий еще работает
+        self._stop_logging()
+        from PyQt6.QtCore import QTimer
         QTimer.singleShot(50, self.q_app.quit)
 
-    @staticmethod
-    def _check_admin_rights() -> bool:
-        try:
-            return ctypes.windll.shell32.IsUserAnAdmin() != 0
-        except (AttributeError, OSError):
-            return False
-
     def _relaunch_as_admin(self):
-        logger.info("Отправлен запрос на перезапуск с правами администратора.")
-        try:
-            # ### УЛУЧШЕНИЕ: Передаем путь к лог-файлу новому процессу ###
-            params = f'"{sys.argv[0]}" --log-file "{self.log_file_path}"' if self.log_file_path else " ".join(sys.argv)
-            ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, params, None, 1)
-        except Exception as e:
-            logger.error(f"Не удалось перезапустить с правами администратора: {e}")
+        """
+        Перезапускает приложение с правами администратора.
+        Выполняется до загрузки Qt, поэтому ошибки показываются через MessageBoxW.
+        """
+        # ### УЛУЧШЕНИЕ: Передаем путь к лог-файлу новому процессу ###
+        extra_args = ["--log-file", str(self.log_file_path)] if self.log_file_path else []
+        if not relaunch_as_admin(extra_args):
+            emergency_message_box(
+                "Требуются права администратора",
+                f"{APP_NAME} требует прав администратора для работы.\n\n"
+                "Запустите приложение от имени администратора."
+            )
 
 # --- Точка входа ---
-def main(app_paths: Dict[str, Path]) -> int:
+def main(app_paths: AppPaths) -> int:
     """
     Создает и запускает экземпляр приложения.
     """
@@ -9,13 +9,24 @@
 импорты из других частей приложения более чистыми и удобными.
 """
 
-# Импортируем основной класс-оркестратор из его модуля
-from .analyzer import WinSpectorCore
-
 # Явно определяем, что является публичным API этого пакета.
 # Теперь, вместо `from src.winspector.core.analyzer import WinSpectorCore`,
 # можно будет использовать более короткий и чистый импорт:
 # `from src.winspector.core import WinSpectorCore`.
 __all__ = [
     "WinSpectorCore",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """
+    Ленивый импорт основного класса ядра (PEP 562).
+
+    Модуль analyzer тянет за собой все анализаторы, SDK Gemini и yaml,
+    поэтому он загружается только при первом обращении к WinSpectorCore,
+    а не при импорте любого модуля из пакета core (например, config).
+    """
+    if name == "WinSpectorCore":
+        from .analyzer import WinSpectorCore
+        return WinSpectorCore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,11 +5,17 @@
 Финальная версия с оптимизированным потоком выполнения.
 """
 import asyncio
+import json
 import logging
-import yaml
+import os
+import pickle
+import time
+from types import MappingProxyType
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Dict, Any, List, TypedDict, Optional
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Any, FrozenSet, Generic, List, Mapping, TypeVar, Optional
 
 from .modules import (
     AIAnalyzer,
@@ -19,75 +25,257 @@ from .modules import (
     WindowsOptimizer,
 )
 
+# orjson - необязательное ускорение разбора JSON базы знаний в собранном
+# приложении. orjson.JSONDecodeError наследует json.JSONDecodeError
+# (а значит, и ValueError), поэтому обработка ошибок не меняется.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
-class OptimizationSessionData(TypedDict, total=False):
-    """Контейнер для данных, собираемых и генерируемых в ходе сессии."""
-    system_profile: Dict[str, Any]
-    user_profile: List[str]
-    system_components: Dict[str, List[Dict]]
-    junk_files_report: Dict[str, Any]
-    comprehensive_data: Dict[str, Any]
-    ai_plan: Dict[str, Any]
-    debloat_summary: Dict[str, Any]
-    standard_cleanup_summary: Dict[str, Any]
-    ai_cleanup_summary: Dict[str, Any]
-    empty_folders_summary: Dict[str, Any]
-    final_summary: Dict[str, Any]
-    final_report: str
+
+def _parse_yaml(source: Any) -> Any:
+    """
+    Разбирает YAML-документ. PyYAML импортируется только здесь: в собранном
+    приложении база знаний хранится в JSON, и yaml не загружается вовсе.
+    Ошибки разбора приводятся к ValueError, как и у json.
+    """
+    import yaml
+    # CSafeLoader (libyaml) в разы быстрее чистого Python; его может не быть,
+    # если PyYAML собран без libyaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        return yaml.load(source, Loader=loader)
+    except yaml.YAMLError as e:
+        raise ValueError(str(e)) from e
+
+
+def _parse_yaml_file(yaml_file: Path) -> Any:
+    """Разбирает YAML-файл, передавая libyaml байты без декодирования в Python."""
+    with open(yaml_file, 'rb') as f:
+        return _parse_yaml(f)
+
+
+_KB_CACHE_NAME = "knowledge_base.pkl"
+
+def _read_kb_cache(cache_file: Path, signature: Any) -> Optional[Dict[str, Any]]:
+    """
+    Возвращает базу знаний из pickle-кэша, если его сигнатура совпадает
+    с текущим состоянием YAML-файлов, иначе None.
+    """
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_signature, data = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        return None  # Кэша нет или он поврежден - просто разбираем YAML заново
+    return data if cached_signature == signature else None
+
+def _write_kb_cache(cache_file: Path, signature: Any, data: Dict[str, Any]) -> None:
+    """
+    Атомарно сохраняет базу знаний в pickle-кэш: запись идет во временный
+    файл, который затем подменяет кэш через os.replace. Поэтому параллельно
+    запущенный процесс никогда не прочитает наполовину записанный файл.
+    """
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            pickle.dump((signature, data), f, protocol=5)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug(f"Не удалось сохранить кэш базы знаний: {e}")
+        tmp_file.unlink(missing_ok=True)
+
+
+_T = TypeVar("_T")
+
+class _AsyncTTLValue(Generic[_T]):
+    """
+    Кэширует результат асинхронного вычисления на заданное число секунд.
+    Время отсчитывается по монотонным часам, а одновременные запросы
+    при пустом кэше объединяются под asyncio.Lock в одно вычисление.
+    """
+    def __init__(self, ttl_seconds: float):
+        self._ttl = ttl_seconds
+        self._value: Optional[_T] = None
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_fresh(self) -> bool:
+        return self._value is not None and time.monotonic() < self._expires_at
+
+    async def get_or_compute(self, factory: Callable[[], Awaitable[_T]]) -> _T:
+        if self.is_fresh:
+            return self._value
+        async with self._lock:
+            # Пока ждали блокировку, значение мог вычислить другой запрос
+            if self.is_fresh:
+                return self._value
+            value = await factory()
+            self._value = value
+            self._expires_at = time.monotonic() + self._ttl
+            return value
+
+
+@dataclass(slots=True)
+class OptimizationSessionData:
+    """
+    Контейнер для данных, собираемых и генерируемых в ходе сессии.
+    Поля заполняются по мере выполнения этапов; до этого они равны None.
+    """
+    system_profile: Optional[Dict[str, Any]] = None
+    user_profile: Optional[List[str]] = None
+    system_components: Optional[Dict[str, List[Dict]]] = None
+    junk_files_report: Optional[Dict[str, Any]] = None
+    comprehensive_data: Optional[Dict[str, Any]] = None
+    ai_plan: Optional[Dict[str, Any]] = None
+    debloat_summary: Optional[Dict[str, Any]] = None
+    standard_cleanup_summary: Optional[Dict[str, Any]] = None
+    ai_cleanup_summary: Optional[Dict[str, Any]] = None
+    empty_folders_summary: Optional[Dict[str, Any]] = None
+    final_summary: Optional[Dict[str, Any]] = None
+    final_report: Optional[str] = None
 
 
 class WinSpectorCore:
     """
     Центральное ядро, управляющее всеми модулями анализа и оптимизации.
     """
+    # Время жизни кэша компонентов системы (службы, UWP-приложения)
+    CACHE_TTL_SECONDS = 300
+
     def __init__(self, config: Dict[str, Any]):
         logger.info("Инициализация ядра WinSpectorCore (Advanced)...")
         self.config = config
-        self._last_scan_time: Optional[datetime] = None
-        self._cached_system_components: Optional[Dict[str, Any]] = None
-        self.CACHE_TTL_MINUTES = 5
+        self._components_cache: _AsyncTTLValue[Dict[str, Any]] = _AsyncTTLValue(self.CACHE_TTL_SECONDS)
+        # json.JSONDecodeError и ошибки YAML (см. _parse_yaml) - подклассы ValueError
         try:
             self.knowledge_base = self._load_knowledge_base()
             logger.info("База знаний успешно загружена и объединена.")
-        except (FileNotFoundError, yaml.YAMLError) as e:
+        except (FileNotFoundError, zipfile.BadZipFile, ValueError) as e:
             logger.critical(f"Критическая ошибка: не удалось загрузить базу знаний. {e}", exc_info=True)
             raise RuntimeError(f"Не удалось загрузить или прочитать файлы базы знаний: {e}") from e
-        self.user_profiler = UserProfiler()
-        self.windows_optimizer = WindowsOptimizer(optimization_rules=self.knowledge_base.get('optimization_rules', []))
-        self.smart_cleaner = SmartCleaner(cleanup_rules=self.knowledge_base.get('cleanup_rules', []))
+        # Секции базы знаний, к которым ядро обращается на каждом прогоне,
+        # извлекаются из словаря один раз
+        self._optimization_rules: List[Dict[str, Any]] = self.knowledge_base.get('optimization_rules', [])
+        self._cleanup_rules: List[Dict[str, Any]] = self.knowledge_base.get('cleanup_rules', [])
+        self._telemetry_domains: List[str] = self.knowledge_base.get('telemetry_domains', [])
+        self._user_profiler_config: Dict[str, Any] = self.knowledge_base.get('user_profiler_config', {})
+        self._universal_rule_indices, self._rule_indices_by_profile = self._build_profile_index(self._optimization_rules)
+        self._filtered_kb_cache: Dict[FrozenSet[str], Mapping[str, Any]] = {}
+        # Общий пул процессов для WMI-воркеров (COM-объекты WMI изолируются
+        # в отдельных процессах). Процессы запускаются по требованию и
+        # переиспользуются, а не создаются заново при каждом сканировании.
+        # Два воркера позволяют профилированию и сбору служб идти параллельно.
+        self._wmi_process_pool = ProcessPoolExecutor(max_workers=2)
+        # Отдельный пул для долгих блокирующих вызовов Windows API (создание
+        # точки восстановления длится секунды), чтобы они не занимали потоки
+        # пула по умолчанию, которым пользуются asyncio.to_thread модулей.
+        self._blocking_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="winspector-blocking")
+        self.user_profiler = UserProfiler(process_pool=self._wmi_process_pool)
+        self.windows_optimizer = WindowsOptimizer(
+            optimization_rules=self._optimization_rules,
+            process_pool=self._wmi_process_pool,
+        )
+        self.smart_cleaner = SmartCleaner(cleanup_rules=self._cleanup_rules)
         self.ai_analyzer = AIAnalyzer(config)
         self.ai_communicator = AICommunicator(config)
         self.background_tasks = set()
         logger.info("Все модули ядра успешно инициализированы.")
 
     def _load_knowledge_base(self) -> Dict[str, Any]:
-        kb_dir_path = self.config.get('kb_path')
-        if not kb_dir_path or not kb_dir_path.is_dir():
-            raise FileNotFoundError(f"Директория базы знаний не найдена по пути: {kb_dir_path}")
-        combined_kb: Dict[str, Any] = {}
-        for yaml_file in kb_dir_path.glob("*.yaml"):
-            key_name = yaml_file.stem
-            with open(yaml_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                if not isinstance(data, (dict, list)):
-                    raise yaml.YAMLError(f"Файл {yaml_file.name} должен содержать список или словарь.")
-                combined_kb[key_name] = data
+        """
+        Загружает базу знаний из директории с .yaml файлами (режим разработки)
+        или из ZIP-архива, который поставляется в собранном приложении.
+        """
+        kb_path = self.config.get('kb_path')
+        if not kb_path:
+            raise FileNotFoundError("Путь к базе знаний не задан.")
+        # Без предварительных is_file()/is_dir(): отсутствие пути проявится
+        # как исключение при открытии архива или чтении директории.
+        if kb_path.suffix == '.zip':
+            combined_kb = self._load_knowledge_base_from_zip(kb_path)
+        else:
+            combined_kb = self._load_knowledge_base_from_dir(kb_path)
         if not combined_kb:
-            raise FileNotFoundError(f"В директории {kb_dir_path} не найдено ни одного .yaml файла.")
+            raise FileNotFoundError(f"В {kb_path} не найдено ни одного файла базы знаний.")
         return combined_kb
 
+    def _load_knowledge_base_from_dir(self, kb_dir: Path) -> Dict[str, Any]:
+        """
+        Читает .yaml секции из директории за один проход os.scandir.
+        В Windows DirEntry.stat() берется из результатов обхода каталога,
+        поэтому проверка кэша не требует отдельного обращения к диску.
+
+        Разобранная база целиком кэшируется в __pycache__ рядом с YAML.
+        Сигнатура кэша - имена, mtime и размеры всех файлов, так что
+        добавление, удаление или правка любой секции его инвалидирует.
+        """
+        try:
+            with os.scandir(kb_dir) as entries:
+                yaml_entries = sorted(
+                    (entry.name, Path(entry.path), entry.stat())
+                    for entry in entries
+                    if entry.name.endswith('.yaml') and entry.is_file()
+                )
+        except (FileNotFoundError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"База знаний не найдена по пути: {kb_dir}") from e
+
+        signature = tuple((name, stat.st_mtime_ns, stat.st_size) for name, _, stat in yaml_entries)
+        cache_file = kb_dir / "__pycache__" / _KB_CACHE_NAME
+        cached_kb = _read_kb_cache(cache_file, signature)
+        if cached_kb is not None:
+            logger.info("База знаний загружена из кэша.")
+            return cached_kb
+
+        combined_kb = {
+            name[:-len('.yaml')]: self._validate_kb_section(name, _parse_yaml_file(path))
+            for name, path, _ in yaml_entries
+        }
+        if combined_kb:
+            _write_kb_cache(cache_file, signature, combined_kb)
+        return combined_kb
+
+    def _load_knowledge_base_from_zip(self, archive_path: Path) -> Dict[str, Any]:
+        """
+        Читает все секции из архива базы знаний за одно открытие.
+        При сборке YAML заранее конвертируется в JSON, но .yaml файлы
+        в архиве тоже поддерживаются.
+        """
+        combined_kb: Dict[str, Any] = {}
+        with zipfile.ZipFile(archive_path) as archive:
+            for name in archive.namelist():
+                member = Path(name)
+                if member.suffix == '.json':
+                    data = _json_loads(archive.read(name))
+                elif member.suffix == '.yaml':
+                    data = _parse_yaml(archive.read(name))
+                else:
+                    continue
+                combined_kb[member.stem] = self._validate_kb_section(member.name, data)
+        return combined_kb
+
+    @staticmethod
+    def _validate_kb_section(file_name: str, data: Any) -> Any:
+        if not isinstance(data, (dict, list)):
+            raise ValueError(f"Файл {file_name} должен содержать список или словарь.")
+        return data
+
     async def _run_ai_self_reflection(self, session_data: OptimizationSessionData) -> None:
         logger.info("Запуск фоновой задачи саморефлексии ИИ...")
         reflection_args = {
-            "user_profile": session_data.get("user_profile"),
-            "system_data": session_data.get("comprehensive_data"),
-            "plan": session_data.get("ai_plan"),
-            "summary": session_data.get("final_summary")
+            "user_profile": session_data.user_profile,
+            "system_data": session_data.comprehensive_data,
+            "plan": session_data.ai_plan,
+            "summary": session_data.final_summary
         }
         try:
             suggestions = await self.ai_communicator.get_ai_suggestions_for_improvement(**reflection_args)
-            logger.info(f"\n--- ПРЕДЛОЖЕНИЯ ОТ ИИ ДЛЯ РАЗРАБОТЧИКОВ ---\n{suggestions}\n-----------------------------------------")
+            # Ленивое форматирование: строки собираются, только если INFO включен
+            logger.info("\n--- ПРЕДЛОЖЕНИЯ ОТ ИИ ДЛЯ РАЗРАБОТЧИКОВ ---\n%s\n-----------------------------------------", suggestions)
         except Exception as e:
             logger.warning(f"Не удалось получить предложения по улучшению от ИИ: {e}", exc_info=True)
 
@@ -98,11 +286,31 @@ class WinSpectorCore:
     ) -> str:
         logger.info("--- НАЧАЛО СЦЕНАРИЯ АВТОНОМНОЙ ОПТИМИЗАЦИИ ---")
         session = OptimizationSessionData()
+        # Этапы ниже частично выполняются параллельно, поэтому прогресс
+        # не должен откатываться назад из-за порядка завершения задач.
+        coalesced_progress = _CoalescedProgress(progress_callback)
+        progress_callback = _monotonic_progress(coalesced_progress)
         try:
-            await self._step_create_restore_point(progress_callback);       _check_cancellation(is_cancelled)
-            await self._step_profile_user(session, progress_callback);          _check_cancellation(is_cancelled)
-            await self._step_collect_data_for_ai(session, progress_callback);   _check_cancellation(is_cancelled)
-            await self._step_generate_ai_plan(session, progress_callback);      _check_cancellation(is_cancelled)
+            # Точка восстановления, профилирование и сбор данных независимы
+            # и только читают состояние системы, поэтому идут одновременно.
+            # Изменения в системе начинаются лишь после того, как все три
+            # этапа успешно завершились.
+            await _gather_or_cancel(
+                self._step_create_restore_point(progress_callback),
+                self._step_profile_user(session, progress_callback),
+                self._step_collect_data_for_ai(session, progress_callback),
+            )
+            # Стандартная очистка не зависит от плана ИИ, поэтому выполняется,
+            # пока ИИ генерирует план (время ожидания сети не простаивает).
+            # Она удаляет файлы, поэтому отмена проверяется непосредственно
+            # перед ее запуском, а сама очистка проверяет ее перед каждым
+            # удалением: отмена во время генерации плана останавливает и ее.
+            _check_cancellation(is_cancelled)
+            await _gather_or_cancel(
+                self._step_standard_cleanup(session, progress_callback, is_cancelled),
+                self._step_generate_ai_plan(session, progress_callback),
+            )
+            _check_cancellation(is_cancelled)
             
             progress_callback(70, "Применение оптимизаций и очистка системы...")
             cleanup_task = self._step_execute_full_cleanup(session)
@@ -117,18 +325,21 @@ class WinSpectorCore:
             task.add_done_callback(self.background_tasks.discard)
 
             logger.info("--- СЦЕНАРИЙ АВТОНОМНОЙ ОПТИМИЗАЦИИ УСПЕШНО ЗАВЕРШЕН ---")
-            return session.get("final_report", "Оптимизация завершена. Отчет не был создан.")
+            return session.final_report or "Оптимизация завершена. Отчет не был создан."
         except asyncio.CancelledError:
             logger.info("Сценарий оптимизации отменен пользователем.")
             return "Отменено пользователем."
         except Exception as e:
             logger.critical(f"Критическая ошибка в сценарии оптимизации: {e}", exc_info=True)
             raise
+        finally:
+            coalesced_progress.close()
 
     async def _step_create_restore_point(self, progress_callback: Callable[[int, str], None]):
         progress_callback(5, "Создание точки восстановления...")
         try:
-            await asyncio.to_thread(self.windows_optimizer.create_restore_point)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._blocking_executor, self.windows_optimizer.create_restore_point)
             logger.info("Точка восстановления успешно создана.")
             progress_callback(10, "Точка восстановления создана.")
         except Exception as e:
@@ -137,124 +348,232 @@ class WinSpectorCore:
 
     async def _step_profile_user(self, session: OptimizationSessionData, progress_callback: Callable[[int, str], None]):
         progress_callback(15, "Анализ вашего стиля работы...")
-        session['system_profile'] = await self.user_profiler.get_system_profile()
+        session.system_profile = await self.user_profiler.get_system_profile()
         
-        user_profiler_config = self.knowledge_base.get('user_profiler_config', {})
-        session['user_profile'] = await self.ai_communicator.determine_user_profile(
-            session['system_profile'], user_profiler_config
+        session.user_profile = await self.ai_communicator.determine_user_profile(
+            session.system_profile, self._user_profiler_config
         )
-        profiles_str = ", ".join(session['user_profile'])
+        profiles_str = ", ".join(session.user_profile)
         logger.info(f"ИИ определил профили пользователя: {profiles_str}")
         progress_callback(25, f"Обнаружены профили: {profiles_str}.")
 
-    async def _step_standard_cleanup(self, session: OptimizationSessionData, progress_callback: Callable[[int, str], None]):
-        progress_callback(30, "Выполнение стандартной очистки...")
-        session['standard_cleanup_summary'] = await self.smart_cleaner.perform_standard_cleanup()
+    async def _step_standard_cleanup(
+        self, session: OptimizationSessionData, progress_callback: Callable[[int, str], None],
+        is_cancelled: Callable[[], bool]
+    ):
+        progress_callback(50, "Выполнение стандартной очистки...")
+        session.standard_cleanup_summary = await self.smart_cleaner.perform_standard_cleanup(is_cancelled)
         logger.info("Стандартная очистка завершена.")
 
     async def _step_collect_data_for_ai(self, session: OptimizationSessionData, progress_callback: Callable[[int, str], None]):
         progress_callback(40, "Сбор данных для ИИ-анализа...")
-        if self._cached_system_components and self._last_scan_time and \
-           (datetime.now() - self._last_scan_time) < timedelta(minutes=self.CACHE_TTL_MINUTES):
+        if self._components_cache.is_fresh:
             logger.info("Использование кэшированных данных о компонентах системы.")
-            components_task = asyncio.create_task(asyncio.sleep(0, result=self._cached_system_components))
         else:
             logger.info("Кэш устарел или отсутствует. Запуск полного сканирования компонентов.")
-            components_task = self.windows_optimizer.get_system_components()
-            self._last_scan_time = datetime.now()
+        components_task = self._components_cache.get_or_compute(self.windows_optimizer.get_system_components)
         junk_files_task = self.smart_cleaner.find_junk_files_deep()
         components, junk_files = await asyncio.gather(components_task, junk_files_task)
-        self._cached_system_components = components
-        session['system_components'] = components
-        session['junk_files_report'] = junk_files
-        logger.info(f"Сбор данных для ИИ завершен.")
+        session.system_components = components
+        session.junk_files_report = junk_files
+        logger.info(
+            "Сбор данных для ИИ завершен. Служб: %d, UWP-приложений: %d, категорий мусора: %d.",
+            len(components.get('services', ())), len(components.get('uwp_apps', ())), len(junk_files),
+        )
 
     async def _step_execute_full_cleanup(self, session: OptimizationSessionData):
-        logger.info("Начало комплексной очистки системы...")
-        standard_cleanup_task = self.smart_cleaner.perform_standard_cleanup()
-        ai_cleanup_task = self.smart_cleaner.perform_deep_cleanup(session.get('ai_plan', {}).get("cleanup_plan", {}))
-        std_summary, ai_summary = await asyncio.gather(standard_cleanup_task, ai_cleanup_task)
-        session['standard_cleanup_summary'] = std_summary
-        session['ai_cleanup_summary'] = ai_summary
-        logger.info("Стандартная и интеллектуальная очистка завершены.")
+        # Стандартная очистка к этому моменту уже выполнена параллельно
+        # с генерацией плана (см. _step_standard_cleanup)
+        logger.info("Начало интеллектуальной очистки системы...")
+        ai_plan = session.ai_plan or {}
+        session.ai_cleanup_summary = await self.smart_cleaner.perform_deep_cleanup(ai_plan.get("cleanup_plan", {}))
+        logger.info("Интеллектуальная очистка завершена.")
+        # Пустые папки удаляются после интеллектуальной очистки, а не
+        # параллельно с ней: именно она оставляет большую часть пустых папок.
+        # С выполнением плана оптимизации этот этап и так идет одновременно.
         logger.info("Запуск очистки пустых директорий...")
-        session['empty_folders_summary'] = await self.smart_cleaner.cleanup_all_empty_folders_async()
-        logger.info(f"Удалено {session['empty_folders_summary']['deleted_folders_count']} пустых папок.")
+        session.empty_folders_summary = await self.smart_cleaner.cleanup_all_empty_folders_async()
+        logger.info("Удалено %d пустых папок.", session.empty_folders_summary['deleted_folders_count'])
 
     async def _step_execute_action_plan(self, session: OptimizationSessionData, progress_callback: Callable[[int, str], None]):
         logger.info("Применение оптимизаций системы...")
-        action_plan = session.get('ai_plan', {}).get("action_plan", [])
+        ai_plan = session.ai_plan or {}
+        action_plan = ai_plan.get("action_plan", [])
         if not action_plan:
             logger.info("Действий по оптимизации компонентов не требуется.")
-            session['debloat_summary'] = {"completed": [], "failed": []}
+            session.debloat_summary = {"completed": [], "failed": []}
             return
-        session['debloat_summary'] = await self.windows_optimizer.execute_action_plan(action_plan, progress_callback)
+        session.debloat_summary = await self.windows_optimizer.execute_action_plan(action_plan, progress_callback)
         logger.info("План оптимизации компонентов выполнен.")
 
     async def _step_generate_ai_plan(self, session: OptimizationSessionData, progress_callback: Callable[[int, str], None]):
         progress_callback(55, "ИИ создает персональный план оптимизации...")
-        session['comprehensive_data'] = {
-            "system_components": session['system_components'],
-            "junk_files_report": session['junk_files_report']
+        session.comprehensive_data = {
+            "system_components": session.system_components,
+            "junk_files_report": session.junk_files_report
         }
         
-        user_profile = session['user_profile']
+        user_profile = session.user_profile
         relevant_kb = self._filter_kb_for_profile(user_profile)
         
-        session['ai_plan'] = await self.ai_analyzer.generate_distillation_plan(
-            session['comprehensive_data'], user_profile, relevant_kb
+        session.ai_plan = await self.ai_analyzer.generate_distillation_plan(
+            session.comprehensive_data, user_profile, relevant_kb
         )
         logger.info("План от ИИ успешно сгенерирован и валидирован.")
 
-    def _filter_kb_for_profile(self, profiles: List[str]) -> Dict[str, Any]:
-        """Фильтрует полную базу знаний, оставляя только релевантные для профиля правила."""
+    @staticmethod
+    def _build_profile_index(rules: List[Dict[str, Any]]) -> tuple[List[int], Dict[str, List[int]]]:
+        """
+        Строит индекс правил оптимизации по профилям за один проход.
+
+        Returns:
+            Индексы универсальных правил (без relevant_profiles) и словарь
+            "профиль -> индексы правил", в которых он упомянут.
+        """
+        universal: List[int] = []
+        by_profile: Dict[str, List[int]] = {}
+        for index, rule in enumerate(rules):
+            relevant_profiles = rule.get('relevant_profiles')
+            if not relevant_profiles:
+                universal.append(index)
+                continue
+            for profile in relevant_profiles:
+                by_profile.setdefault(profile, []).append(index)
+        return universal, by_profile
+
+    def _filter_kb_for_profile(self, profiles: List[str]) -> Mapping[str, Any]:
+        """
+        Фильтрует полную базу знаний, оставляя только релевантные для профиля правила.
+
+        Результат неизменяем (MappingProxyType и кортежи) и кэшируется по набору
+        профилей: для одинаковых профилей возвращается тот же объект, поэтому
+        потребители могут не копировать его и использовать как ключ кэша.
+        """
+        cache_key = frozenset(profiles)
+        cached = self._filtered_kb_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         filtered_kb = {}
         
-        opt_rules = self.knowledge_base.get('optimization_rules', [])
+        # Правило подходит, если оно универсальное или если ХОТЯ БЫ ОДИН из
+        # профилей пользователя есть в его списке. Индексы берутся из заранее
+        # построенного индекса, сортировка сохраняет исходный порядок правил.
+        selected = set(self._universal_rule_indices)
+        for profile in profiles:
+            selected.update(self._rule_indices_by_profile.get(profile, ()))
+        filtered_kb['optimization_rules'] = tuple(self._optimization_rules[i] for i in sorted(selected))
         
-        # ### ИЗМЕНЕНИЕ: Логика фильтрации для нескольких профилей ###
-        filtered_kb['optimization_rules'] = [
-            rule for rule in opt_rules
-            # Правило подходит, если у него нет списка профилей (универсальное)
-            if not rule.get('relevant_profiles') or
-            # или если ХОТЯ БЫ ОДИН из профилей пользователя есть в списке правила
-            any(p in rule.get('relevant_profiles', []) for p in profiles)
-        ]
+        filtered_kb['cleanup_rules'] = tuple(self._cleanup_rules)
+        filtered_kb['telemetry_domains'] = tuple(self._telemetry_domains)
         
-        filtered_kb['cleanup_rules'] = self.knowledge_base.get('cleanup_rules', [])
-        filtered_kb['telemetry_domains'] = self.knowledge_base.get('telemetry_domains', [])
+        logger.debug("База знаний отфильтрована для профилей %s. Осталось %d правил оптимизации.",
+                     profiles, len(filtered_kb['optimization_rules']))
+        frozen_kb = MappingProxyType(filtered_kb)
+        self._filtered_kb_cache[cache_key] = frozen_kb
+        return frozen_kb
         
-        logger.debug(f"База знаний отфильтрована для профилей {profiles}. "
-                     f"Осталось {len(filtered_kb['optimization_rules'])} правил оптимизации.")
-        return filtered_kb
-        
-    async def _step_cleanup_empty_folders(self, session: OptimizationSessionData, progress_callback: Callable[[int, str], None]):
-        progress_callback(90, "Поиск и удаление пустых папок...")
-        session['empty_folders_summary'] = await self.smart_cleaner.cleanup_all_empty_folders_async()
-        logger.info(f"Удалено {session['empty_folders_summary']['deleted_folders_count']} пустых папок.")
-
     async def _step_generate_final_report(self, session: OptimizationSessionData, progress_callback: Callable[[int, str], None]):
         progress_callback(95, "Формирование отчета...")
-        total_cleaned_bytes = (session.get('standard_cleanup_summary', {}).get('cleaned_size_bytes', 0) + 
-                               session.get('ai_cleanup_summary', {}).get('cleaned_size_bytes', 0))
-        session['final_summary'] = {
-            "debloat": session.get('debloat_summary', {}),
+        standard_summary = session.standard_cleanup_summary or {}
+        ai_summary = session.ai_cleanup_summary or {}
+        ai_plan = session.ai_plan or {}
+        total_cleaned_bytes = (standard_summary.get('cleaned_size_bytes', 0) +
+                               ai_summary.get('cleaned_size_bytes', 0))
+        final_summary = {
+            "debloat": session.debloat_summary or {},
             "cleanup": {"cleaned_size_bytes": total_cleaned_bytes},
-            "empty_folders": session.get('empty_folders_summary', {})
+            "empty_folders": session.empty_folders_summary or {}
         }
-        action_plan = session.get('ai_plan', {}).get("action_plan", [])
-        session['final_report'] = await self.ai_communicator.generate_final_report(
-            session['final_summary'], action_plan, session['user_profile']
+        session.final_summary = final_summary
+        session.final_report = await self.ai_communicator.generate_final_report(
+            final_summary, ai_plan.get("action_plan", []), session.user_profile
         )
         progress_callback(100, "Готово!")
 
     async def shutdown(self, **kwargs):
         if not self.background_tasks:
             logger.info("Нет активных фоновых задач для завершения.")
+        else:
+            logger.info("Ожидание завершения %d фоновых задач...", len(self.background_tasks))
+            await asyncio.gather(*self.background_tasks, return_exceptions=True)
+            logger.info("Все фоновые задачи успешно завершены.")
+        # Не ждем воркеров синхронно, чтобы не блокировать event loop
+        self._wmi_process_pool.shutdown(wait=False, cancel_futures=True)
+        self._blocking_executor.shutdown(wait=False)
+
+async def _gather_or_cancel(*coros) -> List[Any]:
+    """
+    Выполняет корутины параллельно, как asyncio.gather, но при первой ошибке
+    отменяет остальные задачи, а не оставляет их работать в фоне.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+def _monotonic_progress(callback: Callable[[int, str], None]) -> Callable[[int, str], None]:
+    """Оборачивает callback прогресса так, чтобы процент никогда не уменьшался."""
+    last_value = 0
+
+    def report(value: int, message: str) -> None:
+        nonlocal last_value
+        last_value = max(last_value, value)
+        callback(last_value, message)
+
+    return report
+
+class _CoalescedProgress:
+    """
+    Объединяет частые обновления прогресса, чтобы не будить UI-поток чаще,
+    чем раз в min_interval секунд. Промежуточные значения отбрасываются,
+    но последнее отложенное сообщение доставляется по таймеру, а 100%
+    передаются сразу. Должен вызываться из потока событийного цикла.
+    """
+    __slots__ = ("_callback", "_min_interval", "_last_emit", "_pending", "_handle")
+
+    def __init__(self, callback: Callable[[int, str], None], min_interval: float = 0.05):
+        self._callback = callback
+        self._min_interval = min_interval
+        self._last_emit = float("-inf")
+        self._pending: Optional[tuple] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def __call__(self, value: int, message: str) -> None:
+        now = time.monotonic()
+        if value >= 100 or now - self._last_emit >= self._min_interval:
+            self._cancel_pending()
+            self._emit(value, message, now)
             return
-        logger.info(f"Ожидание завершения {len(self.background_tasks)} фоновых задач...")
-        await asyncio.gather(*self.background_tasks, return_exceptions=True)
-        logger.info("Все фоновые задачи успешно завершены.")
+        self._pending = (value, message)
+        if self._handle is None:
+            delay = self._min_interval - (now - self._last_emit)
+            self._handle = asyncio.get_running_loop().call_later(delay, self._flush)
+
+    def close(self) -> None:
+        """Отменяет отложенное обновление (после завершения сценария оно не нужно)."""
+        self._cancel_pending()
+
+    def _emit(self, value: int, message: str, now: float) -> None:
+        self._last_emit = now
+        self._callback(value, message)
+
+    def _flush(self) -> None:
+        self._handle = None
+        if self._pending is not None:
+            value, message = self._pending
+            self._pending = None
+            self._emit(value, message, time.monotonic())
+
+    def _cancel_pending(self) -> None:
+        self._pending = None
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
 
 def _check_cancellation(is_cancelled: Callable[[], bool]):
     """Вспомогательная функция для проверки отмены и выброса исключения."""
@@ -8,26 +8,38 @@
 сделать их доступными для импорта как единый набор инструментов.
 """
 
-# Импортируем все публичные классы из их модулей
-from .ai_base import AIBase
-from .ai_analyzer import AIAnalyzer
-from .ai_communicator import AICommunicator # <-- ДОБАВЛЕНО
-from .dynamic_scan import DynamicAnalyzer
-from .smart_cleaner import SmartCleaner
-from .user_profiler import UserProfiler
-from .windows_optimizer import WindowsOptimizer
-from .wmi_base import WMIBase # <-- ДОБАВЛЕНО
+import importlib
+
+# Классы загружаются лениво (PEP 562): модули тянут за собой тяжелые
+# зависимости (SDK Gemini, wmi, pywin32), а импорт пакета не должен
+# загружать анализаторы, которые в данном запуске не используются.
+_LAZY_IMPORTS = {
+    "AIBase": "ai_base",
+    "AIAnalyzer": "ai_analyzer",
+    "AICommunicator": "ai_communicator",
+    "DynamicAnalyzer": "dynamic_scan",
+    "SmartCleaner": "smart_cleaner",
+    "UserProfiler": "user_profiler",
+    "WindowsOptimizer": "windows_optimizer",
+    "WMIBase": "wmi_base",
+}
 
 # Явно определяем, что является публичным API этого пакета.
 # Это позволяет импортировать все анализаторы одной строкой, если нужно,
 # и делает структуру пакета более ясной.
-__all__ = [
-    "AIBase",
-    "AIAnalyzer",
-    "AICommunicator", # <-- ДОБАВЛЕНО
-    "DynamicAnalyzer",
-    "SmartCleaner",
-    "UserProfiler",
-    "WindowsOptimizer",
-    "WMIBase", # <-- ДОБАВЛЕНО
-]
\ No newline at end of file
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    """Импортирует модуль анализатора при первом обращении к его классу."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Кэшируем в пространстве имен пакета, чтобы __getattr__ больше не вызывался
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,14 +7,10 @@
 import os
 import json
 import logging
-import time
-import hashlib
-import re
 import google.generativeai as genai
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Mapping, Tuple
 
-from .ai_base import AIBase
-from .ai_communicator import AICommunicator # Импортируем для _extract_json
+from .ai_base import AIBase, json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +20,13 @@ class ContentBlockedError(Exception):
         super().__init__(message)
         self.prompt_feedback = prompt_feedback
 
+# Профили, для которых очистка с низким уровнем безопасности недопустима
+_SENSITIVE_PROFILES = frozenset({"Developer", "ContentCreator", "AudioEngineer"})
+# Обязательные поля действия в плане и действия, запрещенные для
+# компонентов, важных для профиля пользователя
+_REQUIRED_ACTION_KEYS = frozenset({"type", "id", "action"})
+_BLOCKED_ACTIONS = frozenset({"disable", "remove"})
+
 class _PlanValidator:
     """Внутренний класс, инкапсулирующий всю логику валидации плана от ИИ."""
     def __init__(self, full_kb: Dict[str, Any], user_profiles: List[str]):
@@ -34,10 +37,12 @@ class _PlanValidator:
         self.critical_items = {
             id for id, rule in self.optimization_rules.items() if rule.get('safety') == 'critical'
         }
+        profiles_set = frozenset(self.user_profiles)
         self.profile_relevant_items = {
             id for id, rule in self.optimization_rules.items()
-            if any(p in rule.get('relevant_profiles', []) for p in self.user_profiles)
+            if not profiles_set.isdisjoint(rule.get('relevant_profiles', ()))
         }
+        self.is_sensitive_profile = not profiles_set.isdisjoint(_SENSITIVE_PROFILES)
 
     def validate(self, plan: Dict) -> Dict:
         """Проводит полную, многоуровневую валидацию плана."""
@@ -54,22 +59,24 @@ class _PlanValidator:
         if not isinstance(action_plan, list):
             raise ValueError(f"'action_plan' должен быть списком, а не {type(action_plan).__name__}.")
 
+        critical_items = self.critical_items
+        profile_relevant_items = self.profile_relevant_items
         safe_actions = []
         for action in action_plan:
-            if not isinstance(action, dict) or not {"type", "id", "action"}.issubset(action.keys()):
+            if not isinstance(action, dict) or not _REQUIRED_ACTION_KEYS <= action.keys():
                 logger.warning(f"Пропуск некорректно сформированного действия в плане: {action}")
                 continue
 
             item_id_lower = str(action["id"]).lower()
             
             # Уровень 1: Проверка на критичность
-            if item_id_lower in self.critical_items:
+            if item_id_lower in critical_items:
                 logger.warning(f"ОТКЛОНЕНО небезопасное действие над критическим компонентом: {action['id']}")
                 continue
             
             # Уровень 2: Проверка на релевантность профилю
             # Запрещаем 'disable' или 'remove' для релевантных профилю служб
-            if action['action'] in ['disable', 'remove'] and item_id_lower in self.profile_relevant_items:
+            if str(action['action']) in _BLOCKED_ACTIONS and item_id_lower in profile_relevant_items:
                 logger.warning(f"ОТКЛОНЕНО действие '{action['action']}' над компонентом '{action['id']}', "
                                f"так как он важен для профилей {self.user_profiles}.")
                 continue
@@ -100,9 +107,7 @@ class _PlanValidator:
                 continue
 
             # Проверяем безопасность для чувствительных профилей
-            is_sensitive_profile = any(p in ["Developer", "ContentCreator", "AudioEngineer"] for p in self.user_profiles)
-            
-            if rule.get('safety') == 'low' and is_sensitive_profile:
+            if rule.get('safety') == 'low' and self.is_sensitive_profile:
                 logger.warning(f"ОТКЛОНЕНА очистка '{category_id}' с низким уровнем безопасности для профиля {self.user_profiles}.")
                 safe_cleanup_plan[category_id] = {"clean": False}
             else:
@@ -115,8 +120,18 @@ class AIAnalyzer(AIBase):
     """
     Основной AI-модуль, отвечающий за анализ данных и генерацию плана оптимизации.
     """
+    # Сколько вариантов статической части промпта плана храним одновременно
+    _STATIC_PLAN_CACHE_SIZE = 16
+    # Сколько валидаторов (с их индексами правил) храним одновременно
+    _VALIDATOR_CACHE_SIZE = 8
+
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config, model_name='gemini-2.0-flash')
+        # (профили, id базы знаний) -> (база знаний, JSON профилей, JSON правил).
+        # Ссылка на базу хранится, чтобы id не мог быть переиспользован.
+        self._static_plan_cache: Dict[Tuple[Tuple[str, ...], int], Tuple[Mapping[str, Any], str, str]] = {}
+        # (id базы знаний, отсортированные профили) -> (база знаний, валидатор).
+        self._validator_cache: Dict[Tuple[int, Tuple[str, ...]], Tuple[Mapping[str, Any], _PlanValidator]] = {}
 
     def _ping_api(self):
         """Проверяет доступность API Gemini при инициализации."""
@@ -130,12 +145,10 @@ class AIAnalyzer(AIBase):
     # ### УЛУЧШЕНИЕ: Добавляем параметр generation_config ###
     async def _get_response_with_cache(self, prompt: str, context: str, use_cache: bool = True, generation_config: Dict[str, Any] = None) -> str:
         """Переопределяем метод для более строгой обработки ошибок и гибкой конфигурации."""
-        prompt_hash = hashlib.md5(prompt.encode('utf-8')).hexdigest()
-        if use_cache and (cached_response := self.cache.get(prompt_hash)):
-            response_text, timestamp = cached_response
-            if time.time() - timestamp < self.config.get('ai_cache_ttl', 3600):
-                logger.info(f"Использование кэшированного ответа для '{context}'.")
-                return response_text
+        prompt_hash = self._cache_key(prompt, generation_config)
+        if use_cache and (cached_response := self._get_cached_response(prompt_hash)) is not None:
+            logger.info(f"Использование кэшированного ответа для '{context}'.")
+            return cached_response
 
         logger.debug(f"Отправка нового запроса в ИИ. Контекст: {context}")
         
@@ -150,26 +163,16 @@ class AIAnalyzer(AIBase):
 
         response_text = response.text
         if use_cache:
-            self.cache[prompt_hash] = (response_text, time.time())
+            self._put_cached_response(prompt_hash, response_text)
         return response_text
 
     @staticmethod
     def _extract_json_from_response(text: str) -> Dict:
         """Надежно извлекает JSON объект из текстового ответа ИИ, удаляя обертку ```json."""
-        # Ищем блок JSON, который может быть заключен в ```json ... ```
-        match = re.search(r'```json\s*(\{.*\}|\[.*\])\s*```', text, re.DOTALL)
-        
-        # Если нашли блок в ```json, извлекаем его содержимое
-        if match:
-            json_text = match.group(1)
-        else:
-            # Если не нашли, предполагаем, что весь текст - это JSON
-            json_text = text
-
         try:
-            return json.loads(json_text)
+            return AIBase._load_json_response(text)
         except json.JSONDecodeError as e:
-            logger.error(f"Не удалось распарсить JSON. Ошибка: {e}. Текст для парсинга: {json_text}")
+            logger.error(f"Не удалось распарсить JSON. Ошибка: {e}. Текст для парсинга: {e.doc}")
             raise ValueError(f"JSON-объект не найден или некорректен в ответе ИИ.") from e
 
     # --- Методы для генерации промптов ---
@@ -182,24 +185,63 @@ class AIAnalyzer(AIBase):
         Respond with ONLY ONE word in a JSON object: {{"profile": "..."}}.
         
         Profiler Configuration (keywords to look for):
-        {json.dumps(kb_config, indent=2)}
+        {self._json_dumps_cached(kb_config)}
 
         System Data:
-        {json.dumps(system_data, indent=2, default=str)}
+        {json_dumps(system_data)}
+        """
+
+    def _get_static_plan_sections(self, profiles: List[str], kb: Mapping[str, Any]) -> Tuple[str, str]:
+        """
+        Возвращает сериализованные профили и правила базы знаний для промпта плана.
+
+        Эти части меняются редко (ядро отдает один и тот же неизменяемый объект
+        базы для одного набора профилей), поэтому JSON правил строится один раз
+        на пару (профили, база), а заново сериализуются только данные системы.
         """
+        key = (tuple(profiles), id(kb))
+        cached = self._static_plan_cache.get(key)
+        if cached is not None and cached[0] is kb:
+            return cached[1], cached[2]
+
+        # Убираем лишние данные, чтобы сфокусировать ИИ на главном
+        profiles_json = json.dumps(profiles)
+        rules_json = json_dumps(kb.get('optimization_rules', []))
+        if len(self._static_plan_cache) >= self._STATIC_PLAN_CACHE_SIZE:
+            self._static_plan_cache.clear()
+        self._static_plan_cache[key] = (kb, profiles_json, rules_json)
+        return profiles_json, rules_json
+
+    def _get_plan_validator(self, kb: Mapping[str, Any], profiles: List[str]) -> _PlanValidator:
+        """
+        Возвращает валидатор для пары (база знаний, профили).
+
+        Индексы валидатора строятся проходом по всем правилам базы, а сам он
+        не хранит состояния между проверками, поэтому переиспользуется, пока
+        ядро передает тот же объект базы для того же набора профилей.
+        """
+        key = (id(kb), tuple(sorted(profiles)))
+        cached = self._validator_cache.get(key)
+        if cached is not None and cached[0] is kb:
+            return cached[1]
+
+        validator = _PlanValidator(full_kb=kb, user_profiles=profiles)
+        if len(self._validator_cache) >= self._VALIDATOR_CACHE_SIZE:
+            self._validator_cache.clear()
+        self._validator_cache[key] = (kb, validator)
+        return validator
 
     # ### УЛУЧШЕНИЕ: Более сфокусированный и чистый промпт ###
-    def _create_plan_prompt(self, system_data: Dict, profiles: List[str], kb: Dict) -> str:
+    def _create_plan_prompt(self, system_data: Dict, profiles: List[str], kb: Mapping[str, Any]) -> str:
         """Создает промпт для генерации плана оптимизации."""
-        # Убираем лишние данные, чтобы сфокусировать ИИ на главном
-        relevant_kb_rules = kb.get('optimization_rules', [])
+        profiles_json, rules_json = self._get_static_plan_sections(profiles, kb)
         
         return f"""
         You are an expert Windows optimization engineer. Your task is to create a safe and effective optimization plan in a single, valid JSON object with two keys: "action_plan" and "cleanup_plan".
 
         **1. Analyze System Components (for "action_plan"):**
         - Review the `system_components` data.
-        - Based on the user profiles {json.dumps(profiles)}, identify non-essential services and UWP apps.
+        - Based on the user profiles {profiles_json}, identify non-essential services and UWP apps.
         - Use the provided `KNOWLEDGE_BASE` to check for safety. NEVER suggest actions on items marked as 'critical'.
         - Do not suggest actions on items relevant to the user's profiles.
         - For each valid action, create an object for the "action_plan" list with keys: "type", "id", "action", "reason", "user_explanation_ru".
@@ -210,13 +252,13 @@ class AIAnalyzer(AIBase):
         - Set the value to `{{"clean": true}}` if you are confident it is safe to clean for this user.
         - Set it to `{{"clean": false}}` if it's risky (e.g., cleaning `python_pip_cache` for a 'Developer').
 
-        **USER PROFILES:** {json.dumps(profiles)}
+        **USER PROFILES:** {profiles_json}
 
         **KNOWLEDGE BASE (Safety Rules):**
-        {json.dumps(relevant_kb_rules, indent=2)}
+        {rules_json}
 
         **SYSTEM SNAPSHOT (Data to Analyze):**
-        {json.dumps(system_data, indent=2, default=str)}
+        {json_dumps(system_data)}
 
         Respond with ONLY the JSON object.
         """
@@ -260,7 +302,7 @@ class AIAnalyzer(AIBase):
         Your goal is to suggest future improvements.
         
         SESSION ANALYSIS:
-        {json.dumps(kwargs, indent=2, ensure_ascii=False)}
+        {json_dumps(kwargs)}
         
         TASK:
         Based on this session's data, suggest 3-5 concrete improvements for future versions.
@@ -272,7 +314,10 @@ class AIAnalyzer(AIBase):
     async def determine_user_profile(self, system_data: Dict, kb_config: Dict) -> str:
         """Определяет профиль пользователя."""
         prompt = self._create_profile_prompt(system_data, kb_config)
-        response_text = await self._get_response_with_cache(prompt, "determine_user_profile")
+        response_text = await self._get_response_with_cache(
+            prompt, "determine_user_profile",
+            generation_config={"response_mime_type": "application/json"}
+        )
         try:
             profile_data = self._extract_json_from_response(response_text)
             profile = profile_data.get("profile", "HomeUser").strip()
@@ -282,14 +327,23 @@ class AIAnalyzer(AIBase):
             logger.error(f"Не удалось определить профиль пользователя: {e}")
             return "HomeUser"
 
-    async def generate_distillation_plan(self, system_data: Dict, profiles: List[str], kb: Dict) -> Dict:
-        """Генерирует и валидирует план оптимизации с помощью внутреннего валидатора."""
+    async def generate_distillation_plan(self, system_data: Dict, profiles: List[str], kb: Mapping[str, Any]) -> Dict:
+        """
+        Генерирует и валидирует план оптимизации с помощью внутреннего валидатора.
+
+        kb - отфильтрованная ядром база знаний. Она неизменяема и кэшируется
+        ядром по набору профилей, поэтому копировать ее перед использованием
+        не нужно.
+        """
         prompt = self._create_plan_prompt(system_data, profiles, kb)
         
         # ### УЛУЧШЕНИЕ: Используем строгую конфигурацию для получения JSON ###
         generation_config = {
             "temperature": 0.1,
             "max_output_tokens": 8192,
+            # JSON-режим: ответ приходит без ```json-обертки и разбирается
+            # напрямую, минуя поиск блока регулярным выражением.
+            "response_mime_type": "application/json",
         }
         
         try:
@@ -298,9 +352,9 @@ class AIAnalyzer(AIBase):
                 use_cache=False, 
                 generation_config=generation_config
             )
-            plan = AICommunicator._extract_json_from_response(response_text)
+            plan = self._extract_json_from_response(response_text)
             
-            validator = _PlanValidator(full_kb=kb, user_profiles=profiles)
+            validator = self._get_plan_validator(kb, profiles)
             safe_plan = validator.validate(plan)
             
             logger.debug("Получен и валидирован безопасный план от ИИ.")
@@ -9,15 +9,41 @@
 - Проверка доступности API.
 """
 import os
+import json
 import logging
 import time
 import hashlib
+import re
+from collections import OrderedDict
 import google.generativeai as genai
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
+
+# orjson - необязательное ускорение сериализации промптов и разбора ответов ИИ.
+# orjson.JSONDecodeError наследует json.JSONDecodeError, поэтому обработка
+# ошибок в вызывающем коде не меняется.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def json_dumps(obj: Any) -> str:
+    """Сериализует данные для промпта: JSON с отступом 2, без экранирования не-ASCII."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str
+        ).decode()
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+
+
+json_loads = orjson.loads if orjson is not None else json.loads
+
+# Блок ```json ... ``` в ответе ИИ. Компилируется один раз при импорте модуля.
+JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```', re.DOTALL)
+
+
 class AIBase:
     """
     Базовый класс для работы с API Gemini.
@@ -26,6 +52,10 @@ class AIBase:
     
     # Статическая переменная для отслеживания статуса конфигурации
     _is_configured = False
+    # Сколько сериализованных объектов храним в _json_cache одновременно
+    _JSON_CACHE_SIZE = 16
+    # Сколько ответов ИИ храним в кэше одновременно
+    _RESPONSE_CACHE_SIZE = 64
 
     def __init__(self, config: Dict[str, Any], model_name: str = 'gemini-2.0-flash'):
         """
@@ -36,7 +66,12 @@ class AIBase:
             model_name: Имя модели Gemini, которую следует использовать.
         """
         self.config = config.get('app_config', {})
-        self.cache: Dict[str, Tuple[str, float]] = {}
+        # Хэш промпта -> (ответ, время получения). Ограниченный LRU-кэш:
+        # устаревшие записи удаляются при обращении, лишние - вытесняются.
+        self.cache: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+        # id объекта -> (объект, его JSON). Ссылка на объект хранится, чтобы
+        # id не мог быть переиспользован другим объектом.
+        self._json_cache: Dict[int, Tuple[Any, str]] = {}
         
         # Конфигурируем API только один раз за все время работы приложения
         if not AIBase._is_configured:
@@ -56,6 +91,73 @@ class AIBase:
         # self._ping_api() 
         logger.info(f"{self.__class__.__name__} успешно инициализирован.")
 
+    @staticmethod
+    def _load_json_response(text: str) -> Any:
+        """
+        Разбирает JSON из ответа ИИ: сначала как "голый" JSON, затем из блока
+        ```json ... ```, а если блока нет - весь текст целиком.
+
+        При неудаче выбрасывает json.JSONDecodeError; текст последней попытки
+        разбора доступен в атрибуте doc исключения.
+        """
+        # Быстрый путь: ответ уже является "голым" JSON, регулярное выражение
+        # по всему тексту не нужно.
+        stripped = text.strip()
+        if stripped[:1] in ('{', '['):
+            try:
+                return json_loads(stripped)
+            except json.JSONDecodeError:
+                pass  # Например, JSON с пояснением после него - ищем блок ниже
+
+        match = JSON_FENCE_RE.search(text)
+        return json_loads(match.group(1) if match else text)
+
+    @staticmethod
+    def _cache_key(prompt: str, generation_config: Optional[Dict[str, Any]] = None) -> bytes:
+        """
+        Ключ кэша ответов - 128-битный BLAKE2b: быстрее MD5 на длинных промптах,
+        а сырые байты дайджеста не нужно переводить в hex. Параметры генерации
+        меняют ответ (например, JSON-режим), поэтому тоже входят в ключ.
+        """
+        hasher = hashlib.blake2b(prompt.encode('utf-8'), digest_size=16)
+        if generation_config:
+            hasher.update(b'\0')
+            hasher.update(json.dumps(generation_config, sort_keys=True, default=str).encode('utf-8'))
+        return hasher.digest()
+
+    def _get_cached_response(self, prompt_hash: bytes) -> Optional[str]:
+        """Возвращает актуальный ответ из кэша или None (устаревший удаляется)."""
+        cached = self.cache.get(prompt_hash)
+        if cached is None:
+            return None
+        response_text, timestamp = cached
+        if time.monotonic() - timestamp >= self.config.get('ai_cache_ttl', 3600):
+            del self.cache[prompt_hash]
+            return None
+        self.cache.move_to_end(prompt_hash)
+        return response_text
+
+    def _put_cached_response(self, prompt_hash: bytes, response_text: str) -> None:
+        """Сохраняет ответ в кэш, вытесняя самые давние записи сверх лимита."""
+        self.cache[prompt_hash] = (response_text, time.monotonic())
+        self.cache.move_to_end(prompt_hash)
+        while len(self.cache) > self._RESPONSE_CACHE_SIZE:
+            self.cache.popitem(last=False)
+
+    def _json_dumps_cached(self, obj: Any) -> str:
+        """
+        Возвращает JSON для неизменяемых во время работы данных (например,
+        конфигурации из базы знаний), сериализуя каждый объект только один раз.
+        """
+        cached = self._json_cache.get(id(obj))
+        if cached is not None and cached[0] is obj:
+            return cached[1]
+        if len(self._json_cache) >= self._JSON_CACHE_SIZE:
+            self._json_cache.clear()
+        dumped = json_dumps(obj)
+        self._json_cache[id(obj)] = (obj, dumped)
+        return dumped
+
     def _ping_api(self):
         """Проверяет доступность API Gemini."""
         try:
@@ -67,7 +169,8 @@ class AIBase:
             raise ConnectionError(f"Не удалось подключиться к API Gemini: {e}") from e
 
     async def _get_response_with_cache(
-        self, prompt: str, context: str, use_cache: bool = True
+        self, prompt: str, context: str, use_cache: bool = True,
+        generation_config: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Отправляет запрос в ИИ, используя кеширование и обработку ошибок.
@@ -76,16 +179,17 @@ class AIBase:
             prompt: Текст промпта для ИИ.
             context: Контекст запроса для логирования.
             use_cache: Использовать ли кеширование для этого запроса.
+            generation_config: Параметры генерации поверх значений по умолчанию,
+                например {"response_mime_type": "application/json"} - JSON-режим
+                Gemini, в котором модель возвращает JSON без markdown-обертки.
 
         Returns:
             Текстовый ответ от ИИ или пустой JSON-объект в случае ошибки.
         """
-        prompt_hash = hashlib.md5(prompt.encode('utf-8')).hexdigest()
-        if use_cache and (cached_response := self.cache.get(prompt_hash)):
-            response_text, timestamp = cached_response
-            if time.time() - timestamp < self.config.get('ai_cache_ttl', 3600):
-                logger.info(f"Использование кэшированного ответа для '{context}'.")
-                return response_text
+        prompt_hash = self._cache_key(prompt, generation_config)
+        if use_cache and (cached_response := self._get_cached_response(prompt_hash)) is not None:
+            logger.info(f"Использование кэшированного ответа для '{context}'.")
+            return cached_response
 
         logger.debug(f"Отправка нового запроса в ИИ. Контекст: {context}")
         
@@ -98,14 +202,15 @@ class AIBase:
                 'HARM_CATEGORY_SEXUALLY_EXPLICIT': 'BLOCK_NONE',
                 'HARM_CATEGORY_DANGEROUS_CONTENT': 'BLOCK_NONE',
             }
-            generation_config = genai.types.GenerationConfig(
+            gen_config = genai.types.GenerationConfig(**{
                 # Увеличиваем максимальное количество токенов в ответе.
                 # Для Gemini 1.5 Flash это значение может быть очень большим.
-                max_output_tokens=65536
-            )
+                'max_output_tokens': 65536,
+                **(generation_config or {}),
+            })
             response = await self.model.generate_content_async(
                 prompt,
-                generation_config=generation_config,
+                generation_config=gen_config,
                 safety_settings=safety_settings
             )
             
@@ -120,7 +225,7 @@ class AIBase:
 
             response_text = response.text
             if use_cache:
-                self.cache[prompt_hash] = (response_text, time.time())
+                self._put_cached_response(prompt_hash, response_text)
             return response_text
 
         except Exception as e:
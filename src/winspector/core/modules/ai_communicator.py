@@ -5,12 +5,13 @@
 - Генерация отчетов для пользователя.
 - Генерация предложений по улучшению для разработчиков.
 """
+import asyncio
 import json
 import logging
 import re
 from typing import Dict, Any, List
 
-from .ai_base import AIBase
+from .ai_base import AIBase, json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -26,13 +27,10 @@ class AICommunicator(AIBase):
     @staticmethod
     def _extract_json_from_response(text: str) -> Dict:
         """Надежно извлекает JSON объект из текстового ответа ИИ, удаляя обертку ```json."""
-        match = re.search(r'```json\s*(\{.*\}|\[.*\])\s*```', text, re.DOTALL)
-        
-        json_text = match.group(1) if match else text
-
         try:
-            return json.loads(json_text)
+            return AIBase._load_json_response(text)
         except json.JSONDecodeError as e:
+            json_text = e.doc
             # ### УЛУЧШЕНИЕ: Попытка восстановить JSON ###
             logger.warning(f"Получен невалидный JSON. Ошибка: {e}. Пытаемся восстановить...")
             # Простая эвристика: ищем последний корректный объект или список
@@ -68,10 +66,10 @@ class AICommunicator(AIBase):
         }}
         
         Profiler Configuration (keywords to look for in software list):
-        {json.dumps(kb_config, indent=2)}
+        {self._json_dumps_cached(kb_config)}
 
         System Data (Pay close attention to `shortcuts` and `user_folder_stats`):
-        {json.dumps(system_data, indent=2, default=str)}
+        {json_dumps(system_data)}
         """
 
     def _create_report_prompt(self, summary: Dict, plan: List[Dict], profiles: List[str]) -> str:
@@ -141,7 +139,10 @@ class AICommunicator(AIBase):
         """Определяет набор профилей пользователя на основе системных данных."""
         logger.info("Запрос к ИИ для определения набора профилей пользователя.")
         prompt = self._create_profile_prompt(system_data, kb_config)
-        response_text = await self._get_response_with_cache(prompt, "determine_user_profile")
+        response_text = await self._get_response_with_cache(
+            prompt, "determine_user_profile",
+            generation_config={"response_mime_type": "application/json"}
+        )
         
         try:
             profile_data = self._extract_json_from_response(response_text)
@@ -169,13 +170,16 @@ class AICommunicator(AIBase):
         # Этот метод может оставаться таким же, так как его промпт очень специфичен
         # и сложен для формализации в отдельном методе.
         logger.info("Запрос к ИИ на саморефлексию и предложения по улучшению.")
-        
+
+        # Данные сессии (в т.ч. полный список служб и мусора) велики, поэтому
+        # сериализуются в рабочем потоке, а не в потоке GUI с event loop.
+        session_json = await asyncio.to_thread(json_dumps, kwargs)
         prompt = f"""
         You are "WinSpector AI Architect", a lead developer reviewing an optimization session.
         Your goal is to suggest future improvements for the application.
         
         SESSION ANALYSIS (JSON format):
-        {json.dumps(kwargs, indent=2, ensure_ascii=False, default=str)}
+        {session_json}
         
         TASK:
         Based on this session's data, suggest 3-5 concrete, technical improvements for future versions.
@@ -9,7 +9,8 @@ import asyncio
 import logging
 import fnmatch
 import subprocess
-from typing import List, Dict, Any, Tuple
+import threading
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -58,14 +59,26 @@ class SmartCleaner:
                 junk_summary[category] = res
 
         logger.info(f"Глубокий поиск завершен. Найдено {len(junk_summary)} категорий мусора.")
-        logger.debug(f"Сводка по найденному мусору: {junk_summary}")
+        # f-строка с большим словарем форматируется, только если DEBUG включен
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Сводка по найденному мусору: {junk_summary}")
         return junk_summary
 
-    async def perform_standard_cleanup(self) -> Dict[str, Any]:
+    async def perform_standard_cleanup(self, is_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
         """
         Выполняет стандартную, детерминированную очистку наиболее
         распространенных временных файлов и кэшей Windows.
+
+        Отмена проверяется перед каждым удалением: через is_cancelled и через
+        отмену самой задачи. Очистка папки в рабочем потоке в этом случае
+        прерывается после текущего элемента.
         """
+        stop_event = threading.Event()
+
+        def check_cancelled() -> None:
+            if is_cancelled is not None and is_cancelled():
+                raise asyncio.CancelledError
+
         logger.info("Начало стандартной системной очистки...")
         
         standard_plan = {
@@ -101,12 +114,21 @@ class SmartCleaner:
         summary = {"cleaned_size_bytes": 0, "deleted_files_count": 0, "errors": 0}
 
         for category, details in standard_plan.items():
+            check_cancelled()
             logger.info(f"Стандартная очистка: {category}")
             cleanup_type = details["type"]
             
             if cleanup_type == "folder_content":
                 for path_str in details["paths"]:
-                    size, count, errors = await asyncio.to_thread(self._clean_directory_content, Path(os.path.expandvars(path_str)))
+                    check_cancelled()
+                    try:
+                        size, count, errors = await asyncio.to_thread(
+                            self._clean_directory_content, Path(os.path.expandvars(path_str)), stop_event
+                        )
+                    except asyncio.CancelledError:
+                        # Поток to_thread не отменяется сам: останавливаем его цикл
+                        stop_event.set()
+                        raise
                     summary["cleaned_size_bytes"] += size
                     summary["deleted_files_count"] += count
                     summary["errors"] += errors
@@ -116,6 +138,7 @@ class SmartCleaner:
                     # ### ИСПРАВЛЕНИЕ: Используем правильное имя метода ###
                     found_files = await asyncio.to_thread(self._find_files_by_mask, os.path.expandvars(path_str), {})
                     for file_path, _ in found_files:
+                        check_cancelled()
                         delete_res = await self._delete_single_file(file_path)
                         summary["cleaned_size_bytes"] += delete_res[0]
                         summary["deleted_files_count"] += delete_res[1]
@@ -324,7 +347,8 @@ class SmartCleaner:
                 if self._is_dir_effectively_empty(current_dir):
                     try:
                         shutil.rmtree(current_dir, ignore_errors=False)
-                        logger.debug(f"Удалена пустая директория: {current_dir}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Удалена пустая директория: {current_dir}")
                         deleted_count += 1
                     except (OSError, PermissionError) as e:
                         logger.warning(f"Не удалось удалить директорию '{current_dir}': {e}")
@@ -352,12 +376,15 @@ class SmartCleaner:
                 logger.warning(f"Не удалось удалить файл '{file_path}': {e}")
             return 0, 0, 1
 
-    def _clean_directory_content(self, path: Path) -> Tuple[int, int, int]:
-        """Безопасно очищает СОДЕРЖИМОЕ директории."""
+    def _clean_directory_content(self, path: Path, stop_event: Optional[threading.Event] = None) -> Tuple[int, int, int]:
+        """Безопасно очищает СОДЕРЖИМОЕ директории (до установки stop_event, если он задан)."""
         if not path.is_dir(): return 0, 0, 0
         total_deleted_size, deleted_count, error_count = 0, 0, 0
         try:
             for item in path.iterdir():
+                if stop_event is not None and stop_event.is_set():
+                    logger.info(f"Очистка '{path}' прервана отменой.")
+                    break
                 try:
                     if item.is_dir():
                         size = self._get_dir_size_safe(item)
@@ -385,7 +412,8 @@ class SmartCleaner:
         deleted_count, error_count = 0, 0
         try:
             if not any(path.iterdir()):
-                logger.debug(f"Удаление пустой директории: {path}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Удаление пустой директории: {path}")
                 path.rmdir()
                 deleted_count += 1
                 # Рекурсивный вызов для родительской папки
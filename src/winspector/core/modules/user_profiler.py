@@ -9,7 +9,7 @@ import logging
 import winreg
 from typing import Dict, Any, List, Set, Optional
 from pathlib import Path
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Executor
 
 from ..wmi_workers import get_hardware_info_worker
 
@@ -22,9 +22,16 @@ class UserProfiler:
     собирая данные об оборудовании, ПО, ярлыках, пользовательских папках и настройках.
     """
 
-    def __init__(self):
-        """Инициализирует профилировщик."""
+    def __init__(self, process_pool: Executor):
+        """
+        Инициализирует профилировщик.
+
+        Args:
+            process_pool: Пул процессов для WMI-воркеров. Принадлежит ядру,
+                которое переиспользует его между вызовами и закрывает сам.
+        """
         logger.info("Инициализация UserProfiler (Advanced)...")
+        self._process_pool = process_pool
 
     async def get_system_profile(self) -> Dict[str, Any]:
         """
@@ -35,8 +42,7 @@ class UserProfiler:
         
         # Задачи, требующие отдельных процессов (WMI)
         loop = asyncio.get_running_loop()
-        with ProcessPoolExecutor(max_workers=1) as pool:
-            hardware_task = loop.run_in_executor(pool, get_hardware_info_worker)
+        hardware_task = loop.run_in_executor(self._process_pool, get_hardware_info_worker)
         
         # Задачи, которые можно выполнить в потоках
         tasks = [
@@ -63,7 +69,9 @@ class UserProfiler:
                 profile[key] = result
         
         logger.info("Профилирование системы завершено.")
-        logger.debug(f"Собранный профиль: {profile}")
+        # f-строка с полным профилем форматируется, только если DEBUG включен
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Собранный профиль: {profile}")
         return profile
 
     def _get_installed_software_from_registry(self) -> Dict[str, List[str]]:
@@ -9,7 +9,7 @@ import logging
 import subprocess
 import shlex
 from typing import List, Dict, Any, Callable, Optional, Set
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Executor
 from datetime import datetime
 import os
 from pathlib import Path
@@ -24,9 +24,13 @@ class WindowsOptimizer:
     """
     Модуль для выполнения низкоуровневых оптимизаций Windows.
     """
-    def __init__(self, optimization_rules: List[Dict]):
+    def __init__(self, optimization_rules: List[Dict], process_pool: Executor):
         logger.info("Инициализация WindowsOptimizer (Advanced)...")
         self.rules = optimization_rules
+        # Пул процессов для WMI-воркеров принадлежит ядру и живет все время
+        # работы приложения, чтобы не запускать процесс на каждый вызов;
+        # закрывает его тоже ядро
+        self._process_pool = process_pool
         self._service_cache: Optional[Set[str]] = None
 
     async def get_system_components(self) -> Dict[str, List[Dict]]:
@@ -34,8 +38,7 @@ class WindowsOptimizer:
         logger.info("Начало сбора данных о компонентах системы (службы, UWP).")
         
         loop = asyncio.get_running_loop()
-        with ProcessPoolExecutor(max_workers=1) as pool:
-            services_task = loop.run_in_executor(pool, get_services_worker)
+        services_task = loop.run_in_executor(self._process_pool, get_services_worker)
         
         apps_task = self._collect_uwp_apps()
         
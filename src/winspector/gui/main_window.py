@@ -2,7 +2,7 @@
 """Главное окно приложения WinSpector Pro."""
 import asyncio
 import logging
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import sys
 from ..resources import assets_rc
 from PyQt6.QtWidgets import (
@@ -21,6 +21,10 @@ from .widgets.animated_widgets import PulsingButton, AnimatedCounterLabel
 from .widgets.neural_background import NeuralBackgroundWidget
 from ..core.analyzer import WinSpectorCore
 
+if TYPE_CHECKING:
+    # Только для аннотаций: application.py сам импортирует этот модуль
+    from ..application import AppPaths
+
 try:
     # Относительный импорт для констант приложения
     from .. import APP_NAME, APP_VERSION
@@ -41,7 +45,7 @@ class MainWindow(QMainWindow):
     progress_updated = pyqtSignal(int, str)
     optimization_finished = pyqtSignal(str)
     optimization_error = pyqtSignal(Exception)
-    def __init__(self, core_instance: WinSpectorCore, app_paths: dict):
+    def __init__(self, core_instance: WinSpectorCore, app_paths: "AppPaths"):
         super().__init__()
         logger.info("MainWindow: Инициализация.")
         self.core = core_instance
@@ -56,8 +60,7 @@ class MainWindow(QMainWindow):
         self.go_to_home_page()
     def _setup_window(self):
         self.setWindowTitle(f"{APP_NAME} v{APP_VERSION}")
-        icon_path = self.app_paths.get("assets") / "app.ico"
-        if icon_path.exists(): self.setWindowIcon(QIcon(str(icon_path)))
+        # Иконка окна наследуется от QApplication (:/app.ico из ресурсов Qt)
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setMinimumSize(850, 700)
@@ -97,8 +100,8 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(page)
         
         # --- ИЗМЕНЕНИЕ: Используем путь из app_paths ---
-        rocket_icon_path = self.app_paths.get("assets") / "rocket.png"
-        rocket_icon = QIcon(str(rocket_icon_path)) if rocket_icon_path.exists() else QIcon()
+        rocket_icon_path = self.app_paths.asset("rocket.png")
+        rocket_icon = QIcon(str(rocket_icon_path)) if rocket_icon_path is not None else QIcon()
         
         self.pulsing_button = PulsingButton(rocket_icon, text="")
         self.pulsing_button.setFixedSize(220, 220)
@@ -213,7 +216,8 @@ class MainWindow(QMainWindow):
         self.pulsing_button.resume()
     def _update_progress(self, value: int, text: str):
         """Слот для обновления виджетов прогресса."""
-        logger.debug(f"MainWindow: Получен сигнал progress_updated: value={value}, text='{text}'")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"MainWindow: Получен сигнал progress_updated: value={value}, text='{text}'")
         self.progress_bar.setValue(value)
         self.status_label.setText(text)
     def _on_optimization_finished(self, final_report: str):
@@ -2,6 +2,9 @@
 """
 Виджет для отображения анимированного фона в виде "нейронной сети".
 Создает эффект движущихся частиц, соединенных линиями, с параллаксом от мыши.
+
+Отрисовка выполняется через QOpenGLWidget: растеризация кадра происходит
+на GPU, а не в CPU-пиксмапе при каждом обновлении анимации.
 """
 import math
 import random
@@ -9,27 +12,52 @@ import sys
 from typing import List, Dict, Any, Optional
 
 from PyQt6.QtWidgets import QWidget, QPushButton, QApplication, QMainWindow
+from PyQt6.QtOpenGLWidgets import QOpenGLWidget
 from PyQt6.QtGui import (
-    QPainter, QColor, QPen, QBrush, QPaintEvent, QResizeEvent, QShowEvent,
-    QMouseEvent, QPainterPath
+    QPainter, QColor, QPen, QBrush, QShowEvent,
+    QMouseEvent, QPainterPath, QSurfaceFormat
 )
-from PyQt6.QtCore import QTimer, QPointF, Qt, QRect, QRectF, pyqtSignal, QObject, QPropertyAnimation, QEasingCurve, QSequentialAnimationGroup, QPoint
+from PyQt6.QtCore import QElapsedTimer, QPointF, QLineF, Qt, QRect, QRectF, pyqtSignal, QObject, QPropertyAnimation, QEasingCurve, QSequentialAnimationGroup, QPoint
 
 
 class Particle:
-    """Легковесный класс для хранения данных о частице."""
-    __slots__ = ('pos', 'vel', 'size', 'parallax_factor', 'mass')
+    """
+    Легковесный класс для хранения данных о частице.
+
+    Координаты и скорость хранятся как обычные float, а не QPointF:
+    векторная арифметика над QPointF создает новый объект на каждую
+    операцию, что в покадровом цикле обходится дороже самой физики.
+    """
+    __slots__ = ('x', 'y', 'vx', 'vy', 'size', 'parallax_factor', 'mass')
     
-    def __init__(self, pos: QPointF, vel: QPointF, size: float, parallax_factor: float, mass: float):
-        self.pos = pos
-        self.vel = vel
+    def __init__(self, x: float, y: float, vx: float, vy: float, size: float, parallax_factor: float, mass: float):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
         self.size = size
         self.parallax_factor = parallax_factor
         self.mass = mass
 
 
-class NeuralBackgroundWidget(QWidget):
-    """Анимированный фон с эффектом параллакса от движения мыши."""
+class NeuralBackgroundWidget(QOpenGLWidget):
+    """
+    Анимированный фон с эффектом параллакса от движения мыши.
+
+    Наследуется от QOpenGLWidget, поэтому каждый кадр рисуется через
+    OpenGL paint engine и не заставляет Qt перерисовывать на CPU все
+    перекрывающее его дерево виджетов.
+
+    Анимация не использует таймер: следующий шаг симуляции запускается
+    сигналом frameSwapped, то есть с частотой реально показанных кадров
+    (vsync). Шаг масштабируется по прошедшему времени, поэтому скорость
+    движения не зависит от частоты обновления монитора.
+
+    Физика при этом считается не чаще MAX_SIMULATION_FPS раз в секунду:
+    на мониторах 120-144 Гц шаг на каждом кадре заметно нагружал бы CPU.
+    Лишние кадры лишь перерисовывают текущее состояние, поддерживая цепочку
+    frameSwapped, и стоят только отрисовки.
+    """
     
     PARTICLE_COUNT: int = 150
     CONNECTION_DISTANCE: float = 100.0
@@ -47,13 +75,32 @@ class NeuralBackgroundWidget(QWidget):
     CORNER_RADIUS: float = 20.0
     FADE_SPEED: float = 0.01
 
+    # Длительность "эталонного" шага симуляции; все скорости заданы в расчете на него
+    SIMULATION_STEP_MS: float = 30.0
+    # Ограничение шага после долгой паузы (например, при перетаскивании окна)
+    MAX_FRAME_SCALE: float = 3.0
+    # Верхняя граница частоты шагов симуляции (в кадрах в секунду)
+    MAX_SIMULATION_FPS: int = 60
+
+    # Квантование цвета линий: линии с одинаковым оттенком и прозрачностью
+    # рисуются одним вызовом drawLines вместо отдельного drawLine на каждую.
+    LINE_HUE_STEPS: int = 16
+    LINE_ALPHA_STEP: int = 6
+
     BG_COLOR = QColor(33, 37, 43)
     PARTICLE_COLOR = QColor(82, 152, 215, 150)
     LINE_BASE_COLOR = QColor(82, 152, 215)
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
-        
+
+        # Альфа-канал нужен для прозрачных скругленных углов поверх
+        # полупрозрачного окна, мультисэмплинг - для сглаживания линий.
+        surface_format = QSurfaceFormat()
+        surface_format.setAlphaBufferSize(8)
+        surface_format.setSamples(4)
+        self.setFormat(surface_format)
+
         self.particles: List[Particle] = []
         self.mouse_pos = QPointF(-1, -1) 
 
@@ -63,20 +110,23 @@ class NeuralBackgroundWidget(QWidget):
         # Храним (opacity, dist_sq) для оптимизации.
         self.active_connections: Dict[tuple[int, int], tuple[float, float]] = {}
 
-        # Оптимизация: пространственная сетка для ускорения поиска соседей
+        # Оптимизация: пространственная сетка для ускорения поиска соседей.
+        # Размер ячейки равен дистанции разрыва связи, поэтому все пары
+        # в пределах этой дистанции гарантированно лежат в соседних ячейках.
         self.grid: Dict[tuple[int, int], List[int]] = {}
-        self.grid_cell_size: float = self.CONNECTION_DISTANCE
+        self.grid_cell_size: float = self.CONNECTION_DISTANCE * self.CONNECTION_BREAK_FACTOR
         
         # Предварительно рассчитанные значения для оптимизации
         self.connection_distance_sq: float = self.CONNECTION_DISTANCE**2
         self.break_distance_sq: float = self.connection_distance_sq * (self.CONNECTION_BREAK_FACTOR**2)
         self.min_speed_sq: float = self.MIN_SPEED**2
         self.max_speed_sq: float = self.MAX_SPEED**2
-        self.corner_centers: List[QPointF] = []
+        self.corner_centers: List[tuple[float, float]] = []
 
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self.update_particles)
-        self.animation_timer.start(45)  # ~33 FPS
+        # Время между показанными кадрами для масштабирования шага симуляции
+        self.frame_clock = QElapsedTimer()
+        self.min_step_interval_ms: float = 1000.0 / self.MAX_SIMULATION_FPS
+        self.frameSwapped.connect(self._on_frame_swapped)
 
         self.setMouseTracking(True)
 
@@ -90,57 +140,88 @@ class NeuralBackgroundWidget(QWidget):
         """Создает одну частицу со случайными параметрами."""
         size = random.uniform(2, 4.5)
         return Particle(
-            pos=QPointF(
-                self.width() * (0.05 + 0.9 * self._rand_float()),
-                self.height() * (0.05 + 0.9 * self._rand_float())
-            ),
-            vel=QPointF(
-                self._rand_float(-self.BASE_SPEED, self.BASE_SPEED),
-                self._rand_float(-self.BASE_SPEED, self.BASE_SPEED)
-            ),
+            x=self.width() * (0.05 + 0.9 * self._rand_float()),
+            y=self.height() * (0.05 + 0.9 * self._rand_float()),
+            vx=self._rand_float(-self.BASE_SPEED, self.BASE_SPEED),
+            vy=self._rand_float(-self.BASE_SPEED, self.BASE_SPEED),
             size=size,
             parallax_factor=random.uniform(0.1, 0.5),
             mass=size*size
         )
 
+    # Половина окрестности 3x3: сама ячейка и 4 соседа "вперед".
+    # Обход только этих смещений дает каждую пару ячеек ровно один раз.
+    _HALF_NEIGHBORHOOD = ((1, 0), (-1, 1), (0, 1), (1, 1))
+
     def _create_spatial_grid(self) -> None:
         """
-        Перестраивает пространственную сетку для быстрой проверки столкновений.
+        Перестраивает пространственную сетку по текущим позициям частиц.
 
-        Этот метод вызывается в каждом кадре, чтобы обновить положение частиц
-        в сетке, что позволяет избежать O(n^2) проверок, ограничивая их
+        Этот метод вызывается в каждом кадре после перемещения частиц,
+        что позволяет избежать O(n^2) проверок, ограничивая их
         только соседними ячейками.
         """
-        self.grid.clear()
+        grid = self.grid
+        grid.clear()
         if not self.grid_cell_size or not self.particles:
             return
             
+        cell_size = self.grid_cell_size
         for i, p in enumerate(self.particles):
-            cell_x = int(p.pos.x() / self.grid_cell_size)
-            cell_y = int(p.pos.y() / self.grid_cell_size)
-            
-            if (cell_x, cell_y) not in self.grid:
-                self.grid[(cell_x, cell_y)] = []
-            self.grid[(cell_x, cell_y)].append(i)
-
-    def _get_adjacent_indices(self, cell_x: int, cell_y: int) -> List[int]:
+            cell = (int(p.x // cell_size), int(p.y // cell_size))
+            bucket = grid.get(cell)
+            if bucket is None:
+                grid[cell] = [i]
+            else:
+                bucket.append(i)
+
+    def _find_neighbor_pairs(self) -> List[tuple[int, int, float]]:
         """
-        Возвращает список индексов частиц из указанной ячейки и 8 соседних.
+        Находит все пары частиц, расстояние между которыми меньше дистанции разрыва связи.
 
-        Args:
-            cell_x: Координата X ячейки.
-            cell_y: Координата Y ячейки.
+        Сетка перестраивается один раз за кадр, а каждая пара ячеек
+        проверяется ровно один раз, так что число проверок расстояния
+        растет примерно как 9·N / 2 вместо N^2 / 2.
 
         Returns:
-            Список индексов частиц, находящихся в соседних ячейках.
+            Список кортежей (i, j, dist_sq) с i < j.
         """
-        indices = []
-        for dx in range(-1, 2):
-            for dy in range(-1, 2):
-                neighbor_cell = (cell_x + dx, cell_y + dy)
-                if neighbor_cell in self.grid:
-                    indices.extend(self.grid[neighbor_cell])
-        return indices
+        self._create_spatial_grid()
+
+        particles = self.particles
+        grid = self.grid
+        break_distance_sq = self.break_distance_sq
+        pairs: List[tuple[int, int, float]] = []
+
+        for (cell_x, cell_y), bucket in grid.items():
+            # Пары внутри одной ячейки
+            bucket_len = len(bucket)
+            for a in range(bucket_len):
+                i = bucket[a]
+                p1 = particles[i]
+                x1, y1 = p1.x, p1.y
+                for b in range(a + 1, bucket_len):
+                    j = bucket[b]
+                    p2 = particles[j]
+                    dist_sq = (x1 - p2.x)**2 + (y1 - p2.y)**2
+                    if dist_sq < break_distance_sq:
+                        pairs.append((i, j, dist_sq) if i < j else (j, i, dist_sq))
+
+            # Пары с соседними ячейками
+            for dx, dy in self._HALF_NEIGHBORHOOD:
+                other = grid.get((cell_x + dx, cell_y + dy))
+                if other is None:
+                    continue
+                for i in bucket:
+                    p1 = particles[i]
+                    x1, y1 = p1.x, p1.y
+                    for j in other:
+                        p2 = particles[j]
+                        dist_sq = (x1 - p2.x)**2 + (y1 - p2.y)**2
+                        if dist_sq < break_distance_sq:
+                            pairs.append((i, j, dist_sq) if i < j else (j, i, dist_sq))
+
+        return pairs
 
     def init_particles(self) -> None:
         """
@@ -153,8 +234,8 @@ class NeuralBackgroundWidget(QWidget):
         h = self.height()
         r = self.CORNER_RADIUS
         self.corner_centers = [
-            QPointF(r, r), QPointF(w - r, r),
-            QPointF(w - r, h - r), QPointF(r, h - r)
+            (r, r), (w - r, r),
+            (w - r, h - r), (r, h - r)
         ]
         
         self.particles = [self._create_particle() for _ in range(self.PARTICLE_COUNT)]
@@ -175,13 +256,17 @@ class NeuralBackgroundWidget(QWidget):
         1. Обновление позиций частиц и отталкивание от курсора.
         2. Определение "идеальных" соединений с помощью стабильного алгоритма.
         3. Обработка упругих столкновений частиц друг с другом.
-        4. Обработка столкновений со стенами и углами.
-        5. Ограничение скорости частиц в заданном диапазоне.
+        4. Обработка столкновений со стенами и углами и ограничение скорости
+           частиц (объединены в один проход по частицам).
         """
         if not self.is_animation_running:
             return
 
-        self.time_counter += 0.03
+        # Во сколько раз прошедшее время больше эталонного шага
+        elapsed_ms = self.frame_clock.restart() if self.frame_clock.isValid() else self.SIMULATION_STEP_MS
+        frame_scale = min(elapsed_ms / self.SIMULATION_STEP_MS, self.MAX_FRAME_SCALE)
+
+        self.time_counter += 0.03 * frame_scale
         
         # --- Кэширование атрибутов для оптимизации ---
         particles = self.particles
@@ -192,41 +277,37 @@ class NeuralBackgroundWidget(QWidget):
         w, h, r = self.width(), self.height(), self.CORNER_RADIUS
         
         # --- Этап 1: Обновление позиций и отталкивание от мыши ---
-        self._create_spatial_grid()
-        
-        mouse_pos = self.mouse_pos
-        repulsion_radius_sq = self.REPULSION_RADIUS**2
-        repulsion_strength = self.REPULSION_STRENGTH
+        mouse_x, mouse_y = self.mouse_pos.x(), self.mouse_pos.y()
+        is_mouse_inside = mouse_x > 0
+        repulsion_radius = self.REPULSION_RADIUS
+        repulsion_radius_sq = repulsion_radius**2
+        repulsion_strength = self.REPULSION_STRENGTH * frame_scale
         
         for p in particles:
-            p.pos += p.vel
-            if mouse_pos.x() > 0:
-                vec_from_mouse = p.pos - mouse_pos
-                dist_sq = vec_from_mouse.x()**2 + vec_from_mouse.y()**2
+            x = p.x + p.vx * frame_scale
+            y = p.y + p.vy * frame_scale
+            if is_mouse_inside:
+                dx, dy = x - mouse_x, y - mouse_y
+                dist_sq = dx * dx + dy * dy
                 if dist_sq < repulsion_radius_sq and dist_sq > 1e-6:
                     dist = math.sqrt(dist_sq)
-                    repulsion_force = (1 - dist / self.REPULSION_RADIUS) * repulsion_strength
-                    p.pos += (vec_from_mouse / dist) * repulsion_force
+                    # Сила отталкивания, уже поделенная на dist для нормировки вектора
+                    repulsion_force = (1 - dist / repulsion_radius) * repulsion_strength / dist
+                    x += dx * repulsion_force
+                    y += dy * repulsion_force
+            p.x = x
+            p.y = y
 
         # --- Этап 2: Стабильный алгоритм определения соединений ---
         
-        # 2.1. Для каждой частицы находим всех соседей в радиусе
+        # 2.1. Для каждой частицы находим всех соседей в радиусе.
+        # Найденные пары переиспользуются на этапе столкновений.
+        neighbor_pairs = self._find_neighbor_pairs()
         particle_neighbors = [[] for _ in range(particle_count)]
-        break_distance_sq = self.break_distance_sq
 
-        for i in range(particle_count):
-            pos1 = particles[i].pos
-            cell_x = int(pos1.x() / self.grid_cell_size)
-            cell_y = int(pos1.y() / self.grid_cell_size)
-            for j_idx in self._get_adjacent_indices(cell_x, cell_y):
-                if i >= j_idx: continue
-                
-                pos2 = particles[j_idx].pos
-                dist_sq = (pos1.x() - pos2.x())**2 + (pos1.y() - pos2.y())**2
-                
-                if dist_sq < break_distance_sq:
-                    particle_neighbors[i].append((dist_sq, j_idx))
-                    particle_neighbors[j_idx].append((dist_sq, i))
+        for i, j_idx, dist_sq in neighbor_pairs:
+            particle_neighbors[i].append((dist_sq, j_idx))
+            particle_neighbors[j_idx].append((dist_sq, i))
 
         # 2.2. Каждая частица выбирает, кому "предложить" дружбу
         active_connections = self.active_connections
@@ -262,7 +343,7 @@ class NeuralBackgroundWidget(QWidget):
         
         # 2.4. Обновляем непрозрачность (плавное появление/исчезновение)
         next_active_connections = {}
-        fade_speed = self.FADE_SPEED
+        fade_speed = self.FADE_SPEED * frame_scale
 
         for pair, dist_sq in ideal_connections.items():
             current_opacity, _ = active_connections.get(pair, (0.0, 0.0))
@@ -278,64 +359,67 @@ class NeuralBackgroundWidget(QWidget):
         self.active_connections = next_active_connections
 
         # --- Этап 3: Обработка столкновений частиц ---
-        for i in range(particle_count):
+        # Дистанция столкновения много меньше дистанции разрыва связи,
+        # поэтому кандидатов достаточно взять из уже найденных пар.
+        for i, j_idx, _ in neighbor_pairs:
             p1 = particles[i]
-            
-            cell_x = int(p1.pos.x() / self.grid_cell_size)
-            cell_y = int(p1.pos.y() / self.grid_cell_size)
-            adjacent_indices = self._get_adjacent_indices(cell_x, cell_y)
+            p2 = particles[j_idx]
+            dx, dy = p1.x - p2.x, p1.y - p2.y
+            dist_sq = dx * dx + dy * dy
+            min_dist = p1.size + p2.size
 
-            for j_idx in adjacent_indices:
-                if j_idx <= i: continue
+            if dist_sq < min_dist**2 and dist_sq > 1e-9:
+                dist = math.sqrt(dist_sq)
                 
-                p2 = particles[j_idx]
-                vec_diff = p1.pos - p2.pos
-                dist_sq = vec_diff.x()**2 + vec_diff.y()**2
-                min_dist = p1.size + p2.size
-
-                if dist_sq < min_dist**2 and dist_sq > 1e-9:
-                    dist = math.sqrt(dist_sq)
-                    
-                    overlap = 0.5 * (min_dist - dist)
-                    vec_diff_norm = vec_diff / dist
-                    p1.pos += vec_diff_norm * overlap
-                    p2.pos -= vec_diff_norm * overlap
-
-                    normal = vec_diff_norm
-                    tangent = QPointF(-normal.y(), normal.x())
-
-                    v1n = QPointF.dotProduct(p1.vel, normal)
-                    v1t = QPointF.dotProduct(p1.vel, tangent)
-                    v2n = QPointF.dotProduct(p2.vel, normal)
-                    v2t = QPointF.dotProduct(p2.vel, tangent)
-
-                    m1, m2 = p1.mass, p2.mass
-                    v1n_new = (v1n * (m1 - m2) + 2 * m2 * v2n) / (m1 + m2)
-                    v2n_new = (v2n * (m2 - m1) + 2 * m1 * v1n) / (m1 + m2)
-
-                    p1.vel = v1n_new * normal + v1t * tangent
-                    p2.vel = v2n_new * normal + v2t * tangent
-
-        # --- Этап 4: Обработка столкновений со стенами ---
+                # Нормаль столкновения и касательная к ней
+                nx, ny = dx / dist, dy / dist
+                tx, ty = -ny, nx
+
+                overlap = 0.5 * (min_dist - dist)
+                p1.x += nx * overlap
+                p1.y += ny * overlap
+                p2.x -= nx * overlap
+                p2.y -= ny * overlap
+
+                v1n = p1.vx * nx + p1.vy * ny
+                v1t = p1.vx * tx + p1.vy * ty
+                v2n = p2.vx * nx + p2.vy * ny
+                v2t = p2.vx * tx + p2.vy * ty
+
+                m1, m2 = p1.mass, p2.mass
+                v1n_new = (v1n * (m1 - m2) + 2 * m2 * v2n) / (m1 + m2)
+                v2n_new = (v2n * (m2 - m1) + 2 * m1 * v1n) / (m1 + m2)
+
+                p1.vx = v1n_new * nx + v1t * tx
+                p1.vy = v1n_new * ny + v1t * ty
+                p2.vx = v2n_new * nx + v2t * tx
+                p2.vy = v2n_new * ny + v2t * ty
+
+        # --- Этап 4: Столкновения со стенами и ограничение скорости ---
+        # Оба шага работают с одной частицей независимо от остальных,
+        # поэтому выполняются за один проход.
         wall_rebound_factor = self.WALL_REBOUND_FACTOR
         corner_centers = self.corner_centers
+        min_sq, max_sq = self.min_speed_sq, self.max_speed_sq
+        min_speed, max_speed = self.MIN_SPEED, self.MAX_SPEED
+
         for p in particles:
-            px, py = p.pos.x(), p.pos.y()
-            ps = p.size
+            px, py, ps = p.x, p.y, p.size
+            x, y, vx, vy = px, py, p.vx, p.vy
 
             # Столкновения с границами
             if px - ps < 0 and r <= py <= h - r:
-                p.pos.setX(ps)
-                if p.vel.x() < 0: p.vel.setX(-p.vel.x() * wall_rebound_factor)
+                x = ps
+                if vx < 0: vx = -vx * wall_rebound_factor
             elif px + ps > w and r <= py <= h - r:
-                p.pos.setX(w - ps)
-                if p.vel.x() > 0: p.vel.setX(-p.vel.x() * wall_rebound_factor)
+                x = w - ps
+                if vx > 0: vx = -vx * wall_rebound_factor
             if py - ps < 0 and r <= px <= w - r:
-                p.pos.setY(ps)
-                if p.vel.y() < 0: p.vel.setY(-p.vel.y() * wall_rebound_factor)
+                y = ps
+                if vy < 0: vy = -vy * wall_rebound_factor
             elif py + ps > h and r <= px <= w - r:
-                p.pos.setY(h - ps)
-                if p.vel.y() > 0: p.vel.setY(-p.vel.y() * wall_rebound_factor)
+                y = h - ps
+                if vy > 0: vy = -vy * wall_rebound_factor
 
             # Углы
             center = None
@@ -345,57 +429,76 @@ class NeuralBackgroundWidget(QWidget):
             elif px < r and py > h - r: center = corner_centers[3]
 
             if center is not None:
-                vec_to_center = p.pos - center
-                dist = math.sqrt(vec_to_center.x()**2 + vec_to_center.y()**2)
+                cx, cy = center
+                dx, dy = x - cx, y - cy
+                dist = math.sqrt(dx * dx + dy * dy)
                 
                 if dist > r - ps and dist > 1e-6:
-                    normal = vec_to_center / dist
-                    vel_dot_normal = QPointF.dotProduct(p.vel, normal)
+                    nx, ny = dx / dist, dy / dist
+                    vel_dot_normal = vx * nx + vy * ny
                     if vel_dot_normal > 0:
-                        p.vel = p.vel - (1 + wall_rebound_factor) * vel_dot_normal * normal
-                    p.pos = center + normal * (r - ps)
+                        vx -= (1 + wall_rebound_factor) * vel_dot_normal * nx
+                        vy -= (1 + wall_rebound_factor) * vel_dot_normal * ny
+                    x = cx + nx * (r - ps)
+                    y = cy + ny * (r - ps)
 
-        # --- Этап 5: Ограничение скорости ---
-        min_sq, max_sq = self.min_speed_sq, self.max_speed_sq
-        min_speed = self.MIN_SPEED
-        
-        for p in particles:
-            vel = p.vel
-            speed_sq = vel.x()**2 + vel.y()**2
-            
+            # Ограничение скорости
+            speed_sq = vx * vx + vy * vy
             if speed_sq < min_sq:
                 if speed_sq < 1e-9:
                     angle = random.uniform(0, 2 * math.pi)
-                    vel.setX(min_speed * math.cos(angle))
-                    vel.setY(min_speed * math.sin(angle))
+                    vx = min_speed * math.cos(angle)
+                    vy = min_speed * math.sin(angle)
                 else:
                     scale = min_speed / math.sqrt(speed_sq)
-                    p.vel *= scale
+                    vx *= scale
+                    vy *= scale
             elif speed_sq > max_sq:
-                scale = self.MAX_SPEED / math.sqrt(speed_sq)
-                p.vel *= scale
+                scale = max_speed / math.sqrt(speed_sq)
+                vx *= scale
+                vy *= scale
+
+            p.x, p.y, p.vx, p.vy = x, y, vx, vy
 
         self.update()
 
     def start_animation(self):
-        """Запускает таймер анимации, если он еще не запущен."""
+        """Запускает анимацию, если она еще не запущена."""
         if not self.is_animation_running:
             self.is_animation_running = True
             self.time_counter = 0 
-            self.animation_timer.start(30)
+            self.frame_clock.start()
+            # Первый кадр запускает цепочку frameSwapped -> update_particles
+            self.update()
 
     def stop_animation(self):
-        """Останавливает таймер анимации."""
-        if self.is_animation_running:
-            self.is_animation_running = False
-            if self.animation_timer.isActive():
-                self.animation_timer.stop()
+        """Останавливает анимацию: следующий кадр уже не будет запрошен."""
+        self.is_animation_running = False
 
-    def paintEvent(self, event: QPaintEvent) -> None:
+    def _on_frame_swapped(self) -> None:
+        """Выполняет шаг симуляции после показа очередного кадра."""
+        if not (self.is_animation_running and self.isVisible()):
+            return
+        # Кадр пришел раньше очередного шага: только поддерживаем цепочку кадров,
+        # а накопленное время войдет в масштаб следующего шага.
+        if self.frame_clock.isValid() and self.frame_clock.elapsed() < self.min_step_interval_ms:
+            self.update()
+            return
+        self.update_particles()
+
+    def initializeGL(self) -> None:
+        """Контекст OpenGL не требует ручной настройки: рисуем через QPainter."""
+
+    def paintGL(self) -> None:
         """Отрисовывает фон, частицы и переливающиеся в синей гамме линии."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
+        # Framebuffer не очищается между кадрами: сбрасываем углы в прозрачность.
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(self.rect(), Qt.GlobalColor.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+
         rounded_rect_path = QPainterPath()
         rounded_rect_path.addRoundedRect(QRectF(self.rect()), self.CORNER_RADIUS, self.CORNER_RADIUS)
 
@@ -413,10 +516,18 @@ class NeuralBackgroundWidget(QWidget):
         time_counter = self.time_counter
         line_pen = QPen(self.LINE_BASE_COLOR, 1)
 
+        base_hue = 0.62
+        hue_range = 0.08
+        hue_steps = self.LINE_HUE_STEPS - 1
+        alpha_step = self.LINE_ALPHA_STEP
+
+        # Группируем линии по квантованному цвету (оттенок, прозрачность)
+        line_batches: Dict[tuple[int, int], List[QLineF]] = {}
+
         for (i, j), (opacity, dist_sq) in active_connections.items():
             if opacity > 0:
-                pos1 = particles[i].pos
-                pos2 = particles[j].pos
+                p1 = particles[i]
+                p2 = particles[j]
 
                 # Базовая альфа зависит от расстояния
                 base_alpha = 90 * (1 - dist_sq / connection_distance_sq)
@@ -424,30 +535,36 @@ class NeuralBackgroundWidget(QWidget):
                 final_alpha = int(base_alpha * opacity)
 
                 if final_alpha > 0:
-                    oscillation = math.sin(time_counter + pos1.x() * 0.01)
-
-                    base_hue = 0.62
-                    hue_range = 0.08
-                    hue_value = base_hue + (oscillation * hue_range)
-
-                    current_color = QColor.fromHslF(hue_value, 0.8, 0.6, final_alpha / 255.0)
-                    
-                    line_pen.setColor(current_color)
-                    painter.setPen(line_pen)
-                    painter.drawLine(pos1, pos2)
+                    oscillation = math.sin(time_counter + p1.x * 0.01)
+                    hue_key = round((oscillation + 1) * 0.5 * hue_steps)
+                    alpha_key = (final_alpha + alpha_step - 1) // alpha_step
+
+                    line = QLineF(p1.x, p1.y, p2.x, p2.y)
+                    batch = line_batches.get((hue_key, alpha_key))
+                    if batch is None:
+                        line_batches[(hue_key, alpha_key)] = [line]
+                    else:
+                        batch.append(line)
+
+        for (hue_key, alpha_key), lines in line_batches.items():
+            hue_value = base_hue + ((hue_key / hue_steps) * 2 - 1) * hue_range
+            alpha = min(alpha_key * alpha_step, 255) / 255.0
+            line_pen.setColor(QColor.fromHslF(hue_value, 0.8, 0.6, alpha))
+            painter.setPen(line_pen)
+            painter.drawLines(lines)
         
         painter.setPen(Qt.PenStyle.NoPen)
         for p in particles:
-            oscillation = math.sin(time_counter * 0.5 + p.pos.y() * 0.01)
+            oscillation = math.sin(time_counter * 0.5 + p.y * 0.01)
             base_hue = 0.62
             hue_range = 0.08
             particle_hue = base_hue + (oscillation * hue_range)
             
             particle_color = QColor.fromHslF(particle_hue, 0.9, 0.7, 0.8)
             painter.setBrush(particle_color)
-            painter.drawEllipse(p.pos, p.size, p.size)
+            painter.drawEllipse(QPointF(p.x, p.y), p.size, p.size)
             
-    def resizeEvent(self, event: QResizeEvent) -> None:
+    def resizeGL(self, w: int, h: int) -> None:
         """Пересоздает частицы при изменении размера виджета."""
         self.init_particles()
 
@@ -458,18 +575,12 @@ class NeuralBackgroundWidget(QWidget):
         """
         super().showEvent(event)
         self.init_particles()
-        # Если анимация должна была работать, но таймер был остановлен (например,
-        # через hideEvent), мы его перезапускаем.
-        if self.is_animation_running and not self.animation_timer.isActive():
-            self.animation_timer.start(30)
-
-    def hideEvent(self, event: QShowEvent) -> None:
-        """
-        Приостанавливает анимацию при скрытии виджета для экономии ресурсов.
-        """
-        super().hideEvent(event)
-        if self.animation_timer.isActive():
-            self.animation_timer.stop()
+        # Скрытый виджет не рисуется, поэтому цепочка кадров прерывается
+        # сама. После показа сбрасываем часы, чтобы время простоя не
+        # превратилось в один большой скачок частиц.
+        if self.is_animation_running:
+            self.frame_clock.restart()
+            self.update()
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         """Обновляет позицию курсора для эффекта параллакса."""
@@ -484,7 +595,7 @@ class NeuralBackgroundWidget(QWidget):
         # Конвертируем QPoint в QPointF для совместимости с физикой частиц
         self.mouse_pos = QPointF(pos)
         # Не вызываем update() здесь, чтобы не перегружать рендер,
-        # так как он и так вызывается по таймеру.
+        # так как он и так запрашивается после каждого показанного кадра.
 
     def _update_animation(self):
         if not self.is_visible or not self.particles:
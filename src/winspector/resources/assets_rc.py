@@ -1,212 +1,1916 @@
 # Resource object code (Python 3)
 # Created by: object code
-# Created by: The Resource Compiler for Qt version 6.4.3
+# Created by: The Resource Compiler for Qt version 6.12.0
 # WARNING! All changes made in this file will be lost!
 
 from PyQt6 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x14\x95\
+\x00\x00j\xc7\
+\x00\
+\x00\x01\x00\x01\x00\x00\x00\x00\x00\x01\x00 \x00\xb1j\x00\
+\x00\x16\x00\x00\x00\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\
+\x0dIHDR\x00\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\
+\x00\x00\x5cr\xa8f\x00\x00jxIDATx\x9c\
+\xec\xbd\x07\x98ee\x91>>\x1d\xee\xed{;\xe7x\
+s\xe8\x9cs\xce9\xcfL\xf7LwO\x0e\xcc\x0c\x03\
+\x03L\x02\x86\xac(\x22\xa0 i$\x8a(\xb2\xca\x22\
+JP\xd6\x80\xbaF\x98<Du\xd7u\xcd\xaek\x00\
+u\x81\xe9\xeeS\xbf\xaa\xfa\xbe\x13n\xf7\xb0\xe1\xff\xdf\
+\xdd\xbb\x03\xa7\x9e\xe7{\xce\xb9\xa7o\xea\xee\xf3\xbe\xf5\
+V}\xf5\xd5\xb7b\x85i\xa6\x99f\x9ai\xa6\x99f\
+\x9ai\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\x99f\x9a\
+i\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\x99f\x9ai\
+\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\
+\x99f\x9ai\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\x99\
+f\x9ai\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\x99f\
+\x9ai\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\x99f\x9a\
+i\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\x99f\x9ai\
+\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\
+\x99f\x9ai\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\x99\
+f\x9ai\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\x99f\
+\x9ai\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\x99f\x9a\
+i\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\x99f\x9ai\
+\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\x99f\x9ai\xa6\
+\x99f\xda\xff\xa0\xd5\x0d\xedH\x0e\xb4\xcc\x96\x95\x0e\xec\
+\xaam\x9f\xb9\xa2\xb3w\xf6\xd0L\xf7\xec\x15\x1b;g\
+\xaf\xd8\xdc1{\xd5\xc6\xb6\xe9\x83\x1b[V\x1fXY\
+7rAg\xb0y]\xad\xb7ve\xb0k\xea\x22K\
+\xb8\xbf\xb7i\xa6\x99\xf6_\xb0\xfa\x81\xad\x89m\xd3\x97\
+\xb6L\xec\xbae\xfb\xf8\xae\x9b\xee\x1b\xdb\xf1\xe1\xbf[\
+\xb5\xfb\x967f\xf7\xdd\xbd\xb8\xf9\xd0\xfd\xca\xa6\xcb\xef\
+_\xdcp\xe9=\xca\xdc\x81\xc3\x0bs\x07\xee^\x98\xd9\
+w\xd7\xfc\xcc\xfe\xbb\x16f\xf7\xe1\xc0\xe3\xcc\xde;\x95\
+5\x97\xdc\xa1\xac\xba\xe0\xa3\x0b\x03\x9b\xdf\xaf\xf4\xac\xbb\
+\xf2\x8f\x1dk/{\xbac\xcd\xa5\x1f\xa8\x1d\xdd\xb3\xde\
+S3YS\xd5\xb3\xd1\x16\xee\xdf\xd34\xd3LCk\
+\x1a\xbb \xaew\xc3\xb5=\x13\xe7\xdfr\xeb\xe4\x85\x1f\
+\xfd\xc7\xb9\x83\xf7*\x1b\x0e=\x08s\x07?\x0e\xeb/\
+\xbb\x0ff\x0e\x1c\x86\xc9\xdd\x1f\x81\x91\xed\x1f\x82\xfe\xcd\
+\xd7\x03>\x17\xba\xe6\xae\x84\xb65\x97A\xf3\xea\xfd\xd0\
+\xb8r/4N\xee\x85&<\xb6N_\x8a\xd7/\x87\
+\xce\xd9+\xa1{\xfd\xd5\xf8\xdc\xeb`h\xdb\x0d0\xbe\
+\xfb\xa30\xba\xebf\x18>\xef\xc30\xb2\xf3&\xa5}\
+\xf6\x9a\xc5\xc6\xc9}\xdf\xaf\x1d\xdes]\xb0ev\xd0\
+_3\x11\x1f\xee\xbf\x83i\xa6\xbdg\xacvhg\xe6\
+\xaa\x0bo\xdd\xb2\xe6\xe2\xdb\xbf\xb9\x0e=\xf9\x96+\x1f\
+\x5c\xdct\xc5\x83\x8bk/\xb9}qx\xfb\x07\x95\xae\
+\xd9CP9p\x1ex\xeaV\x83\xb3f\x12\xbc\x8d\xd3\
+\x80\xf2\x1f\x82-s\x10l\x15G\xf1x\x06\x02\xcd\xb3\
+8\x8cG1\xf8\xb9x\xcd\xdb\xb0\x06\x5c\xd5\x93x>\
+\x03\x95\x83\xbb\x90(\xf6)mk\x0fA\xdf\xc6\xeb\x14\
+T\x08\x8b\x03\x9b\xaf_l^y`\xa1v\xf4\x82/\
+U\x0c\xec\x5c\xef\xae\x1cq\x84\xfb\xefc\x9ai\xef:\
+\xab\x1f\xde\x15?r\xde\x87\xa7W^x\xeb\xd76\x5c\
+\xfe\xc0\xe2\x86\xcb\xef\x03\x94\xf1\x0aJ|@\xc9\x0f\xbe\
+\x86i\x04\xeb\x14\x03\xfb?\x1e\x82\x00\xfc\xfa\xb9B\x04\
+@\x8f\xfd\xcdb\x10\x09\xf0y\x13\x0d:_\x0b>:\
+6\xcd(\xfe\xa6\xb5L.\xf4\x1eUC\xbbQE\x1c\
+\x80\xb6\xd9\xab\x90\x18\xae\xa4\xf3\xc5\xb2\xfe]\xcf\xe0\xf7\
+\x19\x0e6\xac\xb6\x86\xfb\xeff\x9ai\xe7\xb45N^\
+\x9c5\xb5\xe7\xb6\xcb\x11\xf0\x7f\xdaz\xe5\x83\xca\xa6C\
+\x0f(\x13;>\xa4T\x0d\xee\x04O\xedJ\xc8o\x9d\
+\xc3!\xbd\xbb\x01\xdc*\xc0\xfd\x86\xc7\xf2\x9a\x12\x08y\
+\xde\x1ch\xe0\x97\xe7\x1a\xf8\xf1\x9a\x8f\xcfg$\x09\xcc\
+2\x09h\xd7h4\xae\xe5\xe1\xad\x9b\x82\xb2\xde\xedP\
+?v\x91\xd22}\x99\xd2\xbe\xf6\xf2y$\x87_\x97\
+tm\xba>\xa7\xa873\xdc\x7fG\xd3L;\xa7\xac\
+k\xddU\xc5k\xf6\xde\xf9\xe0\x86C\x0f\x90\xbcW\xa6\
+.\xba\x0dZV\xedg\xcf\xcb@oU\x81\xac\x82y\
+N\x07u+\x8d\xb9\x102\xe0k\x86\xe7\xe3{(\xc1\
+Pb\xd0@O?\x0fU\x03\xb3\x12\xf0\xb3\x861c\
+8\x1a\x06\xaa\x03_\xe3\x1a\xa8\x18\xd8\x05u\x93\xfb\xa1\
+a\xd5\xa5J\xf9\xe0\x9e3\x85\xed\x1bo\xce-\x19v\
+\x85\xfb\xefj\x9ai\xff\xa7\xadk\xf6\x0a7J\xfb\x1b\
+\xb7^\xfd\xc9\xf9mW\x7fbqr\xd7MJe\xff\
+y\x8a\x1fA\x15\x5c\xe2\xcdC@\xdd:\x1bJ\x02\xcb\
+\xd4\xc0\x5c(Y\xb4\xcei$\xe1\xd7\xc2\x81Y\x11\x0e\
+\xb4\xa8\xa0_\x0a\xf8\x99\xd0\xc7M\xb3\x9a:\x08Q\x0a\
+H\x024\xbc\xf5\xd3\x90\xdf\xb6A\xa9\x1e\xbd\x08\x1aV\
+\xeeW*\x86v+\x05\xad\xeb\xee\xcd\xca\xef\xce\x08\xf7\
+\xdf\xd94\xd3\xfeOY\xc9\xc0\x8e\xe4\xe9\x8b\xef8\xb8\
+\xf9\xaa\x87\x166\xa3\xd4\x9f\xd8u\x13\x14\xb4\xadg \
+\x19\xe5zP\x02\x98\x8fK\xbc\xba\xfex\xce\x00\xe8\xb9\
+\xe5d!\xc3\x85`\xab\xfa3\x03\x09h\xe1\xc0R\xe0\
+\x1b<\xbe\x0c\x0d8\x1ch2\x86\x08\x22W\xa0\x92\x80\
+O\x0eo\x03\x12A\xeb:(\x1f\xdc\x0dU\xa3\x17+\
+\xf9]\xdb\xff\xe2\xae]}\x91\xabl\xd8\x1e\xee\xbf\xbb\
+i\xa6\x85\xddV\xef\xbe\xa5\x0bA\xff\xdb\xedW\x7fr\
+q\xf5\x85\xb7*\x95\x03;D&^z\xe9\x10\xd0\x1b\
+\x86\x11\xc0\x01#\xa0\x97%\xfaB\xa5\xbe|\xbd\xa2\xaa\
+\x86\x10e\xc1\x92\x7fN'\x83wP\x01\xbe\xe6\xa5\xf9\
+\x01\x83\x22\xd0\xc8\x81\xc2\x81\xb5ZX@\x89J\x22\x9e\
+\x8a\xa1\x0b\xa0jd\xcfb~\xdb\xc6\x1f;+G\xc6\
+\xc2\xfd\xf77\xcd\xb4\xb0X\xfb\xf4\xfe\xd4\xb5\xfb\xee\xfa\
+\xf2y\xd7}ZYw\xe9=\xd0:uP\xf15\xac\
+\x91\xd3u\x06\xa9\xbeT\xbe\x1b\xaf\xab\xd2\xbfuN\xd1\
+\x09@\xbf\xae\x92\x08\xfd\x9c\xc9\x84\x12\x86m\xe2:\x0f\
+\xa3\x22\xd0\xc6\x92\x9cB\xb3\x9a\x1c\x94$\xf2N\xb9\x00\
+\x15\xf4\xc6c\xe3\x0c\x93\x00\x0fU\x11`hP\xd4\xb5\
+\x15\xca\x87\xf7@\xe9\xe0\x05\x8b\xce\x9a\xa9/f\x04\xda\
+\x93\xc3\xfd\xff0\xcd\xb4\xff5[u\xc1\xad\xab7_\
+\xf1\xe0/\xb7]\xfdIe\xd5\xf97s\x8c\x9f\x7f\x16\
+/\x1f\xea\xd9\x97(\x80\xb3<\x0e.#\x89Y\x8c\xc3\
+\xd7AA\xc7\x06\x060M\x15z\xeaV\xf2\xdc\xbe\xb3\
+j\x02\x1c4*\xc5\xd1E\x03\xaf{jW\xb1l\xa7\
+\xf7*h\xdf\x80\xaf_\xaf+\x88\x90\xa4\xa0!\x040\
+>6\xc8\x7f\x01~I\x02M\x062\xc0\xdf\x97f\x0f\
+J\xfbv(\xe5C\x17.\xfaZ6\xfc\x22\xb7d\xa0\
+5\xdc\xff\x17\xd3L\xfb\x1f\xb5\x9a\xd1=q\xb3\xfb\x0f\
+\x7fx\xdb5\x0f+\x1b\x0f=\x00U\x03;e\x9c/\
+<\xad&\xc7[\xe7\x96y|\x7f\x8b\x9e\xb4\xd3\xc3\x00\
+\xe1\xb1\xf3U\x8f\xde:\x83\xa0]\x07\xbe\xfa)\x04\xf6\
+8d\x15\x0fB\xbc\xbb\x15\x222kpTCDN\
+\x1dD\xe46@\xa4\xa3\x11\x22h\xe45\x84\x8e\xdcz\
+|\x0e\x8e,|~F%\x8e*\xb0;\x9b \xa3x\
+\x00\xc9a\x82\xdf\x97\x08%\xd02\xa3\xf8e\xd1\x90\xbf\
+\xc9H\x00\x06\xf0\x1b\x94\x80\x17\x01\xef\x95\xc0\xa7\xe2\x22\
+/)\x01\x9a>$\xc5\xd3\xb6\x01\x8a\xfbw+\xfe\xce\
+m\x8a\xa3z\xd5\xdd\xce\xb2\x0137`\xda\xbb\xcfz\
+f\xae\xcc\xdat\xe8\x81S;\xae}xqr\xd7\xcd\
+\x10lZ\xa3U\xdc-\xf5\xf0\xfee\x8f\xe7\xb49\xfb\
+\x10\xe9/=<yf\xf2\xe4)\xc1n\x88\xca\xaa\x86\
+\x15\xd9\x08\xf4\xbcF\x88TA\x9dM\x04P\x85\x80\xae\
+\x80\x88\xf42\x88H-\x81\x88\x94bX\x91\x5c\xa4D\
+$\x17\x02\x8f\xd4b\xbe\xbe\x02\x7f\xbe\x22\x1d\x9f\x97\x85\
+\xcf\xcf\xa9\xe5\xf7Q\xc7\x8a\xecZ|\xffZH/\xec\
+\xe3*\xc3\x00U\x13\xb6\x08\x12\x084-W\x00\xde&\
+\xdd\xe33\xf8\xf9(\xc1\xcfy\x01A\x02\xf4\xb3\xe2\xde\
+\x9dP\xdc\xb7\x93B\x82\xe3\xe9\xae\xc6\xf4p\xff\xbfL\
+3\xed\xbf\xcdFw\xdc\xd8\xbc\xe9\x8a\x07~\xbe\xe5\xaa\
+O@\xf7\xecU\x0a\xdd\xf0\xcbd}\xb3\xac\xca\x0b\x89\
+\xfd\xf5P@#\x05\xad\xf8g\x16e\xfc8$z\xda\
+!2\xbbN\x89$\x90:\x9b!\x12=|\x04\x92@\
+Dj)\xacH\xf0\xc3\x8a8\x0f\xac\x88\xf7*+\x12\
+\x02\xb0\x22\x11\x1f\xab\xc7\xc4\x80~\x9e`\x1ct\xcd'\
+\xce\xe3\xf1\x18\x8b\xafO\x0a\x22y\x94\x0bR\xa0\xcfq\
+4\xe1\xb1\x89\x95Ej~\x0f\xb8\x91\x0c(\xd3\xaf\x82\
+\xdfo\x0c\x01D\x12PQA\x1f:\xe45$\x01w\
+\xdd4\xe4wl\x86\x82\x9e\x9d\xe0j\x98\xf9yZ\xa0\
+\xab,\xdc\xff7\xd3L\xfb\xffm#\xdb\xaeo\xdfv\
+\xf5Coo\xb9\xf2A\xa5\xa2w\x9b\xf4\xf8g\x078\
+yzcA\xce\xb2A\xa1\x00z\xd9\xb4\x82>!\xeb\
+I\xae\x13 \xd13G\xa4\x95\x11x\x15\x06\xbc\x0af\
+\x02yb\x90\x86\xc2\xc7\xa4|eEr\xbe\xb8F\xc7\
+$u\x04\xc5H\xc6\xe7%\x05\xd5\xd7\xc8\xb1\x84$\xe2\
+<\x0a]c5A\x0a\x81\xc9\xa0\x11,\xf8]\xb2J\
+\x868,8[.\xc0\x08z\x8f\xa6\x06\xd6h\x04\xa0\
+\x1e\xfdH\x84\x85\xdd\xdb\x15O\xf3\xfa\xb7\xd2\xf3;\xe7\
+\xc2\xfd\xff3\xcd\xb4\xff\xcf6\xbc\xfd\xc6-\xe8\xf5\x17\
+hu^i\xf7V9\x7foH\xd6\x19\xb2\xfd\xc6b\
+\x1du\x16 H\xf1v\xab\x88\xf1i\x1a\x8d\xbc-\xc7\
+\xe7\x04:\x92\xf6\x18\xa7\x0b`\xfa\xa4WW=\xb8\x1c\
+\x1a\xb0\x11\xe4\xc9\x05b\xa4\x18G\xe1\xf2\xa1>\x8f_\
+\x13\x5cN\x12*!$\x8a\xcf\x8d 2\xc0\xf0\x22\xd2\
+\xd9\x04\x91\xf8\xbd\xa20\xfc\xc8*\x1d\xe2\x90\xe0,J\
+ \x14\xf0\x86\xc7\x1e\x1a\xf2\x9c\x08$\xd8\xb9\x1d<\xad\
+\x9b\x94\xf4\xa2\xc1\x83\xe1\xfe?\x9af\xda\x7f\xd9\xc6\xce\
+\xfb\xf0\xf4\xe6\xab\x1eR6\x1f\xbaO\xe1\x8cz\xeb\xba\
+%r\xdf(\xffg\xf58\x7f\xe9\x5c?\xfe,9\xd0\
+\x8d^\xbe^\xc8n\xf2\xf6\x18\xb3\xaf\x88#Y\xef\xd7\
+=\xb5\x00\xa8\x12\x0av\x02u\x11\x0e\x8c\xf7Si`\
+\x8c\x9f&G:\x86\x08i\xa5\xe2\xc8q\x7f)D\xa4\
+\x97*\xfc\xb3T\xf9|zm*\x91\x82:\xe4\xfbj\
+\x84 \x89F\x86\x1a\x11i\xa5\x0a'\x18\xf1{bX\
+\x02\x99E\x83B\x11H\x02X\xea\xf5\x09\xf4|\xac7\
+\x90\x80\xe1z\xb0s\x8b\xe2i\xd9\xac\xa4\x05\xbb.\x0e\
+\xf7\xff\xd34\xd3\xfe\xd36\xb5\xe7\xb6\x8b\xb6^\xfd\xc9\
+\xc5\xb5\xfb\xef\x96u\xf7\xeb\x96\xcc\xeb\xaf{G\x89\x1f\
+\x94\xf3\xf5\x14S\xe7\x94\x0eCdV\x9d\x12\xe1h\x16\
+\x19\xfc\xe4\x22\x11\x97'\x1a\xbd\xbc\xf4\xd0\x9aw/\x12\
+\xe0M\x93\x09=\x8a\xdd3)\xa9W)Fv\x95\x18\
+$\xdf\xb3k 2\xa7F$\x09\xd5\xeb\x18\xe7\xaf\xc8\
+\xac\xe4\x11\x91Y\xce\xb1\xbf \x0a#1\x14\xea*\x81\
+??\xa0+\x03\x22\x02|M$\xe5#pX1<\
+pVOJ\x22\xd0\xbd\xbe\x9c\x11\xe0|\x88\x0e\xfc\xe9\
+\xd0c\xfd4\x04\xda\xb6\x80\xbby\xa3\x92\x12\xec5I\
+\xc0\xb4\xff\xfb6\xbc\xf5\xfa\xc1\xcdW}B\xd9x\xf9\
+\xbd\x0a\xc5\xfb\xf9\xec\xf9\xd7I\xd9\xff\x0e\xc0\xd7\x14\x81\
+\x98\xd6s\xd7\xad\x06kn#Jj\x04\x11e\xdf\x09\
+\xf8jL\x9f$e\xb9\xea\xe9C\x00\x8f^<\xa3L\
+\x00>\xbb\x1a=q\xbd\x90\xe6\xae\x16\x88\xf2v@\x94\
+\xbf\x1b\xa2\x02=8z!:\xd0'G\xafxL?\
+\xf3\xf7@\xb4\x0f\x8f\xbe.\x88\xa2\xe4\x22\xbe\x8ed=\
+\x93E\x16\x91B\x85\xb2\x22\xa3L\xaa\x07\x95\x10\x8a$\
+!\xe4\xeb!\x82\xaa\x082*\xf0\xf3\xf1=P\x11$\
+\xe3\xe7\xfa\x1a\xa7\xc1\xbb$\x1f\x80G\xc5\xe8\xf5\x19\xfc\
+\xa8\x08\xdcL\x02\xd3L\x02\xfe\xb6M\x8a\xa3a\x9d\x92\
+\x96\xdfye\xb8\xff\xbf\xa6\x99\xf6\x8e6\xb4\xe5\xfa\xf1\
+M\x87\x1ex{\xee\xe0a\x06\xbe\xa8\xb6[\x0ezc\
+F\xdfx=\x1f\xafS\x22\x8d\xe6\xea#\xf2\x9a9\xb6\
+\x16\x1e?h\x00\xbe\xf4\xf4\x0c\xfab\x01F\x04\xfc\x0a\
+\xf2\xee\x08T\xf6\xbc\xbeN\x04t/\x03:\xca\xd7#\
+\x8f\xdd\xdayt@^S\x8f\xef8\x88\x18\xc4\x91F\
+\xa4\xa7\x8d\x09\x89\xc8\x85>\x8f\xd4\x85 \x03\x9aB,\
+\x0a\x0d\x0fd\x021\x02\xcf#\x1d\x0dL\x04\xd1\xf8Z\
+W\xcd*\x06\x7f\xa8\xb77\x0c\x02?\x82^\x8c)>\
+\xd2uo\xcb&\xc8\xad\x9fS\xe2\xddm[\xc2\xfd\x7f\
+6\xcd\xb4e\xd6\xbf\xfeZ\xe7\xe6+\x1e|c\xd3\xa1\
+\xfb\x17\x0b\xdb\xd6s\xe2N\x80|\x9d\x01\xf8s\x9c\xe5\
+^\xb6:OV\xda\xd9H\xea\xa3\xc7\xa5\xa9\xbce\xa0\
+O\x96\xf1\xbc\x0az\x02\x1fyz\x94\xf0\xec\xe15\xa0\
+\xf6\x18\xcey(\xfauqM\xf5\xfa\x02\xe0\xfay\x14\
+*\x02>\xa7\xa3\x7f\xe95\xc3\x08\xf6\xb1\xa2\xe0\xe2\xa1\
+l\x192p\xa8PbP\x04\x05b\xd6\x81~\x0fT\
+\x03\x91\xf8]\xa3\x5c\xad\x10\x85\xc4\x96Q<\xac\x15\x02\
+y\xa5\x97W\x87[>v\x1bG\x1d\x11\x01\x12C\xd3\
+z%\xabz\xed\xdbIy\xd5\xc5\xe1\xfe\x7f\x9bf\x9a\
+f5#\xbbS\xd7\x1d8\xfc\x0aW\xf7\x0d\xee\x92\x9e\
+]\x05\xfe:\x01\xfc\x90\xd5vs!\x0bu\xbcu\xab\
+\x15\x0b\xcf\xaf7\xd3\x1c\xbe\x9e\xdcc\xf0K\xe0\xa7\x96\
+\x18\xbc}\x15\x92D=\xcbt\x01\xdee\xa0\x97\xc0U\
+%~\xdf\xb2\x11\x1d\xa4\x9f\xf5\x1b\x9e\xa7>\xee\x0f=\
+\x06\xc5y\x94v\x8d\x9f\xab\x18\x89\x82T\x07\xe5\x11V\
+\x880A|O5\x89\xc8D \x12\x864c\x10\xe5\
+B\x15\x81D\x90\x84\xea\xc3+\xbd\xbe\xe6\xed\xeb\xa6\xb4\
+s\x17{\xff)\xed\xba\x8b~V7\x0d\x8e\x869H\
+.\x1c\xfeYBfMj\xb8\xff\xef\xa6\x99\xb6b\xd5\
+\x96\xcb\x22f\xf7\xdd\xfd\xf7[\xafzp\xb1v\xf8\x02\
+\xaa\xe9W4\xe0\xb7\xaa\x04\xa0.\xb1U\x15\x80\xac\xab\
+\xc7\xe79kV\xa2\xe4oT\xa2P\x22G\x10`(\
+\x86\xa6\xe97\x02\x0eyS\x99\xcc\x8b\xc8\x92\xd5y\xb9\
+u\x18\xa7wJ`\xf7\xe81\xbc\xd1{\x93\x87\x0e\x0c\
+\xf0Q\x5cG\xe0\x06\x05\x98\xa3\xd5\x91\xcfG%:8\
+\x00\xfaP\x9fg\xbc\x86#?\xf4\xe7<T\x12\x09\xaa\
+\xe4\xd1\xc3\xf9\x06\xce=\x10\x09\xa8\xc9C5O\xa0\xd6\
+\x1f\xc4\xfb!\x0a\x09#\xca\xdd\x0e18\x84\xe7\x9f\xd2\
+\xbd~\xdd\x94>\x88\x08\x10\xf4.I\x00.$Jz\
+Nn\xddZ%\xde\xdb\xf9\x94\xb3\xb8\xd3l;fZ\
+xmp\xcb\xf5\x17P\xab\xae\x91\xed7\xf0\x02\x17\xb5\
+\x5cW\xf5\xf2t\xf4\xc9%\xb4z\x91\xcf\x0cW\xf2e\
+\x95\x0e\x13\xf89\xd9\xc7Sujr\x8f$4\x81&\
+\xbdD\xaf\xc0\xc3\xf8>\xca\xdd\x86\x92\x1d\xc1\xe63x\
+{\x09\xfah\xa3wgp\x0e\xb0\x07\xb7\xd0\x08\x9e\x05\
+\xc0\xc1Aym\x90\xc9B\x80\xba_\x03\xbc\xc5\xf0s\
+\xf1x@\xa8\x01\x9d<\x04Y\xa8\x9f\xa7~\x17_\x17\
+D\xe6\xd5\xcb\xd9\x04-G\xa0\xb0\x1aP\xf3\x03\xf1^\
+\x0c\x05\x1a\xf0\xf7\xe8\x02\x9b\xb7K\xaa\x80)\x96\xffF\
+\x8f\xef\xaaS\xcfW\x8bQ+\x8fH\x0a\xe9Uk \
+\xc1\xddrW\xb8\xff\xff\xa6\xbd\x87\xadu\xd5\x81\x9e\x0d\
+\x97\xdd\xbf0u\xd1m\x8a\xb7~\xb5a\x1d\xbdJ\x00\
+s!\x04\xa0\x92\x00\xc9\xfe\x9c\x8a1Q8\x83^S\
+\x9b\xcbW\xe7\xeeI\xeeg\x94\x8a\xa98\xf4\xa8$\xb1\
+\x85\x97\xd7=}\xb4.\xc7\xa5\xa4WAI\xc0\xc7\xe1\
+l\x84\x98\x92\x11\x88\xebX\x07\xb1\x0dS`q\xb7B\
+\xb4\xa7\x03,\xe4\xcd\xf3\x07%\xc0\x07\x0d\x1e^\x9c[\
+\xe8=\xf0\xf3l\xd5\xab \xb6u\x06l\xf8=\xa3]\
+-H$}R1\x18\xc0\xaf\x91@\xbf\x16N\xa8\xca\
+ \xca\xd3\x86\xa4Ej\x80\xf2\x03e\x86\xfc@\x81T\
+\x02>\x88Dr\xb0\xf8\xba!\xc6\xdb\xc9*@\x95\xfc\
+\x04r\x1d\xf8\xcb\x09\xc0]\xbb\x0arj\xd7Bz\xc5\
+\xe4b\x5cN\xe5H\xb8\xef\x03\xd3\xde\x83V\xd5\xb5!\
+f\xdd\x81\x8f\xff\xf3\xfa\xcb\xeeUx\x85\x5c\xb3\x1e\xdb\
+\x13\x01\xf8\x84\xccWd3M\xc5+\xbb\xea\xd2|x\
+6y~*\x96!\xc9\x9c(\xbdb\xb2\xee\xf5y\xee\
+\x9e\xb3\xfa5\x9cl\xd3\xbc\xbb\xd1\xe3\xfbu\xc0\x93w\
+&`\xdb\xf0\xe7\xb1e\x83\x90u\xe5G\x95\xfcc\xff\
+\x02\x81\x1f\xcd\x83\xf7\x95\x05\xf0\xbf6\xaf\x04\xff\xe1\x0c\
+\xb8>\xfb\x03H\x9d\xbd\x08bPE\xc4\x14\x8c\x80\xa5\
+`\x08\xa2qX\x90\x10b\x10\xc0\x09\xd5\x93\x90u\xd5\
+\x1d\x10|\xf9\x0d%\xf0\xda\x19\xf0\xbc4\x0f\xc1\xd7\xe6\
+!\xf0\xca_\x95\xec\x1b\x1fR\x92F\xb6\xa3l\xef\x06\
++\x13Hh\xe8 \xd4A\x9f\xcc\x19\x88D!\xcf \
+\xe4J5\x90\xb5$IHj\x00\xc3\x9d\xc8\xf4r\xb0\
+\xe2\xf3\xe20\x840z~W\xbd\x01\xf8\xd4\xe2\x9c\xc0\
+\x8f\xc0\xa7\xa3S\x1e\xb3\xab\xa7!>\xd0\xff+[J\
+ 6\xdc\xf7\x83i\xef1\x1b\xdb\xfe\xa1}\x1b.\xbf\
+_\xe9\x9c\xb9lI\x1f\xbd9\xada\x86\xea\xf1\xbdr\
+\xa5\x1cu\xd1q \xc8h\x8a/\x8ad\xbf1\xd1\x97\
+\xaaO\xe9\x11`HF#\x80\xd0\xe3\xf6\xea^U\xf5\
+\xf8Kbu&\x00\x94\xd2\xe9\x17\x5c\x0f\xc1\x1f\xbe\x0d\
+\x9e\xa3\x08\xfc\x13\x0b\xe0\xc4\xa3:\x5c8\xdc\xc7\xe7\x15\
+\xefI<\xff\xdc\xf7\xc0^>\x08\xd6\x82a\x04\xf3\x10\
+\x02\xb0\x1f\xb2\xaf\xfb8\xbe\xf6\x0c\xf8\x8e-\x80\xeb\x18\
+>\x07\x8f\xce#\xf8Z<w\x1f\x9dWp\x80\xff\xf4\
+\x19%\xef\x91o\xa2:\x18\x05\xebY\xf3\x04\x86\xfc\x80\
+L@\xd2\xf7\x8fr6\xca\xd9\x02\xb1\x1a\x91g2\xd4\
+\xbc@B\x00\xa21\xbc\xb1\x22y!\x81q\x8c\xaf\x03\
+\x7fJ\xf7\xfc\xb5S:\xf8k\xc4\xc8\xc3\x91^9\x05\
+\xb1y5\xd7\x85\xfb~0\xed=d\xcd+\xf7\xd5\xad\
+\xbf\xf4\x9e3c\xbbn\xe6N\xbdF\x89\xefk\x12\xfd\
+\xf4U\xc0\xab\x8d0\x88\x04(\xe1\x17I1?e\xcd\
+\x8d\xe5\xba\x04\x88\xb4RY\xa9W\xcd\xca\x80c}\x15\
+Dj\x22O\x8d\xd1\xb5\xf8|@!)o\x0fv\x83\
+\xfb\x89\x17\x14\xf7\x89E\xf0\xe0\xf0\x9dZP\xfc'\xff\
+\x02\x9e\xcf?\x0f\x8e\xbb\xbe\x00y\xf7\x7fYq\x7f\xfd\
+\xa7\xe8\xc9\x11\xe0\xc7\x17\xc1\x85D\xe0;\xfa/Jl\
+\xfb\x14\xd8\xbd\xdd\xe0y\xec\xdb\x8a\x17\xaf\xf1\xebO.\
+\x82\xff\xc8\x1f\xc1\xfd\xd9\xef\x82\xe3\xee'\xc1\xfd\xa9o\
+\x82\xf7;\xbfB\xf0/\x82\x17\xc9\xc0{|\x01\xf2_\
+~\x1b\x12\x077\x81\x05Ak5\x86\x12\x9c'\x90\x84\
+\xa0\x92\x16\xd5\x1d\x10\x09`\x18\xc1\x09B\xae\x1fP\x0b\
+\x89\xe4ta\x82\x8f\xc3\x8e\x18$\x91\x04|\xad\x1a\x06\
+\xb8jW\x87x|\x87\x04\xbfC\x0eg\xf5J\xc8\xc5\
+P%\xa1`h1&\xbd\xa2\x22\xdc\xf7\x85i\xef\x11\
+\x9b\xdd\x7f\xd7\xf3\x1b/\xbdw\xb1@v\xcbQ==\
+\x81\xdf\xa7\xf6\xcfg\x02\x98\x95\x0d1D-<y}\
+\x9a\xb3\x97\xe0W\xb4*>\xf2\x8a\xb2z/\xd2\xd5d\
+\xf0\xa0\xaa\xe7\xef7x\xdbA\x11\xc3\xe7\x0f\xb1\xec\xb7\
+\x06\x10\xfc_9\x01\xfec\x0a\x10\x80\xbd\x08\xfc\xccC\
+\xb7q#\x0f\x9b\xaf\x1fb\x0b\xc7\xc0^8\x0a6g\
+\x0b\xc47O+\xae/\x1e!\x02 5\x00\x81\x13\xbf\
+S\xb2\xaf\xba\x1d<xN\xc4\xe1=\xf1oJ\xf6\xf5\
+\xf7\x82\xd5\x81\xaf\xc5\xcf\xb1\x15\xe0k\xf3\x87\xc1\x96[\
+\x07)\xab\xce\x07\xd7\x93'\x90\x00\x90$\x90\x04\x02D\
+\x02\xab\xcfG\x02\x18\x12I\xc2\xfc\xd0\x90\xc0\xa8\x04\xb4\
+\xcaC\xaa\x1d\x90ED\x5cb\x9c^\xa2+\x818/\
+X\xdd\xad\x10\x83\xafO+\x1d\xe5jH!\xfbW\x0b\
+\x8fo \x00g\xb5$\x01$\x00\x1a\xe9\x15\xab\x95X\
+g\xf37*\x9aWF\x84\xfb\xde0\xed]n\xdd\xb3\
+W\x0d\x92\xf4\xef\xdbx\x9d\xdc)\xc7\x08\xfe\x19q4\
+v\xc3\x11\xb1?\xc4\xba\xdb\xd1\xb3\xb7\xa2\x04._V\
+\xc2+Jw\xab \x8a\x12u\xeat\x1e*\x00\x8b\x9c\
+\xab\xd7<k\xfe\xa0\x96\xc0#\xe0\xd9\xdc]\x90u\xdd\
+\xc7\x15\xf7q\xe1\xb9}?\xf8-$\xf4\xae\x87\x98\xa2\
+1\x88A\xe0\xc7\x14\xa1T\xc7\x11SLG\xba6\x02\
+6|o\xf7SH\x18\x08x'\x02\x99$\xbe\x07\xc3\
+\x05\xff\x89\xdfC\xca\xd8\x16\xc5&_\xc7\xefA\xaf/\
+\xa41\xc2#\xc6\xd3\x09y\xf7>\x09\xfeSD\x16\x0a\
+\xf8\x8f\xbf\x8e\x04#T\x00}\x1f\x0eE\xb4d\xa2\xaa\
+\x08D\xdd\x806mH%\xc6\x94\x1c\xa4\xbc@F\xb9\
+\xc2S\x85jN \xc1\x8f\x84\xd3\xcf\xe1\x05\x85J.\
+\x83\xdc'\xf0\xb3\xd7G\x15%T\xc0J~N\x1e\x8e\
+\x1c$\x81\xf8\xe2\x09\x88I/\xbe<\xdc\xf7\x87i\xef\
+b\xab\xe9?/v\xea\xc2[_\x9d\xd9\x7f\xb7\xe2\xad\
+\x9bR\xb4X\xbfI\x05\xbe\xc1\xfb7\xce\x88\x8e8H\
+\x0a\x89\xe8\xa5\xa9\xf8\x85\x97\xefRu\x1cg\xfa\x8b\xc5\
+\xcdO\x0bn\xd8\xf3\xb7\xe8\x19}U\xf6\x1beu>\
+\x1d\x079qgA\x22\x89k\x9c\x86\xf4\xed\xd7@\xfe\
+\xab\x0b\xe8\xcd\x17P\x9e\xff\x01\x12\x9a\xd7B,\x02\xd7\
+Z\xa4\x83\xd8Z,\x86\x04\xb4B\xd7m\x05\xdd,\xf3\
+\x1dL\x00\x0b\xe0{q\x1e\x92G\xb6\x81\xadp\x5c\xe1\
+\xe7\x15\xab\xef\xa1\x92\xc8\x08\x93GL\xc1\x88\x82$\xa0\
+8\x1ex\x86C\x09\x0f\x92\x87\xf3\xd1\xafC\xdc\xc0F\
+\xb0zZ9\xa3\xcf\xb3\x08!I\xc2~C=\x82\xfc\
+\xbd\xbc\xedr\x11R\x15/8b% I \x12\xc9\
+\xd1\x8e\x9fg\xc3\xd7\x92\xf4wi\xc0W\xc1/\xbc\xbe\
+C=VM2\x11\xa4\x95\xaf\x848o\xe7o\x92\x9c\
+\xb5\xe6f\xa5\xa6\xfd\xcf\xd8\xc8\x8e\x0f_\xb7\xee\xe0=\
+\x8b\xd5C\xbb\xf58\xbfI\xf7\xfa^\x96\xfb\xeaQ\xac\
+\x83wQ\xdcOu\xfd\x94\xf4K\xca\xd7c~5\xe1\
+G\x9e\x9fJd\xf5B\x1eE\xab\xc43$\xf9(K\
+\x1f[\xdc\x0f\x99\xfbo\x84\xe0\x89\x7f\x05\xff\x8b\x0b\x22\
+\xb1\x87 \x0c\xe0y\xd2\xc4N\xb0\xa9@\xe7\xe3\xb8\x18\
+\xc5\xf2q\xf1\xb8 \x04\xbcF^\xdeq\xf7c\xe0\xc0\
+\xd7;(\xe1\xf7\x85\x93`\xf3v\xea\xcaA{=\x91\
+\x07\xbd\xc7\xa8\x12c \x15*\xe0\xf1\x7f\xf3g\xf8\xf9\
+\x940D\x228\x8d\xdf\xe1\xd57\xc1q\xf8)H\xec\
+\xdb\x00Vo\x17\xab\x02\x8b$\x00\xf5\xa8\x86\x04D\x12\
+\xa4v\x22s\x05\x09\xe8e\xc4\x82\x04b0\x04\x89\xc5\
+\xcfJ,\x1e\xe1\x10\xc0\xb1\x14\xf4\xda@\x05PEc\
+\x02r+' \xa9d|\xd1\x9aY~C\xb8\xef\x13\
+\xd3\xde\x85\xd62\xb8%z\xcd\xde\xbb~\xbb\xe6\x92\xdb\
+\x17i\xce\xda\xdf\xa4o\x8e\xe1m\xd2AO^\xdf#\
+\xfb\xdeQC\x0c\xf2\xd6\x91\xce6\xb1\xa2O\x8b\xf9\xa9\
+\x96\xbfBY\x91]\xc5\x8bk\x84\xcc7V\xf2\xf5\x8b\
+\xb9|\xe9\xf9c\x10P\x99\x07>\x0c\xc1W\xde\x04\x1f\
+g\xf3\xd1\xeb\x1f\x93\xf2\x1d\xc1\x9f\xfb\xd0\x97\xc1\xee\xe9\
+b\xf0Z\xa5\x02\xb0J\xd0\xdb\x18\xc0\xe3\x1a\x010\xb8\
+\x0b\xc7!u\xcb\xe5\x90wt^\xc9{a\x1eR\xb7\
+\x1f\x02{\xc1\x98F\x00V\x95<\xf8\xf9\x13\xf2}\xe8\
+g\xa3<\xe8\xb9\xc93{\xc1\xfb\xd2\x19p#\x098\
+\x8e\xcc\xf3\xcc\x81\x07\xbf\x93\x1f\xd5D\xde\xa7\xbe\x01\xf6\
+\xaaa\x01\xf6\x80\xb1\xf8H\x9d\xc5\x90u\x0b\x92\x04\xf4\
+\x85ER\x09\xc4y!\xae`\x10\x89j\x04\xb2+\xd1\
+\xc3\xd7J\xf0\xcb\x91'\xa5?\x0f\x04\xbf\x18\xf8;\x95\
+\x8e)v_\xf7\xafs\xf3\x9b\xa2\xc3}\xbf\x98\xf6.\
+\xb3\xce\x99k&\xe6\x0er\xff~\x99\xd5W\x9b[\x1a\
+\x87\xecj#\xcf\x93\x83\xbd(\xed\xdbD\xdc\x9f\x22\xa7\
+\xfa\xd2J\xe5<?\x82\xdfQO\xa0P\xb4b\x9a%\
+\xd3{\xe4Ec\xf2{\xc1\xf7\xe4\x11\xf0\x9d\x10S{\
+~\x1c\xbe\xef\xff\x16\x9c\xf7}\x112\x0f\xde\x0e\xc9\x93\
+\xe7C\x0cJo\x1b\xc7\xfa\xe3\xec\xb1\xad\x0c\xda\x09\x09\
+\xfc\x09\x8d\x00\x847\x17@N[\xb3\x1b\x9c\xf8\x9e\xb9\
+\xcf\x9f\x81\x94\xb9\x03 b\x7f\x9d(\x888\xe2(!\
+\xb7\xf5\x10\xe4\x5cs\x9f\x92>{\xb1b\xcb\x1f\x02;\
+>\xcfF?/\x18\x86\xd8\xda1H=\xef:\xc8\xb9\
+\xfdQ\xf0|\xe5\xc7\xe0\x7f\x89\xa6\x11\x17\x91\x98\xce\x80\
+\xf7\xd4\x9b\x90\xbay\x1f\xd8|\xc2\xe3\x8b\x8aD#\x11\
+\xf4rE!\x15Bq8\xa0\x92@\x9a\xa8\x88\x8cB\
+E\x10_2\x01qH\x02\xceZ=\xe6\x17q\xff\xca\
+\x10\x02\xc8\xad\x16$\x90S9\xce!\x90-\xad`<\
+\xdc\xf7\x8bi\xef\x22[\xbd\xfd\xda\x88\xd1\xf3>\xf4\x83\
+5{\xefT\x5c\xd5\x93\x8a*\xefU\xe0{\xb4\xa3\xda\
+\xd8b-\x17\xb5\xf0ZxG\x8b\x90\xfe\xea\x9a\xfdL\
+\x09\xfe\x9cZ\x04E\xaf\xa1\x04\xd7P\xc9'\xe5\xb35\
+\xd8\x05\x9e\xcf>\x07\xde\xe3\xf3\x9c}\x0f\x9c\xf8\x0bd\
+]w\x18\xacy(\x91\x0b\x08\x84\xe3\x9c\xa9\xb7Q\x96\
+\x9f\xe5\xb9\x0ax\x1c%:\xf0y\x94\xa8\xe0\x1eg\x02\
+H\x9dA\x028\x85\xde\x1a\x09 uf\x1f\xab\x02U\
+-\xd0\xd1\x8a\xa4\x92w\xdf\xd3L8\x9e\xd3\x8b\x1cr\
+x\x9e:\x02v\x0aGD~@\xa1b\x22\x9e)\xa0\
+\xb0\x02\x7f\xd7\x84\xb6Yp?s\x9a\x95\x09\x8d\xc0K\
+\x0b\x90<\xb5\x87\x7fO\x09~E\x0b\x07\xf2ER\x90\
+\x12\x9d\x91\xb9u21(\xa7\x08yMD\x10b\xf2\
+\xea1\xec\x19\x83LR\x01\x9a\xe7\x97\xc7*\xa3\xf7\x17\
+\x0a \x0f\x09 \x11\x9f\x1f\xe7\xa8\xffA\xb8\xef\x19\xd3\
+\xdeE\xd68\xb9w\x0a\xbd\xffb\xdd\xd8E\xda\xb4\x9e\
+\xde\xd8B\x02_\x82\xdf\xcd\x8d-\xd7B\x1c\x02(\x12\
+ce\x91\xe5V\x97\xf1\x96qi,y<5\xe3\xaf\
+\xd7\xf0/\x01\xbf\xab\x1d\x1c\xf7\xfc-K~?%\xf9\
+\xbe\xf6\x0a\xc4\xb5\xacApN\xe81\xbd\x16\xf3\xeb\xe0\
+\xb6\x05\x06!m\xeaB%c\xc7!H\x1e\xd8\x02\xb1\
+\xfe>\xf6\xd8Z\x08 g\x03R\xd7\x5c\x80\x0a`\x81\
+\x09 ev\xaf\xa6\x16\xe8\xfdmE\xe3J\xd2\xcc~\
+\x8a\xed\x15\xd7\x89\x05\xc5u\x12c}R\x1f/.B\
+\xf2\xd0y2\x1f0\xae\xcd2Xeh\x10S8\x8c\
+\xdf\xbb\x15ro\xb8\x1f\xfc\xa7D~\xc2\xf7\xf2\x19H\
+\xe8\x9a\x05k\xc0\xb8\xa8\xa8O\x0b{\xc4\xcc@\x07\x92\
+@\xad\xbe\x90H\x0d\x05\x12\xfc\x90P6\x09q\xc5\xa3\
+\x9c\xfc[.\xfb\xc5\xc8E\xf0S\x0e \xb7\x12\xc9\xa2\
+l\x94~\xe7E[j\x81Y\x17`\xda\x7f\x8f\xad\xbc\
+\xf0cO\xcf\xed\xbb{\xd1\xd7 \xfa\xda{T\xaf\x8f\
+\x9e\xde\xd8\xc7N]\xd3\x9e]>\x8a\x9e\x1f\xe3\xdb\x9c\
+z\x9a\xe3V\x84\xf7\x97\x9dz\xd0\xd3Q\xdf<M\x0a\
+\x07\xf5e\xb7\xd1r\xaa\x8f\xa4\x7f\xc6e\x1fA\xd9\x7f\
+\x86=\xbf\xef\xb9W!6\xbf[Ho-6\x1f\x0f\
+\x05?\x8d\xe0\x10d\xbd\xff\x1e\xf6\xd6^\x94\xe2\x81\x97\
+\x17 \xe7\x96\x87Y\xae\xdb\x8a\x0c\x89=\x94\xf1ik\
+/\x90!\xc0\xdb\x18\xcf\xa3\x02(\x9a\x90\x040\xae\xd8\
+\x0a' \xe3\xea{\xa8\x82\x10\x09`\x9e\x89\x82\x08\xc0\
+sl^I\xdbrH\x7f\x1fu\xa6\xa1H\x12@\x01\
+\xcd\x14\x0c\x83\xdd\xdf\x0b9W\xdf\x01\x9e\x13\xa2\x02\xd1\
+\xff\xdd\x9f!1u/\xaf\x13\x08\x1aj\x1d8\x14\xa8\
+\x85\x15\x9c\x14,\x13\x8a\x89\x12\x82H\x0aq\xa5\x13\x90\
+U!\xbd>\xaa\x81\x5c\x15\xf4\xea\xa8\x1cg\xf0\xe7V\
+\x88\x11W8\xb4h\xcb\xa9\xb91\xdc\xf7\x8di\xef\x02\
++\xef\xd9\x12?u\xc9]o\x0do\xfb\xa0\xe8L\xd3\
+\xb8\x04\xf4\xa2\xb3\x8d\xc2+\xd9\xe8\xe7x\xcd\xce\xed\xb4\
+\xda\xf4\x1ezi\xb2\xbe?[H\xffh\xee\xca\xa3\xde\
+\xfcK\xa4?\xd5\xe5{Z\xc1\x7f\xe4\x0f\xe0>\xa1\x80\
+\xf7\xf4\x19\x88m\x5c\xc5\xf3\xf3*\x01\x10H9\xa6W\
+c\xf6\xe2\x09\x85\xc0\x9b\xd4\xbd\x19\x0a^A\xd0\x91\xc7\
+>\xb9\x88\x03=\xf0\xab\xf3\x10\x8b\x80\xd1\xe2{\x1a\x05\
+\xa3\x906\x83\x04p|^*\x80\xfd\x08\xe0\x09m\xe6\
+\x80>+a\xe4<\x08\xbc\x8a\x04tb\x11\xbf\xc7\x82\
+B\xc3\x8f\xef\x1d\xd7:+I\xc8\x90T\xd4\x8e*\x11\
+\x0cs^\x22\xf7\xa3\x8f\x80\x1f\xbf\x07)\x81\xf4=\xef\
+S\x96\xadLT\xc1/s\x02Qyu\xac\x8eVd\
+U\x88\xe2(*\x12J\x08\xb0\x0a\x88\xc7\xf7W\xb3\xfe\
+!\x04\xa0\x82\xdf@\x00IE\xa8D\x9c\xad\xaf\xa7\xe4\
+V\xd8\xc2}\xff\x98v\x8e[\xd7\xcc\x15#k\xf7\x7f\
+\x1c\xea\xc7\xf6h\x09>\x8f\xecd\xab\x82\xde\xdd\xa0w\
+\xaf\xa1\xe9)*\xf8\xe1^~\x86\xf5\xfc\xbc\xb2\x8f\xa4\
+\xbf\xb3Y\xbd\xf9\x15#\xf0\xf51\x04\x99W\xde\x06\xfe\
+c\x22\xd3\x9fw\xe7c`\xcb\x1f5xp\x09R\xa3\
+\xe7\xa7\xb8\xbdd\x12\xd26\x1f\xc0\xd7\xcd\xb3\xb7\x96\xb2\
+]\xf1\xbc8\x0f\x89\xfd\x9be\x92oL\xcb\x01\xa4\xcd\
+\x5cH\x9e]\xc9}~\x1eR\xe7\xf6K\x05 \x88\x85\
+\xc9\x06C\x89\xf4\x0b>\x08\x81\xd3\x0b\x0c`/\x1e\xb3\
+oz\x04\xbd\xfb\xc0r\x05\xa2\xd5\x0c\x8cI\x85!\x95\
+@\xb0\x1b\xf2\x8f\xfd\x89g-\x02'~\x0f\x16W\xb3\
+\x9e\x03X\x9a\x10\xe4\xfa\x80N\xce\x07\x18\xa6\x06\xb9f\
+\x22\xd6\xd7\x09\xf1\xa8\x02\xd2\xcb'B\x09@\x82?G\
+\x02?G\x8e\x8cRT<\xf9\xc3Jt\xbc\xb3/\xdc\
+\xf7\x8fi\xe7\xb0\xad\xdave\xc4\xe0\x96\x1b>\xb3f\
+\xffapT\x8c+j\xefz\xd5\xf3/\xed]G\x1d\
+n\x92(\xb3\x8d\x0a\x80\x17\xbd\xa4\xea\xed\xbbh\xb7\x1e\
+\x8as\xa9/\x9f\xee\xf9\x97\x94\xf7\x22\xf8\xad\xf8s\xe7\
+\x17N\x00/\xbey\xf1\x0c\xc4\x94\x0e\xb2d\x17\xe0Z\
+\xe2\xc9\x8b\x0d\x84\x80#\xa1{\x03\xe4\xbf2\xaf\xb8O\
+\xa1\xc7>)\xaa\x03\x03\xaf-\x80\x1d=\xa7Z\x03@\
+J\xc1Z0\x06)\x18\x02P!P\xde\x0b\x94\x04\x14\
+\x04`U\xdfO%\x15_\x1f\xb8\xbe\xf0\x02\xc9x\xc5\
+\xf5\xd4\xab\x18\xdf7\xc9:\x015\xb18!\xd4@\x88\
+\x0a\xd0\x95\x00\x82\x10\x9cw}\x8e\xea\x0d\x14\xd7\xb13\
+\x90\xb6\xe3J\xb0\xfa\x07C\xc3\x00\xb9\xac\x99\xdb\x93\x91\
+\x1a\xa0\xfe\x81\xea\xac\x00w\x16*\x82\x08\x0c\x05\x92*\
+\xa7 \x11\x95\x80\xb3Z\xcc\xf9\xab\x04\x90#\x09\x80\x8e\
+\xd9\x15\xa3\x1c~\xe5\x96\x8bB\xa2\x98\xac\xca\x07\xc3}\
+\x0f\x99v\x0e[\xf3\xf0\x0e\xdb\xd8\x8e\x9b\xdfl\x9d\xbe\
+\x0c\x01?\xc5^_\x95\xfe\xc6\x9eu\xaez\xd1\xb5\xc6\
+\x8bD\x10\x99\xd7\x827q\x8bX\xe1\xc7\xe0/\xe3\x16\
+^jC\x0f\xae\x99\x0f\xf4/'\x00*\xa7\xa5\xfa~\
+w\xab\x9c_\x9f\x07\xc7\xe7\x8f\x82]-\xd0a\xa0\xeb\
+\xd3{6\x99\x04\xd4r\x02x\xb4\xe3\xfb\xe6|\xf0\x13\
+\xe0}\x91\xc0\xbf\x00\xfe\x97\x17 \x0b\x1f\xdb\xa8l\xd8\
+\x00l\x22\x00\x91\x03X\x80\x5c$\x80\x94\x19M\x01\x80\
+\x16Z\xe0c\x1bz{\xd7\x13G\xc0I\x05?_\xfe\
+a\x08\x01\x18g\x0cB\xc1\xaf\x16\x0c\x8dr\xb21\xbe\
+\x0d\xffV\x18\xc6P\xad@\xee\xe1\xcfCLpX\xef\
+;\x10\x94S\x83\xc6\xb5\x0f\xd4P$G&\x04\xd5\xda\
+\x80\xe4\x02H(\x1c\x82\x84\xf2U\x90])\x08\x80\xa6\
+\xfcr\x90\x94s\x0c\x9e?\x07\xc1\x9f\xc3$0\x0c\xf1\
+\x05H\x00\xb9\xf5\x7fM\xf76\xc4\x84\xfb>2\xed\x1c\
+\xb5\xba\xf1\xbd\xeb\xd6\xec;\xbcP\xdew\x9e\xec_g\
+\x00\x7f\x83\xda\xbbN\x1e\x91\x00R\x0b\x07\x10\xe4\x1d\xdc\
+\x0e[\xdb|C\xc6\xfe\xd4\xd7\x9fV\xf8Ei^O\
+\x07\xbf\xa5`H\xa1u\xf91\xc1A%\x0e\x89\xc6\x8b\
+\x9e\x9f\x96\xe2\xe6\xdd\xf20\xd8U`j\xe0\x97\x8f\x0b\
+\xc9\xfb\x8a\xa1\xcd\x00\x90\x97\xf7v\x81\xeb\xe9\xd3\xe0\xa5\
+\x1c\xc0\x93/\x83\xdd\xd1\xa8yu\xad\xc0\x07\xbds\xca\
+\x9a\xdd\xe0\xa0\x10\xe3\xf9y\x85\x09\xa0\xd0\xe0\xfdYi\
+\x10\x01\xf4\x81\xfb\xe9S\xe0<\xbe\x08\xce\xaf\xfe\x13X\
+\xdd\xcd\x86\xc4\xe3\x84\xa8\x17(\xa2\x05C#L\x16\xf6\
+\xc2q=\xd4(\x14\xa1\x80\x05U\x8f\xef\x857\xf8\xfb\
+8\x9f~\x09l\x9e\x9e%\xbd\x04B\xf3\x01\x5c\x07\xe1\
+\xa8\x17$\x90U\xa1\xa9\x00+\xfe\xfd\x92+\xa7!\xb5\
+b\xa5\xf4\xfc\xe3\x0c\xfal\x09|\xd5\xfb\x8b\xf3aH\
+-\x1e\xa2\xef\xbf\x18\x1d\xe7i\x0f\xf7}d\xda9j\
+#\xbbnyx\xea\xa2;\x14\xaa\xfc\xf3\xd6\xeb\xfd\xea\
+\xdd\x06\xd0\xabk\xd6)\xfbO\x15{\xd1\x9e.Q\xf5\
+\xa7\x16\xfcpW\x1f\x19\xfb\x07\x0cq\xaf1\xf6\xcf\xa7\
+\xc6\x1c\xc3\xf8\xfa^%\xfd\x92\x0f\xa1\xe4>\xc3^7\
+}\xe7\xf5<\xcfn\xd5$\xbf\xcc\xd4\xa37L\x1a\xdb\
+\x09\xc9S\x17Cl\x99\x11\x90\xa3<\x7f\xefz\xeae\
+N\xde9\x9f\xfc!\xc4\xb8Z4\xe9\xaf\x12\x05\x85\x14\
+)k\x91\x00N\xc8$\xa0J\x00\x86\xb0\x82?\x93\x14\
+\xc0\x93'y\xbd\x80\xeb+?Au\xd2,<\xbb\xea\
+\xfd\xf15\xb1\x04\xc2\x1b?\x01y\x9f~\x0e2\xae>\
+\x0cv\xf4\xbcz\xc82\x82\x84\xd4\x09\xce'N\xd1\x0a\
+B\xc5w\xf2M\x88mX\xc9\xdd\x854\x12\xc8\x1f0\
+\xf4*$\x82\xc4P\x00\x95\x12%\x04y\xe5`\xa6\xec\
+-\x18\xef\x87\x14\x0c\x03\x92Q\x05\xe4H\x02\x10\xe0\x1f\
+\x13\xc0g\x02\x18\xe1\xf3\xec\xb2\x11\x1e\xb6@\xdf\xa25\
+\xb3\xe2\x9ap\xdfG\xa6\x9d\xa36\xb2\xe3\xa6\x1f\xe1P\
+\x5c\xd5+\xb9#\xad\x1a\xeb/\xedS\xc7KWkV\
+C$z\x7f\x96\xff\xa9\xea\x9c\x7f\x85\x8c\xfd\xeb\xb8W\
+^\xb4\xb6\xa6_\xad\xf6\xd3\xa5\x7fL~\x0fx\xbe\xf0\
+}\xf4\x94g\xc4\x9a\xfe\x97\x17!i\xe5n\x91U7\
+$\xfe\xece\xa3\x8a\xff\xf9_\x81\x97V\xe4\x9dZ\x80\
+\xfc\x17\xff\x08\xb1\xd5\xb4\xe4w\x82\xb3\xfbV\xfc\x1c\xd7\
+\x93/\xf1\xd2`\xd73?\x02\xab\xb3E\xd6\x0d\xe8\x04\
+@\xd3u\xa92\x04\xa0\x1c@\xca\xec>=\xbf`P\
+\x0b6o7\xb8\x9f:\xc5\xc9D\xe7s\xff\xac\x08\x05\
+\xa0\xca\xfeq\x88\xc3\xb8\xdd\xf7\xed\x7fR\x13\x8e\xbc\xaa\
+\xd0\xf9\xd8w\xb8\xe3\x90\xb6\xaa\x10\x7f?\xe7\xe3\xdf\x07\
+?\xa9\x08T5\xbe\x97\xde\x86\xe4\xb5\x17#\xd9I\x12\
+\x08\x0c,)\x842\x14\x07ie\xc2\x22\x9f\x12\x8b\xe1\
+QJ\xd54\x02\x7f\x5c\x00\xde\x08z\xed\x5c\x8c\x1c\x1c\
+vJ.f\xd7\x1c\x0d\xf7}d\xda9h\x8d\x83\x9b\
+cQ\x01(\xddsW)\x1ec{jC\xab*^\
+\xaf^#\xce\xb3\xd0\x13Ey:\x95(\x94\xaaz\xe2\
+Od\xfeic\x0c\xf6tKb\xff(u\xda\xaf\xb0\
+\x07\x5c\x8f~\x1d\xdc\xc7\xce\x88\x95}\xa7\xde\x84\xac\xf7\
+\x1df9oW\x93w\x94p+\x18Sr\xae\xbd\x93\
+\x80\xa6P\x82\xcf\x8d\xc0\xa3X\xdf\xf1\xc0\xb3\x10\x1b\x18\
+P\x15\x80B\xd2_\x10\xc0k\x10\xe3l\x91k\x03T\
+\xcf>\xc6\x85;\xa9\xb3\x17\xb2\x02\xe0\x1c\xc0\xec~\xa0\
+\xb9\x7f\xad\x94\x98\x9eG\x1e\x1c\xe5:)\x00\xd7\xf1E\
+\xc5\x85\x04`QC\x00I\x12I\x13;\xc0\x8f\x9f\xaf\
+\xd6\x09P\x8f\x01\xf7\x8b\x0b\x900\xb8U\x0b\x05\xa8J\
+1\xa1c=\xb8\xbf\x8cDrL\x846\x81W\x17 \
+u\xebU\xfc]-\xc6\x5cH\xbeT\x01t\xa4vi\
+y\xb5R\x05\x88\xe2\xa0h\x0c\xad\xd2jf \xa3\x12\
+\xc3\x00&\x80\x11\x8d\x00\xb2\x0c\xe0\xa7\xf3\xac\xb2a\x88\
+\x0f\xf6*\xd1\xb9M\x8b\x09\x19\x85\x19\xe1\xbe\x9fL;\
+\xc7\xac\xa0k[\xdd\xe4\x9e\xdb\x81\xaa\xff\xf4V\xd5\xd2\
+\xdb/\xe9VC\xd7\x92\x8a\x86\xb8\xe45B\xed\xdf\x9f\
+![{a\x0c\x1c\x8d28\xa4[\x8e\x94\xfd\x96\xfc\
+!\x85\xb2\xfe\x9e\xc7\xff\x1e\xbc\x08\x0e\xaa\xf8\xa3\xf9\xff\
+\x84\x96iQ\xde\xcbI6\x04~\x89(\xed\xb5\xe1s\
+]\x7f\xf3\x03\xf0\x9cV\xc0\x8d\x0a\xc0#\x86\x12|\xed\
+\x0c\xd8P}\x90Z\x10\x0a\xe0\x15&\x00\xe7\xd3\xaf\x22\
+\x01\xb4\x86\xae\x03\xe0\xfc\xc1\x18*\x80\xf3\xb9\x1f\x00\x13\
+\xc0\xba\x83\x8a\x08\x01&D\x19p\x89<\xf7\xf5\x82\xe7\
+\xc9\xd3\x5c\x07\xe0\xfa\xd6\xaf\x84\x02\xe02\xe3q\xfeN\
+\xc9\xabw\x83\xef\xa4\x9cr<9/\x08\xe9\x14\xadL\
+\xbc@N[\x8e\xc9\xba\x82\x11\x88A\xef\x9du\xf9G\
+\xc5\xb4\xe2\x89yV8i\x9b/\xc38]_:l\
+\xc9\xd7;\x10G{\xdb1\x0c\xa8\x17\x15\x82Y\xb28\
+(9\x1f\xd2\xeb\xd7AZ\xf5\xb4T\x00\x04\xf6\xd1\x10\
+\xe0S\x020\x8b\x06\x12@\x12\x95\x1b{{ \xca\x9e\
+=\x15\xee\xfb\xc9\xb4s\xcc:\xd7]\xb3a\xf2\xa2;\
+x\x9bk\x15\xf8F\xd9/\xdaT\x89F\x15\xb4\xc1e\
+\xb4\xa7\x9b\xfb\xf2q\x09k\xba\xd8\xb5\x87\xa7\xb3r\xeb\
+\x95\x90i?\xb5+/\xf5\xe2\xcb\x1ff9\xcc\x0b}\
+h\xae\xfc{\xbf\x84\xf8\x86\xd5Zr\xcf\x08~\x1a\xa4\
+\x06r?p?\x82L\xe1\xfa|\x95\x04\xbc\xdf\xfc\x05\
+\xd8\xa9\xcf>\x85\x0b\xfe.\xc5\xf9\xd4k\xac$\x88\x00\
+\xac\x92\x00b\x8cY{\x22\x80\x99\xdd\xe0@\xc0\xd2b\
+\xa0\xd4u\x07e2Q|&-&b\xd5A-\xbb\
+\x9f~\x85\xde\x0bC\x80\x9f\x83\xc5\xdd\xa2\xbd\x8f\x9d\x16\
+\x0b\x95\x0c\xa3\x02x]\x0b\x01h\xea\xd1\xff\xd2\x1b`\
+/\x1d\xd3\x08@\xccR\x8c(D\x02v\xaaT<t\
+\x13\x93\x84\xa8\x0d\xf8\x13~^/\xfe-DR\xd4\x22\
+\x1b\x9ep\x18@\xd3\xa9T\x18\xc4%\xc2U\x22!\x98\
+V\x0cI\x05\xfd\xa8\x02\xd6\xf2\xb4\x9f\xd1\xebg#\xe0\
+idic\x08\xd2\x8b\x90t\x91\x00,\xa9\x05\xb7\x87\
+\xfb~2\xed\x1c\xb2\xd1\x0d\xfb#z6^{\xc3\xe8\
+\xee[!\xbbt\x88\xdbP\xbbdWZ\xd1\xa2j\xa5\
+\xd6\xa1F]\xa2\x1a\xe5\xe9\x82(*\xfd\xa5\xd8\x9f\xa6\
+\xafx\x13\x8f\x1a\x8ee\xa3\xa5g\xe3xW\x80_!\
+\x05`\x0b\xb6C\xf0\xf9\xdf\xf02Z\xdf\xa9\xb7!\xbe\
+e\xb5Z\xe9'\x80Z2!k\xff\xa5\x02 \xe0\xa1\
+\xfc\x0d\x1e\xfd\x15\x04_Z\xe4>}Ti\x17|u\
+Q\xc9\xd8{\x13\xd8}}B%`\x08@y\x04\xd7\
+\xd3?\xe4\xda\xfc\x98%K\x83E)0\x12\xc0q\x0a\
+\x01D!\x90\xad\xd0\x90h,\x12m\xc4\x92W\x9e\x07\
+\x81W\xa8\x05\x18\xbe\xd7#\xdf\xa1f !5\x00D\
+\x02\xc9\x93\xdb\xc1w\xfcM\xfc\xfe\xd43\xf0\xcf\x10\xdf\
+\xb7IV,\x1a\xd7+\xe8\xd3\x821H\x84y\x87\x1f\
+W\xa8\xab\x10\xb5\x16s|\xea\xabHZ\xbdB\x15\x15\
+\x0cj\x7f+&\x03g\xa3(\x0c2,\x14\x8a\xc5\xd0\
+ \x1d\x09 \xabrR\x00\xbe\x5c\x05\xfc\x88\x06\xfc,\
+\xfc\x9fe\x96\x22!\x94\x0e\x22\x01tAtV\xf5\xb7\
+\xc2}O\x99v\x8eY\xfb\xdcU\xcft\xcc]\x0d\x8e\
+\xcaq\x01\xfc\xbaUZ\x87\x1a\xad3\x8d\x1c\xe9\xa5\xa3\
+<\xc5\x17\x99U\xad\xf5\xf7[A\xc9?\x9a\xfb\xe7\xca\
+?yCk\x19\x7f\x92\xff\xc3\x90s\xe3}(\xf9E\
+\xec\x9cw\xcbC`\xa3\xe9\xb4\x22\xd5S\x93\xf77d\
+\xfeK\xb4\x85:\x9c\x9c\xcb\xd8\xf9~\xc8\xdcw+\x04\
+\x8e\xfc\x9e\xa7\xd8\x02(\xa9sn\xfd\xb4bC\x80\xb8\
+\x9f|\x89I\xc5\xf5\xcck\x0a\xcd\x02\x18\x81\xad\x11\xc0\
+\xcc\x052\x07\x80\x04\xb0\xee\x80 \x00\xb9\x82\xd0V0\
+\x02)[/\x05*\xfd\xa5\xd6_\xd4I8m\xfd~\
+\x8dDtr\xc2\xf7s5\x83\xe7\xb9\xdf\xf2Re\xc7\
+\x13/@\x5c`(d\xf1\x91mI]\x00U\x08\xda\
+\xdcm\xe0\xff\xde\xafYYP\xa3R{\xf9\x90\xec-\
+8\x18\x1a\x06\xd0.\xc5\xb9u\xb20H\xcc\x08X\x90\
+\x0c2\xeb\xe6 \xabj\x95\x00|\xa9\x18\x99e4\x08\
+\xf8CL\x02t\xcc\xc1#\xa92\xab\xb3\xe9\xa7\xe1\xbe\
+\x9fL;\xc7\x0cC\x80\xdfV\x8d\x5c\xc8\x1d}\x8c\xbd\
+\xe9\xe4\xdatE\x80\x7f\x92K\x7f\x93\xd0s\xd1\xd4\x16\
+{~5\xf9\x97]#Z{\xd3n>Z?\xbf\x01\
+\x11\xfb\xf3j\xbf6\xf0~\xe7\xd7\xe85Q\x0a\x1f\xfd\
+\x03\xc4x\xda\xb4\x82\x1aM\xf6\x17\x87*\x00\x8e\xbdU\
+B`\x19>\x01\x09\x1d3\x18B\xfc\x05\x95\x80\x02\xfe\
+\x17\x15\xc8\xba\xfe^p|\xe1\xb4h\x1a\xf2\xd4\xab`\
+s\xb5,\x0f\x01\x0aFy\x16\xc0\xc1\x85@\xa4\x00\x0e\
+h\xf5\xfd4\xed\x98\xbae\x1f\x13\x8a\xfb$\xadEP\
+ \xf7\xd6O\x83\xdd\xdf\xb3|\xf1\x11%\x17]H8\
+\xdf\xfd\x03\xb8\xe8\xf3\x9e8\xca$\xa6?g\xcc\x90\x0b\
+\xd0[\x95\x11\xc1d\xef\xff\xb0\xf8\x8e\xa8.\xd2\xf6\xbc\
+\x8f\xc3!\x22FA\x02\x22!h\xa1n\xc2\xaa\x02\xa0\
+\xf2`\xda\x1e-\xad\x04r\x9a7C&\xa9\x00\x15\xec\
+e\xc2\xe3\xab\xc0WGV\xe9\x00*\x22\x22\x91\xc6\x05\
+WY\x97=\xdc\xf7\x94i\xe7\x885\x0dm\xb3w\xad\
+\xbfn\xa1\xb8{\x1b\x13\x80\xd30\x96v\xa4\xa1\x05*\
+qr\x05_\x04M\xff\xa9[y1\x014\x88\xe9\xbf\
+|)o\x83C\x22\xf6\xc7\xe7\xc6\xb5\xacE\xd9<\x0f\
+\x1e\x9a\xef\xbf\xec6.\xa6\x89\x09\x91\xce\xbc\x86_\xb1\
+i\x95\x7f\xc6\x06\x1f\x13\x9a'\xa6B\xa1$\x92\xea\xc7\
+\xff\xccR\xddK\xb9\x81\xa3o\x89\x8eAO\xe9I@\
+\xa1\x00\xc6\xf5$ )\x80\x93\x92\x00f\x0f\x88\x9c\x03\
+\x023q|;\xaf\xe3\xf7\xb1\xe7GUq\xe7\xa3\x1c\
+V\xd8\x0a\xc7\x96\x10\x89P\x14Vw\x13\xb8\xbe\xfbG\
+\xdeG\xc0E\x04\x10\x1c\x09\xa9P\xd4*\x05\x8d}\x0a\
+\xf1s\xac\x8e\x06\xf0\x9fz\x83\x09\xc0\xfb\xd5\x1f\xf3\xf2\
+g\xde\xa8Dv;f\xd5\x84\x7f\xb3\xa8\xdcZ}\xa9\
+0\x85\x01)\xc5\x90\xdd\xb0\x01\xb2I\x05\xa0\xc4g\x12\
+\xc0\xa3\x11\xf8\x99\xea\xe3\x92A\x88\xf5wSK\xf2\xc5\
+\xd8Dw[\xb8\xef+\xd3\xce\x11\xf3V\x8f\xb6\xf6m\
+\xbdQ)h\xdf\x00\xce\xeaICO:\xe1\xf1\x05\xf8\
+'\xb4\x06\x15v\xde\x83\xafO\xcc\xff\xcb\xdd{\x99\x00\
+(\xfe7\xd4\xfaG\xe5\x8b\x10\x806\xe4H\xdd|)\
+O\x89QF<\xa1{#g\xfd\xd5\x1e~\x04\x9eX\
+\xf4\xd2\xb1\xee\x0e\xf4\xe0\xed\x5cag/\xd2\xb3\xf4Z\
+\x88\xa0&\xe4\x88\x04V\xed\x04\xff\xb1?2p]\x14\
+\xff#\xb0\xdcO\xbd\xc8r{\xd9\xfa\x01\x0a\x01\xa8\x1f\
+\x00\x12@\x1e~\x87\x9c\x0f<\x00\xe9[\x0eB\xfa\xde\
+\xeb!\xf0\xc3\x05\xb1\x0a\x11ct\xc7\xa7\xbf\xc2\xbb\x0d\
+\x19\xa7\xfeB\xba\x0c\xd1\xb4\xa3\xbb\x19\x9cH\x00N\xfa\
+LV\x00\xa3\xef\x5c\x1al\xe82\x1c\x83\x7f\x8b\xec\x8f\
+>\x82\xa1\xca\x22\xe4\xffx\x01\xec%\xc3Z\xd7c\xb5\
+:\x90\x09\x806\x15a\x02\xa8\x11\xb3\x01\x18beV\
+\xaf\x81\xdc\xc6\x8d\xe8\xf9GB\x00\x9fQ\xa2\x03_\x8c\
+\x01\x0cI\xbaQ\x85\xb5+Q\xd6\x8cU\xe1\xbe\xafL\
+;G\xccW?=\xde\xbf\xed\xc6E\xda\xedG\x10\x80\
+\x0e|>\xaam\xa8\xf8g\xab\xc0B-\xbc\xd1K\xf2\
+\xe6\x1e\xb4\x17\x1e\xc6\xabT\xfbO[xG\x1bc\x7f\
+9H\xee\xe6|\xe8S\xdcT\x93\xe2l+%\xd7\x0a\
+G5\xa0Q\xed~\xd6\xb5wC\xe0\xd4\x9f!x\xfa\
+\xaf\x90v\xd1\xfb\x91d\x06A\xed\xd1g\xd3\x1bw\x88\
+\xd0\xa0H\x90@\x5c\xcbJ\x08\xbc\xf0\x07A\x00\xd4\xe7\
+\xff\xb9\x9f\x22\x01\xb4\xea\xef\xab\x82\x98\xd6\x02\xcc\xa2\x02\
+@\x90\xe7\xe1w\xf0 \x09x\xe9x\x5c\x14\xf3P\x96\
+>\xe7\xee\xbf\xe1\xe6\x9fz<\xaf\xae:4t\x1ab\
+\x05\xd0\x0c\xeeo\x8b\x10\xc0\xf9\xf9#2\x04\x08]%\
+\xa8J\x7f\xabJ\x02\xd47\x80j\x11\xb6\x1cP<G\
+\xce\xb0ZI\x1c\xd8\xc0\xeaH\xfc\x8d\xd40`@\xb4\
+\x11\xe7e\xc2\xeal@%dV\xae\x82\xbc\xa6M\x90\
+Y>\x86 '\xe0\xe3@\xb9\xcfDP\x22\x08 \x03\
+\xc1\x9fQ<\x00\xf1D\x00\x9e\x0e\xc5\x9a\xe41[\x86\
+\x9b\xf6\x9f\xb3\xba\xf1\x8b\xb7\xf6l\xf9 7\xfft \
+\xd0\x05\x01\xe8\xb2?W\xedD#I\x80\x12\x80\x16o\
+\xa7\x98\xab\x96\x1bz\xd26\xdeQ\xd4\xf8#\xdf\xe0\xd9\
+H\xde\xa2\xcc\xb5\xba[\x14\xe7\xa7\xff^\xa1F\x9a\xee\
+#\x7f\xc5\xc7m\x92\x00FY\x09\xe4\xde\xf6(\x82\x7f\
+Q\xce\xafS\xdb\xee\x05H;\xef\x0a\x0d\xc4jr\xd0\
+V\x12\xba,\x98~\x16\xdf1\xcd\xfd\xfa}\xc7\x15\x0e\
+\x07\x1c\x0f>\xc9\xd5xb\x9aO\xe6\x18\x0a\xc6\x14\x0a\
+\x01\xa8\x80\xc7\x81\xc0\xf7Q\xdf\x80\xd3\x0b\xdc\xef?\xf8\
+\xea\x02d\xdd\xf40W\xd1\x19\xc2\x11\xc5\x16\xe2\xfdu\
+\x05\x10C\x04\xf0\x9d?r\xdd\x81\xfb\x0bGy\xb1O\
+\x88\xda\xd0\xba\x12\xabd\xa0*\x81\x11H\x1a\xdd\xce\xad\
+\xc5\x89\x08\x93g\xf7J\x02\x18\xd4\x06\x91\x80\x85w\x1b\
+\x16\xd3\x81\xd46,\x12I\x80\x96\x05;[6Cv\
+\xd5J\x1d\xec|T\xcf\x07 ]\x1e\x13\x83=\xb4\x15\
+\xb9\x12\x95\x18<\x1c\xee\xfb\xca\xb4s\xc4\x9a\xa6.\xbd\
+\xb2k\xe3\xfb\x17\x9c\xb2\xd9d^\xb5\xb1\xfd\x94~\x14\
+\xe7\x93\xa8\x00P\xaez:\xb5\xe2\x1f\xee\xf3O\x04\xe0\
+jf\xc0\xab\xd2\x9f\xb3\xff\xb4\x1f\x1f\xc9\xe6\xbf9\x22\
+d\xfa\xf7^W\xac\x1eQ\xc4\xc3\x1bx\xf8:\x10\x88\
+\xff\x86\xa0\x5c\xd4*\xec(\x16\xf7|\xe3\x17D\x1c\x12\
+\x94\xa1M?m\x06\x8f\xcc$\xd0?\x07\x81#\xaf\xb3\
+7\xa7\xf7\xc9\xba\xe1\x13\x08\xe8\x01M\x09X\x0b\xd4J\
+\xc0\x05\x85B\x80\xec\xab?\xa6\xa4L\xef\x84\x14\x0c\x0b\
+\xe2\xeb&xW {\xd1R\xc0\x8b\xe5\xc2\xb6\x12#\
+\xe1\x8c\x81\x05cy\xcf\xd17\xf9wq}\xfey$\
+\x80\x91P\x020.\x17\xe6u\x04\xf2\x88* \xa1\x7f\
+=\xcf0`(\xa4\xa4l\xbcT\xe6\x00\xc4L\x00\x83\
+\x9f\xf2&\xdc(D\x16\x04\xc9\x5c@Z\xd988[\
+7CN\xcd\x94\x00}\xb1\xf0\xf6\xd2\xeb+L\x00\xf2\
+qR>\x12\x80\xab\x0d\xa2R\x8b\xee\x0f\xf7}e\xda\
+9b\xd5c{?\xd26w\xcd\x22\x95\x9b\xe6I\x90\
+\xabD@^\xdf\xd8\x91\x86\x16\xa5X)^E\x10\x13\
+\x01\x88\xa5\xbf5\x92\x00Z\xb4\xccv(\x01\xb4)\xce\
+\x87\xbe\xaa\x90\xf4\xf5\x9ex\x8b;\x00QSO\x9eV\
+\xf3uB\xe0\xd8\x9f\xc0wJ\x11\x8d=H\x92\xd3\xae\
+?\xa7\xdf\x04+\x02\xc0\xae\xf6\x050V\xf6\x19I@\
+\xe6\x04\x12F\xb7\x80\xff\x85\xdf\x09%\xf0\x22\x92\xc0u\
+w\xe0{\x0fpW_\x9a\x05H\xa6\xb5\x00\xf8\xbe\x94\
+\x04LY{\x89\xdcIhL_\x14$\xd7\x06\xe8I\
+H\xa3\xda\x18\xe3\x1a\x80Xj^r\xed\x03\xd43P\
+\xe1\xaa\xc2\xfb\x9f\xc1\xcf\x9e\x0c\x05\xbf\x81\x00\xb4\x16b\
+\x85b\xb3\x91\xe4\x91\xed<}\xe8:\xba\xc8\x05Q\xbc\
+\xe9\x89\xdc\xad\x98C\x80\x82\x01\xb1.\x80\x15\x80\xae\x02\
+x\xeb\xb0\xf6m\x90[\xb7F\x07>\x8f~~\x9cn\
+\x18)L\x00\xad\x10\x9dV\xf2h\xb8\xef+\xd3\xce\x11\
+\xab\x1c\xdd{G\xcb\xcc\x95\x0bTaF\x9df\x09\xe8\
+F\xef\xaf\xaeF\x13+\xd2\xc6y++\xf2\xe2\xea\xce\
+\xbe\x22\x01X/\x1a\x7f\xaa\xb2V\xde\xdcr\xd9/\xe4\
+\xdd\xf2\x19\x8e}\xfd\xaf\xcc+\xd6@\x9f\x9a\x03\xe0\x86\
+\x9b\xb97?$B\x00\x8a\xe5OrK.\xf0\xbd\xbc\
+\x00\x19\xd7\xdd\x0fvT\x1bK\x1b\x81\x86Jn\x09\x5c\
+Z\xa9W?\x0a\xfe\x1f\xfcNn\x18\x8a\xf1\xfe\xdd\x8f\
+q\xd1\x0d7\x04\x99\x95I@\x9a\x05@\x02\xb0\x15\xea\
+\x0b\x8e\xac*\x01\xc8\xf9~\xb1\xb3\xd0\x08\xefCH\xa5\
+\xc618l\xc5\x18w_~'\x04^\x5c\xe4\xf8\xdf\
+\xf7\xca\x02$\x8d_`h/>a\xc8\xfa\x0f\x81\xd8\
+mH\x97\xffD\x00i\x9b\xf7\x83\xe7\x05\xca9\xccC\
+b\xef\x06\xdeV\xccb\xc8\x01\x90\x02P+\x02U\x15\
+@5\x01\xa9%#\xe0\xe9\xd8\x0ey\xf53\x9a\xf7O\
+\x0f\x19\xfd\xdaH\xce\xeff\x02\xb0d\x96?\x19\xee\xfb\
+\xca\xb4s\xc4\xca\x86.\xbc\xaby\xcd\xa1\xc5\x9c\xb2a\
+^{N$\x90\xa7\xb5\xa0\x12\xddgs\xe4\xc8\xaa\x18\
+\x13[l{;\xc5\xd2_\xa1\x00\x14\xaa\x01\x10\x04\xa0\
+z\x7f\xb9\xad\x17-\xfb\xa5\x9e|\xdb.W\x5c(\xbf\
+)\xf1\x96\xd8\xbfQ\xb1\x17\xb0<VX\xe2\xe3\x0d\x9b\
+\xfd\xe1\x07\xc1\xfdw?\xe1~\xfb\xde\x93oqsP\
+j\xf6\x99u\xe9\x9d\x9c$\xb4\x1b+\xed\x8aCs\x01\
+j\xa2\x90d||\xcb$\xf8\x8f\xbe\xce\xab\xf1(\xb3\
+\x9f{\xf8s`\xf3\x0e\xa2\xc7\xdd\xc3u\x00y/,\
+(j[pm\xfaNU\x14Eb\xf6!\xa9c\x0e\
+\xf2n\xfc\x14\xf8\x9ez\x09\x82\xdf\xfa9\x92\xca\xef\x95\
+\xfc\x1f\xbd\xad\xd0\xd4\x1f\x91\x93\xf7e\x05\xb2\xae\xbc\x9b\
+7\xf6\xb4\xc9\x5c\x84\xbdd\x12\x92\x90@s\xaf\xbb\x17\
+\x9c\xf7=\x09\x99[\x0f)\xd4\xa5\xc7.\x97\x09\xd3\x1e\
+\x03\x997>\xc4\x05K\xf9\xff8\x8f\x7f\x93!\xd1\x10\
+%\xdf\xa8\x00\xe4Q\x12@\x94P\x01JZ\xe9\x08\xf8\
+:w \x01\xacE\xf0#\xd0\xd1\xf3\xa7\x17\xf5\xeb\xe0\
+/\xd2I\x80\x14@d^\x13Dg\x94?\x1b\xee\xfb\
+\xca\xb4s\xc4J\x07/\xb8\xaba\xea\xb2\xc5\xec\xb2!\
+\x09\xfaq\xd9\x85fL4\xa3\xa8\x18\xd5\xdaP\xd1*\
+@\xf2p\xe4\x19\xb5\xed\xbd\xe5\x0c@\x94\xa7\x8d\xc1\x1f\
+%\x15\x80:h\x16 \xae}\x16\xc1s\x06\x88\x04\xd2\
+.\xbeA\xdf\x99\xc7XC\x8f\x04\x12\xebn\x83\xe4-\
+W\x82\xff\xc4\xdb<\xcf\xef;\xb5\x00\xc9\xe7\xbd\x0f\xec\
+\xf9\xea\xac\xc0\xd8\x12%`\x5c\xfa;&\x1a|\xf6\xaf\
+S\xfc/\xbc\xce\x89:\xca\xf0\xd3\x0cC\xe2\xea\xf3H\
+\x01\x88\x9d\x81\xd6\xee\xd5J\x81\x8d\x9d~\x08\xfc\xc9\xeb\
+\xf7\x81\xff\xe4\x9b\xdce\x98\x0aw<\xc7E\x8f@R\
+/D\x00\xbe\xd3g \xfd\xc0\xc7 \xd6\xdf\xab\xf5-\
+\xa4cl\xd5 \x04\x8e\xff\x86s\x10\xde\xd3\x8a\xc2[\
+\x99=\xf2\x1c\xd8i\xb3\x13R\x00\xdeV|\xed_x\
+\x1a\xd0\xf5\xa5\x97\xc1\x86q:'He\x08\xc0*\xa0\
+\x80\x96J\xe39\x81\xdf\xd1\xc0\x04@u\x01\xe9\xe5\xe3\
+\xe0\xef\xda\x09\x0e\xa9\x00\x04\xf8\xfb5\x05\x90V\xdc\xaf\
+]#\x05\x10\xe9hR\xa23\xcb\xbf\x1c\xee\xfb\xca\xb4\
+s\xc4\x8a\xfav\xde\xde\xb0\xfa2\xa1\x00*to/\
+\xfa\xcf\x8d\xeak\xd1qP\x1fz\xb5\x0b\xae\xaa\x00\x22\
+e\x0e \x9ar\x00*\x01\xc8\x05@\xd4\xf8\x03or\
+\xc5\xe2n\x07\xf7\xb7\x7f\xc9\x95\x80\xfe\x17~\xa3\xd8<\
+\xed\x8aM\xce\x04,\xf5\xe86T\x07);\xaf\x01\xdf\
+\x89\xb7\x18\x88\xc1W\x17!c\xfbu`\x0b\xf4\x8bd\
+\x9d\xd6\xef_\x96\xdb\x16\xe9\x1d\x83\xd9#\xe3\xf5\xc4\x91\
+M\xf89\xff\xc2;\xf7\x90dw<\xf6m\xc5\x81\x84\
+BI\xc0\x94\x99\xbdZ\x0e@[\xc4Cy\x82U\xe7\
+\xf3\x9a\x03\x8f\xac\x0b\xf0\x1dy\x03<\xdf\xc2\xf7x\xee\
+\xd7\xe0~\xe6\x15\xc89\xfc\x04\x02]\xac\xf6\x13\x9f#\
+\xba\x03\xc5\x22\x98\x9d\xb7~F\x14\x07\xe9\x0dJ!\xf8\
+\xa3E|\xfej~N\xd6\x15\xb7r\xa3\x11\xe7Q\xfc\
+\xfcm\x97AL\xfe\xa8\xf4\xfc\xaa\x02\x18\x94!\xc0\x80\
+\xf0\xfeTT\x95'B\x80L\x0c\xbb\x82=\xe7#\x01\
+\xacE\xa0\xf7\xf1HC\xc0\xeb\xa3O;&\x05i\x16\
+\x01\x09 \xb5\xf8\x89p\xdfW\xa6\x9d#\x96\xdf\xb9\xfd\
+#u\xab\x0e.\xd0b\x13\xd1on4d\x88%\xa8\
+\x82\x00\xe8\x9cA\x17\xe8\x11S\x80Z\x0d\x80\x9a\x04\x1c\
+\xd6J\x81-\x5c\xee:\xcc\x85@8\x94\xf4+nG\
+@\xce+\x94\xad\xcf\xba\xfe\xb0\x22\xc0;\xba$\xa6\x1f\
+\x17\x0d6\x83\xc3\x90\xb4\xfa\x02\xf4\xc6\xf3\xac\x04\xa8Z\
+/\xe3\xfa\x07\xb8\xd0\xc7\xe2\xef\x01+\x0d\x1f\xc5\xe8\xbd\
+r\xce\xdd\xd0\xa8\x93\x80\x89\xe7qM\xa3\xe0\x7f\xfe_\
+y\xda\x8d\xa4w\xde1=\x07 Z\x82\x89\x1c\x04\x83\
+\x7f\xdd\xc5\x10x\x95V)*\xdc\x118\xe7\xae\xcf\xf2\
+N=\xb4\xd6\x80\xd6\x17\xd0f\xa2\x94l\xb4\xab\xc4\x91\
+\xdfG\xcb\x83\x95\xac\x8f}\x0e|\xdf\xff\x1d\x04_\x9c\
+W\x1c'u\xf0S\xc2\x91\xf2\x04\x09\x1d\x1b1Th\
+\x03\x1f}\x0f\xfa\xddO\xfd\x15_?\xb0D\xfe\xab9\
+\x00Q\x15H-\xc2\xa2\xa9Y(+\x80:\xc8\xa9Y\
+\x0d\xf9\xbd\xe7C^\xed\xb4\x04\xbf\x81\x00\x0aU\x02\xe8\
+\xc5\xf3>H\x0ct\xa2\x02h\x86\xe8\xd4|3\x09h\
+\xda\x7f\xce\x82\xed\x1b\x0fU\x8f\xefC\x050\x12\xe2\xed\
+\xd5\x91%\x1bP\x88\xc6\x13#\x22\x83O\x95\x80Z\x0e\
+@\x12\x00\xd7\x01\x0c\x19\x08`HK\x06\xd2\x0do/\
+\x1bV\x82?\xe4\xa5\xc0\x8a\xef\xdb\xbf\x16\x09\xb6\x22C\
+!\x8d\x9c?\xd7\xb6\xf7F\x02I\x9a\xbbH\xa1\xe5\xc3\
+\xb4=7\xaf\xab\x7f\xe1_\xc1\xf3\xe8w\x14\xcf#\xdf\
+\x02\xf7\xa3\xdf\x05\xf7\xa7\xbe\xaed]\xf6\x11\x8c\xdb\xd7\
+qko\xbb\x94\xe4j\xbf\xff\xf8\xf6UH:\xafs\
+N\xc1qL(\x80T\xb5#\x90\xfc\xac\xb8\xea\x11\x08\
+\x9cz\x93C\x06/*\x80\xac\x0f<\xa4U\x04\xda\x96\
+T\xf9\xd1\xf5\xd4\x8d\x07!x\xf2\xf7\xec\xcd\x9d\xc7\xf4\
+\xee@\xdc\xb5\xe8\xa4\xc2k\x0a\xf8\xbd^\xf8\x1d\xc4x\
+\xba\xb8\xd9\x89\x8f\xb6;\xc3\xe7:\x1e\xfc\x12XQ\xc9\
+X\xf3e\x8e$\xdf0\x13@G\xd9#\x90G\x9e\x08\
+\x01\x9c\x0dk\xa0\xa8\xff\x02\xc8\xadY\x85 \xef\x15\x80\
+/\xec3\x1c\xf1;\x15\x0a\x02H\xf0wBD^\x13\
+D%\xfa\x1f\x08\xf7}e\xda9b\xde\xfa\xe9\xcd\x95\
+c{\x17B\xfa\xcc\xa9\x8d'\x98\x00\x8cKPG\xc0\
+N\xd3bx\xc3R3P\xd1\x00TN\x03r'\xa0\
+!\xd1\x08D\x9b\x09\x18\x16\xeb\x01\xf0\x98\x89\xb1\xb8\xf7\
+\xf93(\xc9\xcf@\xf6\x07\xee\x09\xd9\x82;\xb4\xeb\xaf\
+\xac\xe2\xa3~\xfd(\x9fS\xb6]\x0dA\x0c\x07\xa8\x94\
+\xd8\xa5\xee\x16\xac\x0e\x9aZ\xc4k\xf9\xaf\xccC\xd6\x8d\
+\x0fsS\x0f-\xa7\xc0{\x08\x8eC\xc2\xc8z\xf0\x1f\
+}C4\x05}A%\x00}\x16 \xef\xf0\xe3\xe0;\
+*:\x0bg\xdd\xfc)n\x0ej/2\x96\xf8Je\
+\x82\xbfG\xf6]\x8f#\xd0\xc5\x06\x22\xb4\xdd8\xedC\
+\xe0\xfc\xd2KJ\xf6\x9d\x9f\x05\xc7C_\x82\xfc\x1f\x22\
+\xf0\xd1\xf3{\x7f\xf0[H\x9a<O\x89\xa5\xdd\x85\x0b\
+\xbb!x\xfc\x0d&\x00\xdf\xd1?\x81\xd5\xdb\xae\x13\x80\
+6\xa8\x1d:\xad\x9b\xe8\x93\xe0o\x90\xb3\x01u\xe0i\
+^\x07%\xc3\x17s)p\x9a\x04zj\xa1\xee\xf5\x05\
+\xf8\xc5\x88\xf5\xb5\x93\x02P\x22\xe3\x9cw\x85\xfb\xbe2\
+\xed\x1c\xb1\xd4@\xe7D\xe9\xe0\x9e\xc5\xbc\xcaq%{\
+i\xab)\x09\xfeL9\xb8\xf5T\x09e\xbd\xc7x\x17\
+\xe0e\x04`\xe8\x00\x14\xcd}\x00\x86\xc5\xac\x01\xcau\
+\xe7S\xa7\xc1}\x04c\xe3W\xde\x82\x18o\xbb\xb6\xfd\
+\xb6\x0e2C\x92O[[?\xcek\xf5\x13z7*\
+y\x0f~\x19\x5c\xcf\xfe\x14<\xdf\xfc=\xb8\xbf\xfb:\
+\xf8N\xfc\x15|/\xcd\xf3l\x01)\x04\x02p\xce\xdd\
+\x9f\x055\xfbn\xd5\xdat\x8dA\xc6\xae\xabX\x96k\
+\x0a\xa0P\xb4\x01\xa35\x0d\x8e'N\x8a\xa9\xc3\x1f\xbc\
+\x8eR\xbfK\xef\x03\xa8&\x1by\xe3\x90~\xc8\xbd\xe5\
+a\x0e%\xbcr\x9a\xd2u\xff\xd3\x10[!\xf2!\x5c\
+\xaa\x8c\xbf7\xe5\x08\x12&vrk2uI0\xed\
+\x17\x90\x87\xc4\xe18\x82\xe4\x87*&qh3\xaa\x00\
+\x0a\x8b\x06%A\x0e\x8a\xf3B\xea\xb2\xd4\x03\xd1\xce\x06\
+\x99\x07\xa8\xe3<@\xb0c3T\x8c\xed\x87d\x8c\xef\
+\x09\xec\xa9\xd2\xe3\xab#\xcdp\xb4{\xda\xa8O\xe3\xa2\
+5.\xfb\x92p\xdfW\xa6\x9d#\x96\xe4\xac\xed,\xec\
+\xdb\xb5He\xbej\x97\x19\xad\xdb\x0c\x92\x00\x83\xbfT\
+\x0e<O,\x1d\x87\xf8\xf2\xd5\x10A\xddk\x0d\x0b\x81\
+\xa2\xf0\xc6\xe5m\xc0BJ\x81\x87\x85\x87s\xb5\x82\xf7\
+\xc5\xb7\xc1\x8d\xf1x\xee\xe1/\xa0\xa7\xea\x16\x9blr\
+\xfcn\x04\xbc^\xc7\xaf]WK\x82\xa9\x7f\x005\xfc\
+p5cl\xde\x0c1\x8e\x06%&\xa7\x8e\x9b|\xfa\
+\x8e\xfe\x05\xd5\x80h\xba\x91y\xdd\x1dL\x02j!\x0e\
+\x01\x98\x0a\x81\x1c\xa7\xd4\xd5\x80{e\x0e\x00?\xdb\xdf\
+\x05\x0ej)F\x0a\xe0\xab?Wl(\xd9\xad\xc6\x99\
+\x06z=\x81\xff\xce\xcf\xf1\xae\xc5\xbc\x02\xf1\xd8\x9f \
+i\xe2|TA\xc3\xa2\x8d\xb9\x9c\xef\xe7\xd0\x88\x09g\
+D\xb4\x05\xe3\xdf\x8f\x16\x02\x8d@\xc2\xd06\xa1\x16\xf0\
+\xf7O\xddq\xb9L\x02\xaa\xbd\x12\x84\x1a\xb0\xd2f\xa3\
+\xbeN\x8e\xffY\x05\xd0\xdf4\xab\x02\x8a\xfa\xce\x87\x8a\
+\xd1}\x90\xe4o\x87\xd4\x82^1\x0a{\x0d\xe7=\xda\
+5\x9aI\x89t4*\x91\x91qc\xe1\xbe\xafL;\
+G\xac\xa4}:\xce\xd7\xb2\x81\xd7\xfc\x8b5\xe7\xc3!\
+#s\xc9\xba\xf3\xa4\xb2IH\xacZ\x0b\x91r\xebo\
+\xde\x00\x94\x9a\x818\xea\x15\xda%H\xefw\xa7N\x03\
+\x0eAl\xfdZ\xf0\xbd\xc8e\xb0\x90\xba\xfd\x0a\x0c#\
+V\x86,\x08\x12^WT\xdc\xa9+\xffl*\xf0\xb5\
+\xe5\xc2\x13!\x95z\x1a9 \xc0\x93V\xed\xc2X\xff\
+\x0f\x9c\xf5\xe7J\xc0k?\x86\xc0\x1d\x10\xefU8\x01\
+\xa9kw\x83\xf34)\x80\x05\xb95\xd8\xb8\xd8\xe9\xd7\
+\x87\x04\xf0\xc4K\x22\x96\xff\xea/\xa5\x02\x18\xd3J\x7f\
+\xe9\xf3\xd3\xb6_\xcd\xbd\xfdH%\xf8O\xfd\x19\x12\xda\
+\xa6\xe4wT\xbf\xfb\xd2\x15\x81r\xfbru\x96\x03\xc9\
+ \x1a\xff>\x81\x7fX\xe0\x12\xe2\x9c\xdb\x1e\xe3%\xd2\
+Z\x0e@\x9d\x02D\xb2\xb0 \xb9\x89\x10@*\x80\xcc\
+2\xa8\x9a8\x08\xc5}\xbbX\x01\xa4\x14\xf4\x88\xc1\x04\
+\xa0\x03_(\x80\x1e|}\x0b\xfeOj\x94\xb8TO\
+]\xb8\xef+\xd3\xce\x11\xab\xe9\xdf\x10\xe1\xaa_\xf3\x07\
+G\xcdj\xd1^\xaaLo<A\x8f3\xe4\x12\xd4\x0c\
+>\x1f\x84T$\x80\x84\x8a)\xb0P\xf3\x0a\xad\x14\xb8\
+V\xdc\xb8\xe8\x81\xa2\xb4f \xd2\xb3\x05\x87 \xbek\
+=xN\x9dQ\x9c\xe8\x81\xd3\xb6]f\xd8\xbbo,\
+\xc4\xf3\xd3\xecB</\x17\x1e\xe4\xed\xb7\xf5\xd5y\x13\
+\xcbg\x0b\x8a\xc7\xf5i<\xf4\xe8q\xad\xab p\xe4\
+\x8f\xac\x02\xa8\x85\xb8\x03%:\xc5\xf3\x5c\x09H\x1b\x83\
+\x9c\x169\x80\xb4\xd9\x03\xa0n\x18B\x0a \xef\x89W\
+\xc4n@_A\x02@\x05\xa07\x13\xc5\x9f{P\xb9\
+\xd0t\x22y\xfe\x97\x16 yd\x07\x7f\x96\xaaPl\
+\x86<\x86V\x09\xb8\xe41\x11\x80%\xaf\x06</\xcb\
+\xbe\x05\x0f?\x8b\xef\xdb\x1d2\x0dH9\x01\x22\x80h\
+\x99\x00\x8c\x96\x04\x10\xebjd\x02\xf06\xcd\x22\xf0{\
+5\x02H\x95C;G\xf0g \x09D9\x9a\x91\x98\
++\x17\x02\xb5#Q\xe1\xbe\xafL;\x87\xccQ;\xf5\
+eG\xfd\x9a\x90f\x13\x19\x86\xa3\x0a~Z\x8c\x92^\
+6\x06\x89\x15\xd3\xdc}'\x22\xb3\x0a\x22\xb9\x18Ht\
+\x04\xa2m\xaf\xa3\xf3\x07BT\x00\xdd\xe4q\xeds\xe0\
+9=\xcf\x99\xf3\xd4m\x07\x15Q\x8a\xab\xaf\x9c#\x8f\
+\x9e\xdc\xb7\x01\x0aN\xfc\x01\xfc?T \xf8\xe3y\xc8\
+\xb8\xf4v\xb0\xfb\x07CB\x02[\x88w\x1e\x0b\xad\x1f\
+\xa0\xac\x7f\xf7\x1c\x82\xf5\xcfzN\xe0\xaeG0.\x1e\
+\x80\x94\xe9\x0b\xc1uZ\xf4\x03\xa0\x8e@\xb4DX\xed\
+*\xec\xf8\xe2\xcb\x5c\x9f\xef\xfa\xea/x\xbaO\x0b\x01\
+h\x11\xd1\xc6\xcb)n\xe7*@\xc7\xc3_g\xd9\xaf\
+\xef\x0dh\x0c[B\xfa\x00(K\xaf\xd1\x8eA\xdeW\
+\xde\xe6\x9a\x84\xbc\xfb\x9f\x11MU\xd5\xa9@\xf2\xfe\xac\
+\x94\x06\xb8/ \x81?\x9aI\xa0\x0e\xd2\x0b{\x95\x8a\
+\xd1\xbd\x90[5)\xc0\x9fO\xa0\xef\xd6\x80\x1fB\x08\
+\xf9\xdd\x10\x91\xdbH=\x01\x7f\x11\xee\xfb\xc9\xb4s\xc8\
+\xaaz7D8\xea\xa6nr7o\x80\xcc\x92~E\
+o8!=\x7fI\xe8\xe00\x00C\x80\xf8`\x1fw\
+\xaf\xe5\xe5\xc0\xb2%\x98\x96\x08\xcc\x1f0,s\x1d\x82\
+\x98\x8a\x95\xda\x16`)\xbb\xaeC\xf0N\x86\x14\xe2\xc4\
+\xf8; \xff\xe5?\xf14\x1a\xaf\x078\xb5\xc8\x9b\x85\
+\xa6\xec\xf8 z\xf6\xf5<b[\xf0\x88#\xb6y\x0e\
+\x1f\xaf\x03{\xcd*^L\xa4\xc5\xea4\xff\x8f#\x91\
+\xc2\x81#\x7f\xe6\xde\x83$\xdb\xb3\xae\xbd\x13\x92\xa8\x12\
+\xf0\xc5P\x02\xe0\xfd\x03\xfc\xdd\x18\x02\xbc\xa8\x08\x05\xf0\
+s\xa0F\xa0b_\x01\xb1P(\xebC\x9f\xe2\xef\xec\
+\xc1\xd7\x8an\xc2\xe3\x86Y\x8bqY\xf3\xbf\xbc\x11\x88\
+\xd6\x0f\xa0X\x10\x8d\xc5\xd7\x06\xfe\x1f/\x88\x1d\x90\xae\
+\xbe\x07\xac\x01\xbd\xfaO#\x00N\x006j\x0a\xc0\xe2\
+\xa8\x037\xfe\x8e5+/\x15e\xbe\x12\xe8\xc9\x1a\xf0\
+\xbb\x0d\xa4\xd0\x03\x09\xbev\x88\xc8k\x04Kz\x89\xd9\
+\x14\xd4\xb4\xff\x9ae\x14\xf4\xccz\xdb\xb7Af\xb1J\
+\x00\x83\xd2\xe3\x0f\x19\xd6\x9d\x0b\x02\xc8\xc2\x91V\xb5\x06\
+Rkg!\x22\xa5P\x89\xd0\x14@\x1d{-\xda\xf9\
+F\xdb\x13@-r\xc1\xd8\xd6w\xfc\xdf\x14J\xa2\xe5\
+\xdc\xfb\xac\xa2N\xd7\xa9\xd2\x9fz\xf6y^\x11\xad\xb6\
+]\xea\xa0\xf9u\xf4\xda\xbe\xd7\x16 \xf0\xda<x\xf1\
+\xe8\xa5b\x9d\xd7\xe6\x15\xff\x0f\xf1\xda\x8f\xf0\xf1w\x7f\
+\x86d\xb0\x96\xe3|\xab\xa147i\x12I\xe0\xf8\x1f\
+\xb9\xb0\x87<\xbf\xebo\xff^q\x9dZT8\x07\xa0\
+n\x0dV(\x08 \xef\xc9\xd3\x9c\x03p\x7f\xe5\x97\xda\
+,\x80\xaa2\xa8\x8b\x8f\xe3\xd8\x82\xe2~y\x01\x12\xc7\
+v\x87l:*T\xc78*\x8c.\xb0{{\xc0^\
+0\xae+\x1b\xc3,\x04)\x89\x94mW\xe0\xef#6\
+\x0dM\xdd\xb4\x9f\x97(\x8b\xca?\xa1\x00,\x18\xeeX\
+0\xdcP\x09\x80s\x00H\xae\xd5\x13\x07\x95\x9a\xc9\x83\
+\x90\x88\xe0N&\xa0\xa3\x97'\xc0'K\x02\xa0\xd2_\
+&\x02<\xda1\xfc\x8a\xc0\x10\xc0\x92\xe00{\x01\x98\
+\xf6_3{Jq\xa5\xabu+\xcd\xfb+*\xd0\xd3\
+U\xd0S\xcd\xb9|L\x83\x14@:z\xf4\x8c\xc6M\
+`\xa1\xb6U!S\x81\xe8\xbd|\xddb_\x00\xb9\xc0\
+\x85\xa4-\xad\x00t>\xfe\x02\xd7\xc2\xfb_}\x0b\xec\
+\x81.9\x0b \x96\xfb&\xf4l\x04\xdf\x8f\x16x\xb3\
+\x0dA\x00\x0b\xb2\xd5\xd7\x02o\xd6\xc9\xd2\xf9\x98(\xbc\
+q\xc8#7\xe6\xc4\xe7\x04N\xfe\x19\xe2*\xf4\xfe\x00\
+<\xff\x8f\xe0\x8bk[\x03\xbe\x17\xfe\xc8\x95\x80T3\
+\xe08\xb1\xa8\x88R\xe0}\xa2\x14\x18\x87\x85\x14\xc0\x17\
+)\x09H\x1b\x82\xfe\x82\xf7\x06`\xe0\xca\xf7\xc8\xba\xed\
+Q\xfe<\xf7\xab\x0b\x900v>\x03^\xdbt48\
+\x04i\x97|\x00\xbc/\xfc\x16|\xdf\xff\x0d\x86,7\
+s\xbb4U\x0d\xa8\xb3\x1c\xb6\xfca\xc5\xf1\xc9\xaf\xf0\
+4\xa0\xe7\xd4\x19\x88m\x9a\xe2\xf5\x11\x96\x02\xbd\x16\x80\
+j\x00H\xf6[(\x04\x90\x04\x10\xe7n\x82\xc65W\
+\x82\x1fU\x0f\x01\x9d\xc1\xae\x0e\x02\x7f\x81\xfe\x98~f\
+\xe5\xdd\x85\x1a!\xc6\x962\x13\xee\xfb\xc9\xb4s\xccJ\
+\x9bWF\xe5\xd4L\x9f\xc9\xad^\xb5\xa4\xdb\xcc\xe0\x92\
+\xa5\xa7|M\xc9(\x1b\x83\x8c\xda9H\xc4\x1bW\x84\
+\x00\xd5\x22\x11H\x0a\x80:\x03\xab\xbd\xeed\xa9+\xcd\
+sg^}+W\xc4Q{\xec\x9c\xeb\x0fsSN\
+{\xe1(\xaf\x08\xb4\x91'\xbe\xf7)\x91m\xa7:|\
+*\xa5E`\xe7\xdd\xfe\x08d\xdf\xfa(\xe4\xdc\xf6Y\
+\xc8\xb9\xf5sJ\xcem\x9fSr?\xf6Y%\xef\xf6\
+\xbf\x05\xe7\x17\x8er\xf5\x1d\x91J\xda\x9e\x0f\x18\x9a\x86\
+\xe8\xf3\xff\x09\x9d3\xa4<\xb8\x12\x90\xd6\xf0s\x12\x90\
+f\x01\xd4\xc5H\xfe\x1ep<\xf52+\x0f\xef\xb7~\
+\x0di\xa3[!m\xf2|H\x9d\xc01\xb6\x03\x9c\x0f\
+>\xc3y\x0bR\x11Y\x97\xdd\x0aiS\x17\xe1\xd8\x83\
+\xe3b\xc8\xb8\xfa\x0e\xf0\x9f\xd6\xb7\x0a\xa3\x12\xe2\x8c\x9d\
+W\x88~\x87\x86\x11W5\x82\xcf\x13\xad\xc0h\xcb1\
+\xab\xa7M\xcf\xfc\xab\x04\xe0\xefB\xe07\xcaA\xf2\xbf\
+\x1e\xf2\xca\x87\xa0v\xe5A\xda\x16\x5c\x03\xbf\x0azq\
+\xec\xd2\xaeSh\x10\x99S\x07\x91i\xa5\x8b\x89\xe9\xde\
+\xdcp\xdfO\xa6\x9d\x83\x96U=}$\xb7fZ\xa1\
+%\xa7\x1a\xf0\xe51\x8dW\xa1\x85\x12Af\xc3\x06\x0c\
+\x05\xa6ySP\x0e\x01\xa8$X.e\xd5\x1a]\xe6\
+\xeba@L\xb0C\x09\x9ez\x9d\xbd\xb1\xef\xd8\x1f\xd1\
+[\xf7\xca\xe6\xa0\x02\x8cv\x7f\x1f\xe4\x5cw;\xb8?\
+\xff}p|\xec3\x10W\x8d^\xbcpR\xa1)C\
+\x1a\xb6\xe2I\x88\xc5a\xa3\xf3\x22<b\xbc\x9e\xff\x93\
+E\x85\x16\xefd\x7f\xe41\xad\x04X#\x01$\x17*\
+\x22JZ{\x89B$\x80JB\xac\x06\xa4\xbd\x01\x0b\
+\x84\x02\xa0yw\xe7\xd7\x7f\xa6\xf0\xcaA\xf2\xf4\x04f\
+\xda\xb3\x90\xaa\xfc\x8e\xcf\xd3\x9e\x84\xdc\xfc\x83\x06\xb54\
+s\x89>\x82\x8a\x17\xaf\xfb\x08\xf4T\x11x\x5c\x5c\xe7\
+\x8e\xbf\xdf\xfc\x05X\xbd\x1d\xa2\x11h\x81\xac3x\xec\
+\xbb\xa8B\x14\xde\x0b1\xe3\xc0\x8d\x22\xe3\x1f\x1c0x\
+\x7fj\x9a\xd2\xca\x05@T\x03\xc0aTf9T\x8e\
+\x5c\x04\x0d\xd3W@\x92\xbfC'\x80\xfcP\xaf/\x8e\
+]\xbc\x06 \x22\xa7^\x89J\x0d\x1e\x0b\xf7}d\xda\
+9jiE\x03\x1f\xcf\xad\x9bU2\x8a\xfaAm3\
+\xa5.7MS\x9bN\x14\xc9\xe5\xa88r\xeaf!\
+\xb7e\x1bDe\x8a\x92`\xae\x05\xc8\x95\x04\xe0\xe9\xd0\
+6\x07\x15m\xaf\x079\xf1\x95\xb1\xfb*\xd1\x8c\x93@\
+\xf5\xc0\xb3Jl\xa0\x0f\x15\xc0\x88bS\x0bi8\xfb\
+>,\xe7\xfbeK/-\xebnL\xb8\xe1\xf3r\x1b\
+\xa1\xe0\x9f\x14\x06^\xce\xedO\xc8\x95\x81:\x09X\xd5\
+\x19\x83\xfc\x11%c\xffM\xe0\xa4\xfe\x00\x94\x03\x98\x15\
+;\x03\xc5\xe1wJ\xbf\xeav\xee\xf0\xcba\xc6\x91\x05\
+\x0e\x17\xa8\xdc\x98\xfb\x17\x1eS\x81-j\xfd\xc9\x83\xd3\
+g\x89\xc7r\x9b2$\x1fR\x00N\xb9\x1e\xc0\xfd-\
+1\x93@\x85@\xb4\x81i\xc65\xf7\xe1{\x88\xd9\x0f\
+\xf77\xff\x91\x8a\x97DND\xb6N\x17*`\x98[\
+\x8dEiS\x80\xb5\x90\xe4kU\x9ag\xae\x81\xf2\xa1\
+=\x90\x84\xe0N\x96@\x17\xa0\xef\xd2\x1fSm\x00\x0e\
+\x9b\xbb\x99\xe4\xbf\x12\x9d\xe4\xbb6\xdc\xf7\x91i\xe7\xa8\
+\xc5e\x94\x0f \xa8\x17\xd3)\xf1\xa7\xae3\x97\xde_\
+]}\x96n8\xa7\xddjr\x9b6A\x1cz\xbcH\
+\xad/@\xad\xd8 \x84bY\x83\x0a\x10\x83\x1a\x89\xf4\
+(\x9e\xaf\xff\x03\x83\x89I\xe0\x91o\xa02\xe8c\xc0\
+\xe8\xf3\xe7\x86*<C\xd2MM\xf2Y\xe5\xcf\xac9\
+D\x00\x8b\xb2\xb8\xe6\xf3\xc2\xeb\xca\xae\xbc6Cm\x01\
+\xc5\xe2IS\xbb\x14\xd7K\x0bH\x00\x94\x03\xd8\xcf[\
+z\xa7_s\x1b{p\x02?U\xe9\xa5]s\x8f\x92\
+\xb1\xf7fH\xbf\xe8\x16H\xdf\xf3a\x1e\x19{n\x84\
+\x8c\x0bn\xc0\xf1AH\xe7\xe3\x07 m\xe7\xfb m\
+\xfb\xb5\x90u\xf3\xc3\xdc\xbe\xccyb\x9e\x09\x80\x16+\
+\xa5]\xfc!\xb0\xd3ri/\xca\xf2\x1d\x1f\xe0~\x06\
+D(\xbe\x13\xff\x06\x09C\x9b\x91\x8c\x065\x02\x10\xa1\
+\x11\xed\xe6\xd3\xaeg\xff\x89 P\x01\x94\xf4l\x87\xba\
+U\x97\x81\xa7q-$i\x80G\xf0\x07u\x22PI\
+\x80T@4\xc6\xfeQ\xb9\xf5\x8b\x16{fG\xb8\xef\
+#\xd3\xceQKu\xd4\xc4\xa7\x15\x0f\xff\x8e\xe6\xf93\
+\x0c\x8d&\xd2\xdea\x90\x22p\xb6l\x81\xac\xdaY\x88\
+L/\x95}\x01j\xb5\x96V\xb4{\xb0E%\x01\x92\
+\xbcA!}\x93\x86\xb7\x89\xe5\xb1\xdc\x9a\xfb\x0c\xe4\xde\
+\xfd$\xc47NCL\xa0oIaM\xe8J<\xab\
+\xe1\xc8#\xb7\x09\x8a\xfeY\xec\xe5\x97s\xdb\xe3B\x01\
+\x18\xe7\xe8\xd5\xf7@\xb9\x9f<u>8_\x14k\x01\
+\x92\xd7\x5c\x04\x99\xef?\xac\xb8\x8f\xfdU4*=\xfe\
+\x16\xa4\xec\xb8\x86\xa7\xe1b\xf0;S\xcfC\x22\xa5\x18\
+>.\x1dx=_\x9c\xdbi;\xae\xbb\xbf\x08\xfeW\
+\xde\x02\xff\xcboA\xd6}OBl\xd1 $\xe0\xef\
+\x92\xf3\xd1\xcf\x81\xeb\xf9?\xb3\x92\xa0\x9d\x81Sw^\
+\xcbK\x97\xb9\x02\xd0\xa0\x00\x98\x00\x88,e\xf2\x8f\x86\
+5\xbb\x02\x1a\xa7\x0eA\xc3\xd4\xe5\x9c\xfd\xa75\xfe\xba\
+\xc7\xeff\xaf\x1f2\x84\xfc\x87\xc8\xd4\xa2\xbf\xc6&9\
+\x12\xc2}\x1f\x99v\x8eZq\xeb\xea\x88\xe4@\xf7\xe1\
+\xf4\xca)\x1d\xe4Z\xc3\x09}\x1dz\xaa\xba\x1e\xbd\xb0\
+\x0frk\xd6\x80\xb3c\x07\xd8\x9dM\xa8\x02\x04\x01h\
+\xb3\x01\x18\xd7\x8a=\x02\xfby\x99k\xb4\xbc\xf9\xad\xbe\
+n%qr\xa7\xe2>\xf2'\xee\x10\xc4\xd2\xf9k?\
+\x85\xec\x9b?\x0b\x09\xbd\x9b\x8c@7\x14\xd4,\x0f\x03\
+\xac9\x0dP\xf4S!\xc9\xb3o\xfd\xdb%\xa41\xae\
+\x93F\xc1\x98B\x95\x80\x5c\x07\x80\xa4\x93\xf7\xe9\xef(\
+\xde\xa3or\x5c\xef9y\x06\x92\xb7^-+\x06G\
+D\xf7\x1e\xd9\xa7\xc0z\x16\x22\xb2\x1a\xe7\xf8\x0bEc\
+S\x9a\xc1H\xecY\x0fv$\xc4\xcck\xee\x01\xd7\xd7\
+~\x02\xde\x93\xa2\xf9\x87\xef\xe4\x9b\xa8(>\xc8\xcb\x88\
+\xad\x06\xcf\xaf\xae\xff\xa7i\xc8h\x8d\x00D\x0e\xc0]\
+\xbb\x12\x9a\x90\x00J\xfbv \xf8;\x05\x01\xe0P\x89\
+ I=\x97#\xd6\xddB\xbb2CT\x92\xf7o\xc2\
+}\x0f\x99v\x8e[|vEgz\xd5\xb4\x92Z2\
+\xcc\x80\xd7\x08\xa0X\xf7\xfc\xa9\x85:!P\x9d\x80\xab\
+m;d\xd7\xac\xe5\x1e\xf6\xaa\x0aP\x93\x81\x16\xde\x09\
+\xb7\x8f\x09@\xa8\x009\x10p\x89\xe3\xe7\x83\xebs\xdf\
+\xe3E6\xb4T\xd6}r\x1e\x1c_x\x89\x9b}p\
+\x95^\xe1\x92\x92Z\xb5@G\x9d\x87\xc7\xcf)\xfa\xb9\
+\xa2P<\x9e\xf3\x91\xc7\xb5\xa5\xc4F\xc2\xb0\xca\x02\xa1\
+\x94\xa9\x0b\xc0yZ4\x05\xe1\xae=\x14\x82\x9cx\x1b\
+\xd2\xf6\xdf\xc2\xbb\xf6\xd0\x82\x1dk\xe1\xa8>\x8cMF\
+4\xd51\xaa\x0dm\xd7\x1f\x95\x08\x904\x92'\xcf\x13\
+\x0dLN\x88Rd\xefw~\xce\xdd\x87\xac\xf9}\x06\
+\xe0\x1b\xba\xff\xb0\xf7o\x12\xc9?N\x00\x22i\xe6V\
+C\xfd\xaa\x03\xd02s5\xa4\x17\xf6I\xa0\xeb^\xdf\
+H\x06\xeay4\x82?\x22\x1b\xff\xde\xf6\xcc\x89p\xdf\
+?\xa6\x9d\xe3\x96\x98U`K)\x19\xf9\xd7\xb4\xb2\x09\
+\xd1l\xa2\xd0\xd0|Bz}#\x01\xd0\x12TW\xcb\
+f\xf0t\xec\xe4\x9dl\xb50@M\x06\xba\x9a\x0d\x0a\
+\xa0_\x86\x04\x82\x04\xac\xb4\xee\xbe|\x042\xf6\x7f\x04\
+\xbc\xdf\xfb\x03\xcf\xed{O\xbe\x0dVO\xbb\xf0\xc4\x9a\
+\xb75\x84\x02j\xd3\x10\x0c\x17\xd2.\xbc\x0e\x02\xaf)\
+\xe8\xc5\x15p}\xe5'\x10\xdf\xbfM\xdb\xc3o)\x01\
+$O\xed\xd6\x08\x80\x8b~N!\xf8\x0f|Txf\
+\xe9\xf5\x8d\xe0\xd7>\xb70t\xa7\x1f\xabQ\x05\xa8D\
+!\x15C\xfa\x9e\x1b\xc4b\xa4\x97hE\xe2\xbd\x10\xdf\
+6\x031~\xd9\xfc#\xa4\xed\x97\x04\xbf\xb7\x03,\xae\
+&\xe1\xf9\x91\x00(\x11\x98Q\xd0\x8d\xe0\xbf\x0ah\x9f\
+\xc6D\x7f\xbb\x06\xf4\x90\x11\xe8\xd4\x94\x01\x9d\x13\xf8Q\
+\xfe\xbf\x11\x9b\x90\x93\x14\xee\xfb\xc7\xb4w\x81%x\xdb\
+\x1eK+_\xa5\xa8@O5\x80>\xb5P\x86\x00t\
+\xadH\x8c\x9c\xcaI\xf0u\xee\x84\xcc\x8a\x09\x88\xca\xaa\
+\x94\x04 k\x02hN\x1b=\xba\xf0\xfc\xfd\xba\x12 \
+\x10\x04\xc5&\xa3\xb4\x19\xa7\xe3\xbe\xa7X2S\x13\xcf\
+8\x04\x0e\xd5\x08X\x8bB\xbd\xb1*\xc9\xc9\xd3\xa7\xac\
+\xdb\x8f\xb1\xff\x9fy\xfe\xde-K\x87\xbd\xdf\xfc'\xb0\
+\x13\xa0C$\xbb\xa8\xc4K^\x8dj\xe3E\xb13\x90\
+\xe7$\xc6\xfc\xdb\xafF\xaf?\xc0\x1bv\x18=\xbb\xfa\
+\x991!\xde~l\xf9s\x8at\xf0S\x16?\xc6\xd3\
+\x01y\x0f\x7f\x9b\xfb\x05\xd0Z\x04\x8b\xa3QL\xf5i\
+\x0b~\x86\x0c\x9e\x7f\x90\x1b\x7f0\xe8\x9dM\x9a\xf4\x8f\
+F\x02\xad\x9d\xd8\x0bms\xd7\xf0\xdf\xf7\xac\xe0\x0fQ\
+\x00\x9d,\xff#s\x1b\x94\xa8D\xcf=\xe1\xbeoL\
+{\x97\x98=\xad\xa0=\xb9hx!\xb9hP\xf3\xf8\
+\xff\xde\xa0e\xa8\x9e\x96M\xe0\xef\xdd\x0dq\xee\xe6\x10\
+\x02\xd02\xdb\x1a\xf8\xfb\xe4B\xa1\x01\x99\x13\x10\xd3\x83\
+)[\x0f\x81\xeb\xa4\xe8\xf8\x93\xbe\xff\xc3\xdc\x0a\xdc\x18\
+\x8b\x1bco{\xf1$8\xeey\x1ac\xf8y\xb9\x99\
+\x88\xd8S\xc0\xff\xf2\x02$\x8f\xedX\x9e4$\x02\x98\
+:\x9f\x8by\xa8\x147\xfd\xc0m<\x0b\xa0n\xd8\xc1\
+\x80/\x1c3\x90\x8d\x81|\x0ca\x88\x91 4\xf0\xd3\
+9\xf5\x05\xa8\x1e\x05\xff\xe97\xc1s\x14\xc3\x91;\x1e\
+G\x15\xd3\xa5\x13\x9d\xd1\xf3\xd3\xefKe\xbf\x08\x5c\x8b\
+K\x8f\xfd\xc9\xfbg\x95\xf41\xf8\xd9\xfb\x07:\xde\x91\
+\x00t\x22\xe8\x14\xc5?YU\x8b\xd6\xb8\xac\x86p\xdf\
+7\xa6\xbdK\xcc[\xda\x13\x99\xe0n\xf9Jb1\x02\
+\xa7\xa0\xdf\xd0}F\x05}\xaf\xe1(:\xd1P\xb3\x90\
+ \x12\x80\xbbu3\xab\x80\xa8\xdc\x1a]\x05pu`\
+\x8bF\x02\xa1S\x83R\x09\xe0\x0d\xef}\xfe\xd7\xa2\x15\
+\xf8\xf3\xbf\x83\xb8\x92\x11\xf6\xcej(`-\xd4\xa5\xb7\
+\x1de~\xee\xdd\x8f\xb3\xd7w\x1b\xf6\x14\xf4S\x13\xce\
+\xee\x0db-\xbeq\xb6\x80j\xf1\xa7\x84\x02\xe0Y\x80\
+\xe9\x8bE\xcc\x7f\x16\x85\xa1\x91M\xe1\xc82\xe2\xd1I\
+\xc1\x182\x8c\x80\x1d\x15L\xee=Oq\x8d\x00)\x98\
+\xa4U\xbbCe\xbf\xda\xf1G\xed\xfaCU\x7f.=\
+\xf6\xa7\xaa?\xbb\xa3\x16\x1a\xa7.\x85V\x8c\xfdiU\
+_\xa2\x11\xec\xf9\xba\xc7O\x0a\x88c\x22\x8exO+\
+D \x01D'\x07^\x88\xcb\x0aZ\xc2}\xdf\x98\xf6\
+.2[Z\xe1h<\xde\xdc\x09x\xd3\x8au\xe8\xa1\
+m\xa8h\xa4\x18\xbb\xd3\xa0\x0a\xf0\xb7o\x85\xfc\xbe\xdd\
+\x18\xbb\xb6\x09\x02\xc8\xab\xd5\xfa\xdaq(\x80@\x11\x9e\
+\x7f\x09\x09\x04\x06dL\xff~j\x18\xcaI\xb4\xdc;\
+\xff\x16\xac\xf8|*\x0a2\xc6\xdc\xa2\xc1\xc6\x18\xc4\xf7\
+\xd2>{\x7f\xd2\x16\x0f\xb9\x11x\xee\xa7N\x80]k\
+\xe8\xb1\x84\x00\xa6\x05\x01p\x1d\xc0\x9aKD\x95\xde\xbf\
+#\xebc4\x150\x12\xea\xf1\x8bF\x0c\x04 F\xf2\
+\xd4\x85\xe0?\xf1o\xa2\xb6\xe1\xb9\x7f\xe0\x1d\x85\x96'\
+\xfc\x04\xf8y&\x80\xc1\xafK\x7f\x0b\xfe\x9dJ{\xb6\
+\xb2\xf7/\xe9\xdd\xce\xde?\xf1,\x1e?Q\x02\x9f\x0b\
+\x83\xf0q\x94L\xfeYb3\xcc\xda\x7f\xd3\xfe{\xcd\
+\x96\xe4\xb2\xd9=\x1d?\x8b+\x18T\x92\x0b\xf4\xf6S\
+)\x85\xc6\xf3\x1e\x8d\x1chP\xf9p~\xcf.\xc8\xef\
+F\x19\xae)\x80Z\x8d\x08\xf8f\xe7\xda\x80~\x9d\x04\
+h\x04D~ \x06\xdf\xc3\xf3w/s\x86\xde{\xf2\
+\x0c\xe4\xdc\xfc\x19\xde\xb5\x97\x1a\x83\xc4H\xf0\xc5h\xb2\
+{\x00\x12\xc7w\x82\xe3\xfeg\xc0\xf9\xc5#\x90y\xfd\
+\xfd\x10\xd7\xb8V\x16\x14\x8d\x85\xc4\xed\x04\xf6\xa4\xa9]\
+\xe0yi\x81;\x02%\xaf\xde#b\xff\xc2\xb3e\xfe\
+G\x0d\xa1\x81\x9c\x12\x0c\x01\xbclsN\xcdJ\xa8\xd1\
+I\xcf:p\x7f\xeb\xe7b\xe9\xf1\xa9y\xfc\x9c\x0b\xf1\
+\xf71\xccx\x18\xa7\xfe\xa4\xf47N\xfb\x91\xf4\xcf,\
+\xee\x81\xce\xf5\xd7A\xcb\xda+xN_xx#\xf8\
+;\xb5A%\xbfD\x00\xb1T\xf9\xc7\xb5\xff%\xbf\x8c\
+\xb6%\xc7\x86\xfb~1\xed]h\xd6\xb4\xe2\xcbc\x83\
+\xfd\x8b\xb1\x01\x09\xf8\x02\xd5\xf3\xab\xeb\xd1\x05!h\x0a\
+\x01\xaf\xe5V\xad\x84\xe2\x81=\xe0mY\x0f\xd1\xd9U\
+\x5c\xd6J\x04\xc0a\x80V!h\x9c\x15\xc0\xa3$\x00\
+\xab\xbf\x17\x12z\xe7\x14\xcf\xd17\xb8w\xa0\xf7\xc4\x19\
+\x94\xd6O\x83\xadtH\x03,\x91\x81\x0aJj\xb6i\
+C\xa0\xc6\xd6N!\x18\xfbE!P\xe1r\xd9N\x85\
+@)\x9b\x0e\x80\xf3\x94\x0c\x01\xd6\xedWl\x1c\xf3\x87\
+\x12@\x8cA\xd6\x1b=\xbeE%\x0b\x09|>z\xdb\
+\x11\xec\x17\x83\xf7\x1b\xff\xcc\xa5\xbe\x94\x8b\xc8\xfb\xf4\xd7\
+x9\xb1\x0a\xfchc\xc5\x1fy\x7f\x9f\xcc\xfa;\xf5\
+\xac\x7f\x0cJ\xff\x965\x97C\xe7\x86\xf7\x81\xabv\x95\
+\xe6\xe5\x13C<\x7f\x97\x06~\x1aD\x12\x1c\xfbg\xd7\
+*Q\x09\x0e\xb3\xf4\xd7\xb4\xff\x19\xb3\xa7\xf8\x12\xecy\
+\xf5\xa7h\x0f\x00\xdaw\x9e\xd6\xa1\x1b\xbb\xd0\x18[T\
+\x19\xcf\x83\x9d\xdb\xa0d\xe0BH\xa3\x12UT\x02\xbc\
+\xd7\x9dC\xe6\x02\x1cj>\xa0\x8f;\xf2\x8a\xa4 '\
+\x07\x15~\xec\xef\x86\xd4\xcd\x07\xc1\x7f\xfc\x0d\xb1 \x87\
+$\xfeS/C\xfa\xde\x1b!\xaem\x0e\x01\xd3\xc4\xeb\
+\xdeE\xbd\xfd\xa8^\xb8\xa3f\xee\x0d\xd3\x87j\xd8\x10\
+\x1b\x1c\x04\xc7\xe1\xcfs[p\x9a\x05\xc8}\xf0\xab\x0a\
+-<\xe2\x1d\x8e\x0aG\x14c<\xaf\x91\x00)\x80\x02\
+A86\x7f\x0f}\x9e\xc2\x1b\x84 \xa8S\xe6.\x01\
+\xc7=_\x02\xd7\xf7\xff \xd7\x05\xccC\x0e\xed\x14\x5c\
+9\xcc=\xff\xa3\x8d\xf9\x0d\xd9\xee\xdb\xc2\xe0G\xf2\xe3\
+\xc4\x9f\x98\xf3\xa7.A\xc5\x9d\x1b\xa1\x03\xbd\x7fQ\xe7\
+fj\xe8\xa1\xa8\x1e?\xd1\x00\xfe\xc4\x80$\x81\x80 \
+\x07*\xbab\xef\x9f^\xfc\x8b\x98\xf8\xac\xe4p\xdf'\
+\xa6\xbd\x8b-&\xc5?\x8e\x9eY\xa1\xe5\xbaj\xe7\x99\
+\xd0vT:\xf0\xd5N5\xb4{Ma\xcf\x0e(\x19\
+\xbc\x10o\xda6\xe9\xfd\xeb\xf4\x84 \x15\x08q}\x80\
+ \x81hI\x04*)X=\x9d\x902{1\xb8\x9e\
+\xfd\x91\xc2$ C\x02\xd7s?\x03\xd7\xe3\xc7 \xf7\
+\xe3_\x87\xbc\xdb\x1eW\xe2:\xa6\x99\x04\x8c\x9e<&\
+\xc4\xab\x0bp'\xf6m\x82\xc0\xb17\x14\x87\xac\x01\xf0\
+\x9e|K\xe1D\x1d\xa9\x0eu5^\xe1\xf2\xd8\x9e\xb2\
+\xfb6\x0cs\xf2ny\x14\xf2\xee\xfe;\xc5\xf1\xa9\xef\
+\x82\xfb\x99\x97\xc1\xf3\xc2\xeb\xe0\xa3J\xbfc\xf3\xe0}\
+i\x1e\xb2n\xf94\xd8\x0b\xfb\x84\xf47\x12\x80\x06\xfe\
+N=\xe3\xaf\x96\xfc\xe2\xdf \xb7|\x80\xa5\x7f\xfd\xe4\
+>\xfc;uH\x0f\x7f6\x02\xe8\x0c\x89\xffi\xcd\x05\
+\xf5b\x8c\x8e\xcd\xda\x17\xee\xfb\xc3\xb4w\xb9\xc5\xc4\xe7\
+X\xad\xb9\x0d/Q\xc1LB \x94\x044\xe0/\xbd\
+\x86\x9e?\xb3d\x08J\x87\xf6@q\xffn\xb0\xe5\xd5\
+\xc8P`\x09\x11P\xa9\xb0Q\x09\x04\xe49\x0d_\x17\
+\xc4\xd6\xad\x86\xcc\xf7\xdd\x07\xbeco\xd0\xe6\x1f\x0ao\
+\x02BE<G\xe7E\x8b\xee\xaf\xfd\x18\x92Fw\x89\
+]z\x0bT\xf0\x0b\x99\xce!Bp@\x89oX\x05\
+\xee\xaf\xfe\x98\x96\xf6rn\x81<\xb6\x93\xde\xeb\xdb\xbf\
+\x84\x94\xad\x97\x83\xdd\xdb-\xab\x0e\xc5kY\x15\x04\x87\
+x\xc4U\x8d\x81\xf3\xd3\xdf\xe0E>\xbc:\xf0\xe8\x19\
+^\xc0Dk\x18\xbc\xb4/\xc0\xb3\xaf\xa1Z\xb9\x1c\x89\
+\xa2\x97=\xbf6\xd5\xa9\x11\x80\x00\xbf\x98\xefo\xd4\x96\
+\xfbR\xd6?\xa3\xa8Gi\x9f\xbd\x0a:\xe6\xae\xa5\xbe\
+\x7f\x9a\xbc7\xca~\xcd\xfbk?\xeb\xe4\xad\xca\x22P\
+\xfaG&\x06\x9e\xb3\xd8R\xcd\xd8\xdf\xb4\xffy\xb3\xa6\
+\xe4\x8f\xc4\xb8\xdb\xcf\xd0\xe6\x1ets\xaa$\x90,\xdb\
+S\xa9C4\xa9\xe8\xd1\x9aV\xb8\xea\xa6\xa1bd/\
+ola\xcb\xad\x92\xcd.\xebBr\x02\xa4\x04,*\
+x$\xf8Ue`\xf1\xe15\xfcL\x9a\xda\xcb<t\
+\x87\x92{\xcf\xb3\xe0z\xe6G\xe0=\xf1\xa6BKu\
+yY\xf1\xf7~\x07\x19\xd7=\x00\x89C\xdb\xf1\xb9\xed\
+\xdc\x16\xdb\xe2l\x86\xf8\x8e9H\xdfw\x13x\xbf\xf6\
+\x8fbY/\x8d\xe7\xfe\x112\xae\xf9\xb8\xe2\x94\xcbs\
+\xbdG\xde\xe0ED\x09#\xe7q\xf7_\xda\xbb\x80\x92\
+t\xf1}[ \xe3\xaa;I\x81\xa0\xa7W\xc4R\xde\
+S\xa8@\xbe\xf3{p~\xfe\x18d\xdd\xfc(\xa4\xae\
+\xbb\x1cbk'!\xc6\xd7\xab}\x7f\xd1\x05I%\x00\
+1\xdd\xa7\xc7\xfc\x8d\x1c\xf3\xd3H\xf2\xb5@\xdb\xda+\
+9\xee\xf76LA\x82\x1f\xbd\xbf\xbfS\x07{\xb0S\
+\x93\xfdF\x02\xe0\x9e\x7fY5\xb4\xf0j\xde\x12\x97c\
+\xce\xfb\x9b\xf6\xbfc9\xa5\xdd\x911\xe9\xc5\x1f\xb1z\
+\xbb\xc0\x86\xb1lhC\x8a\x9e\x90n5\xfa2\xd5n\
+NVQ;\xeb\x8a\xb1}\x90\x8f$`\xcd\xad\x0e!\
+\x80(\x99\x13\x10$\xd0\xab\x85\x01\xd1x\x1e-C\x03\
+V\x05\x18\xafGSyp\xd1 \xd8\xeb&!\xaem\
+-\xe4\xdc\xf7,\x97\xdc\xf26\xde\xe8\xa1\xdd\xdf\xfa\x0d\
+8\x9f<\x05y\x9f=\x0a\xce/\x9c\x00\xd7\xd7\x7f\x0e\
+\xaeS\xb2\x81\x07\x01\xfe\x89\xa3H\x0ak1\x86\xef\xe2\
+\xc4\x22u\xef\xe1\xf8\x9dj\x08\xbe\x8d\xaf\xfd\xe2Ip\
+<v\x1c_{\x0a\x5c\xdf\xfc\x15\x03\x9e\x09\xe6\xe4\x22\
+8\x9e9\x0d\x09c\xbb \x16?\xd7V3\xc9y\x0a\
+JX\xea+\x1d\x97\xd47\xd0\x94\x9f\xb7]x}\x94\
+\xfe\x16g\xbdT\x01\x0d\x10\xebn\x80\xa6\xa9\x83\xd0\xb3\
+\xf9z\x8c\xfb7!\xa8\xdb4\x80\xbf\xd3\xa0\xf0\x80\xa4\
+?\xe5\x0c\x88\x00\xa2\xe2\xf3>\x92\xe2\xa9\x8f\x0c\xf7}\
+a\xda{\xc8b\xe2s3\xacy\x0d\xbf\xa2n7\xf1\
+\xfe\xae%\x1di\x96\x8c`h\xc3\x8a\x82\xce\xadP5\
+\xb6\x17|\xcd\xb3\x10C$\xb0,'P\xc7`a\x8f\
+\xa9\x11\x00\x0e\x7f_(\x11\xc8a\xf5\x0f0\x19\xd0\x12\
+[\xcf\xb7~!\x1ax\x1c\x11\x9b\x8ehG\xf4\xf8\xd4\
+\xcb\xcf\xf3\xe2\xdb\xbc\xdf_\x5c\xd58\xd7\x1a\xd0\xb0\x15\
+\xf6+\xe9\x97\xdcH\xed\xb9\xb8\xe6\x80{\x0c\x1e\x15\x83\
+\x1b\x82\xd0c$\x0d\xdf\xe9\x7f\x83\xcc\x0f<\x00\xb15\
++yw \x8b\xb6\xa8I\x05{\xe8l\x86\xfaX\xa8\
+\x89\xd0\x98\x9f\xc1\xef\xaa\x87\xda\xb1=\xd0\xb5\xe9z(\
+\xe9\xde\xc2\xe0O\x08\xa8\xde\xbf\x03\xcf\xdf\x89\x00P\xfa\
+;\x1a\xc5N\xcc)\x85\xbf\xb2\xd8\xd3\xd3\xc3}?\x98\
+\xf6\x1e4kjpc\x8c\xb3i\xd1\xe2nW\x12\xa9\
+M\x95\xb1.\x9d\x97\xa9v\x1b\x96\xab\x0a\x22\xa0*6\
+\xeaX\x13h\xdb\x08U\xe3\xfb\x95\x82\x8eMB\x090\
+\xf0\x0d\x85Bj\xb1\x10\x12L\xb4\x0c\x07\x90\x04\x14#\
+\x01\xa8\xca@\x10\x01\x02\xcd\xdb\x09q\xcdk \xfd\xe0\
+G\xc1\xf1\xc0W\xc1\xf5\xa5\xd7\xc0\x832\xdd\xfb5$\
+\x85\xcf|\x17C\x83{ q\xe2|\x11\xa3\x1bV\x22\
+Z9\xbc\xe8\x84\xd8\xc6\xd5\x90z\xc9\xcd\x90\xf7\xd0\xd7\
+\xc1\xf9\xcc\x8f\x91L\xfe\x15\xdc_\xfa\x09>~\x0e2\
+\xae\xbc[I\x1c\xd9\x81\xaf\xeb\x11\x89=\x06\xfa@\x08\
+\x01\xe8\xd9~\xd1\xf6\xcc\x1a\xece\xc9\xcfdfX\xe1\
+G\xe7\xf1\x9e&\xa8\x1d\xdf\x03\xdd\x1b\xaf\x87\xb2\xbe\xf3\
+x\xa1\x0fI\xff\x04\xbf\x0e\xf4w\x22\x80\x04\x8f\xdc\x7f\
+!\xa3|!\xca\x9e9\x17\xee\xfb\xc0\xb4\xf7\xa8\xa5\xba\
+\xeb\xa2\xad\xa9\xf9\xb7D{:\x14\xab\xbbM\xabH\x0b\
+\xa9O7\xacW\x0f)d\xc1\xe7\x16tm\x81\x9a\x89\
+\xfd\x1c\x0e\xc4\xb9\xa9\xf7]\xad\x12J\x00rP\x1c\xaf\
+\x85\x01B\x0dXTU\xa0\x0d\xe1\xcd\x11\x8c\x0a\x87&\
+E\xc3\x18\x93\x8fC|\xcbZ\x88kX\x05\xb1e\xb4\
+\xabO\x87\x9e\x9c\xcb7.G\xee\xd7\x93\x8f\x94\x04,\
+\x19Q(\x9e\x8fk\x9e\x868<\xdaJF\xf8\xb5Z\
+V\xdfX\xb8\x94/\xe2|\x11\xeb\xab\x92\x7f@N\xf3\
+5\xe9\xc9>\x15\xfc8\x92\xfd-\xd0\xbc\xfa\x00\xf4\xa0\
+\xe7\xaf\x1a\xbe\x80+%\x05\xf8\xc9\xfbwh\xe0O\xd0\
+H\xa0\xc3@\x00\x1d\x10\x95]\xcd[\xb1G\xc5;\x1f\
+I\xce*1w\xfc1-|fI\xc8M\xb2dU\
+\xbe\x1c\xed\xe9Th#J\xae\x5c\x0b\x84\xd6\xa9'-\
+\xb9\xa6\x17\xb0tqN\xa0f\xf2\x80R>p>$\
+z\x9b \x9a\xab\x05\xebC\xc2\x81h\xb5j\x90\xe2\xe8\
+\x10\xefo\x18\xe4m\xd5\x9f\xa93\x08\xfe^mFA\
+\x1c\xfb\xc5\xcf\x8c^[&\xea\xf4J\xc4\x01\xda\xc7@\
+\x89\xd6Ha9\xe8\xa3U\xa9\x9f\xaf\x12\x80,\xf2\xa1\
+X\x9f\xbe\x07I~\x0d\xf4\xfa\xe0l\x7fq\x0f\xb4\xae\
+\xbd\x1c\xfa\xb6\xdc\x00\x15\xfd;9\x9eO\x90\xde\x9fe\
+?\x11A@\x0c-\x0c\x90\xca\x80\xfe\x8eV\xfc\xdb \
+\xf8\x95\x88\xa4\xc0\xd7\xa2-I\x19\xe1\xfe\xff\x9bf\xda\
+\x8a\x98\x04g\x93%\xbb\xe6\xb7QT\x18\x83$\x90\x14\
+\xe8\xd4\x87\x9c\xb7\xd6\x0aZ\x02]\xda\xfc5\x0f\xbc\xb9\
+\xbd\x8dk\xa1vb\x9fR5v18\xaa\xc6x\x19\
+l\xb4Q\x05\xa8U\x83\x94 \xa4\x9ayZ7/s\
+\x03gS\x02*\x01\x84\x8c\xa0q\xe8\x006\x02\xda\xb2\
+\x94\x18\xce\xf2X'\x81\x01=\xc3_ \xe5\xbe\x9a\xe8\
+\x93\xeb\xf9\x8d\x8b{\xa2s\xaa\xc0Y=\x06]\xeb\xaf\
+\x83\xde\xad7@~\xeb,\xcb\xfeD\x8d\x00\xdaC\xc0\
+\x9f \xc1\x9f\xe0\xd7\x15\x00\x15\xfc\xac\xc8\xa8\x84\x88$\
+\xbf\x12\x15\x9ben\xf6i\xda\xff\x1d\x8bNp\x0cG\
+\xe75\x9e\x89r4+\xf1\xb4k\x8da\xaeZ\xdc\xc0\
+]g\x8dgy\xe0\xf3s\xcaG\xa1z\xec\x12\x0c\x09\
+\xf6A\xb0u\x0ely\xd5\x1a\xf8\xa9\x99H\xb4\xda^\
+\xdc!s\x034S\xa0\x12\x01\x8f%$\x10P\xaf\x85\
+\x12\x80%\xb8\x94\x0c\xb4\xcaC\xed<\xf4x\x96\xe7\x1a\
+\x0a{,\xb4}\x17\xf5\xf5W;\xf8\xc8\xe5\xce\xea9\
+M\xf3\xd9\x1d5\xe8\xed\xb7a\xbc\xff>&\x00w\xed\
+*\x88\xf7\xa9\xb2\xbf]\x93\xff\xcb\x86T\x04\xa4\x12\xec\
+H,+2*\xd0\xfb\xe3\x88\xc9TVXR\x9f\x8d\
+\x8cI\xf3\x86\xfb\xffn\x9ail\xb9\x85\xcd\x11\xd1\xc9\
+\x81\x1b\xa2\xf2\x1a\x95(G\x13\xdf\xe0Z\x1d\xbb\x94\xb3\
+\xc68V?\xca\xb8\x17\x81@\xad\xc7\x0b\xbb\xb6A\xfd\
+\xeaK\xa1|`\x17d\x97\x0fBtvE\xc8,\x81\
+\xdeS@U\x04\x8d\x0c\xc0h\xea\xa5g\xf0\xfcQK\
+\x94\x81E\x86\x09!D\x10\x08%\x04\x8bQ=\xf0\x9a\
+\x04\xe3\xf3\x04!\x08\xf0\xd3:\x85N\xb1\x86_\x95\xf8\
+\x1a\x01\x18\xc0\x9fW\x0b9\xa5\x03\xd0\x84\xf1~\xdf\x96\
+\x0fB\xcb\xf4e\x0am\xb6\x1a\xefm\x83x\x02~\xe0\
+? \x00\xbfP\x01q\xae&\x88 \xf0\xa3\xf7_\x11\
+\xef\x81\x15\xd6\x0cXa\xcbU\x22cs\xbfg\x89\xcb\
+v\x84\xfb\x7fo\x9ail\x16{\x8a\xdd\x92\x12\xbc!\
+\xd2\xa1\x92@\xbb\x0e\xf0\x10\x02X2T\x99K\xde\x8e\
+B\x82\xa6\x19\xa8[y\x10jW\x1e\x80\xa2\xae\xcd\x90\
+ s\x03\x1a\x09H\x15\xa0\x85\x06t\xa4\xb9uJ\xba\
+QKm\x7fw\xa8\x8c7\xe6\x0d\xce\xaa\x04zC\xbd\
+<?\xd7\x98\xe8\x1b\x10\xf9\x00|_\x0b\x91\x0d/\xdd\
+\x95EL\xdc\xbb\xbf\xce\xe0\xfdE\xa2/\xde\xdd\x00%\
+]\x1b\xa1{\xc3\xfb\x18\xfc\xc5\x9d\x9b\xb8a\x07\xfdM\
+\xe2\xfd\x1d<T\x0f\x9f\xa0>^2\x12}\x1d\x10G\
+k\xfc\xd9\xf3#\xf8\x13|\x08\xfeLT\x009\xb0\x22\
+\xd6\x05+\x12\xfdJD\xbc\xfb;\xd6\x84\xbc\xb4p\xff\
+\xefM3\x8d-&.+.*\xa5\xe0\xa9(jK\
+\xe5h\xd4\xa5n\xc0\x98\xe1\xee\x08Q\x01Z\xcc+\xb3\
+\xe04\x1f\x9eU:\x0cE\xdd[\xb9\x15v\xf5\xf8%\
+\xe0kZ\x83\xa0j\x14D\xa0\x82Mn\x9b\x1de\x00\
+\x9f \x03YjKa\x02\xc9so\x87B\xa5\xc4$\
+\xd7\xad\xec\xc5\xfb\xf5aH\xe6\x89\xea\xc3^~\x1e?\
+\x9fj\xf6\xbdj5a\xa3!\xa9g\xf8,G\xbd\xd6\
+\xdf\x80\x06\x959\x07[\xd6r\xa2\xaf\x17\x81\xdf\xb4\xea\
+\x00\xe4U\x8eB\x9c\xafU\x80_\x12@H\xcco\xcc\
+\x01\x18~\x16\xe7i\x81H\x02>{~/\xac\xb0\x10\
+\xf8s\x11\xfcN$\x03?\xacH)\x80\x88\xb4\x12\x88\
+N\x0e~\xd1\x9a\xe4L\x09\xf7\xff\xde4\xd3\xd8\xa2\xac\
+\xa9\x19\xd1I\xde\x87\xa97\x1d\x8d8o\xab\x94\xf9\xa1\
+\xb1\xad\xd1\x03\x86>&\xa0\x88\xb0 \xafj\x1c*G\
+\xf6@\xc3j$\x82\xb1\x8b\xc1\xd78\x8d\x92\xb8\x8e\xe5\
+uh\x9204LP\xc9!d\xc8\x12\x5c\xae\xc6S\
+\x9bp\xf0\xe3&\xbdH'\xa4%\xb7\xfe\xda(\xc3\xd0\
+IGU \xb5\x1c\xe7{\x1bVA\xf3\xd4A\xe8\xdd\
+t=\xc7\xfa\xc5\x9d\x9b9\x17B$\xa8\x83_\x1d\x1d\
+\xfaP\xaf\xcb#\xfd\x9d(\xe6\x8f\xa4x\x9f\xbc?{\
+\xfel\x94\xfd9\x12\xfc\xf88\xb9\x00V\xa4\x15\xf3s\
+\xa2\xb2*\x95\xa8\xd4\x82\xcf\xdb\x92\x1cY\xe1\xfe\xdf\x9b\
+f\x1a[Tt|\x12\xde\x94\xcfD\xe5\xd4)\xb4/\
+\x005\xabL\xf0\x19H \x14\xf4\x8a\x1c\x06\x0f\xd8.\
+\x89\xa0\x8d\xb7\xber\xd7OA\xc5\xd0\x05\xd0\xb4\xe6\x0a\
+\xa8\x19\xbf\x18\x02-\xb3\x90Y\x8cR=\xab\x5cd\xd9\
+\x97\xe6\x09\xf2\xea\x96\x13\xc0\x7frDI\xf0\xab\xfd\x0b\
+\xa34\xa5\xa1\x97+\xab-\xbbS\xf3;\xa0\xb0}\x1d\
+\xb4L]\x0a]\x1b\xdf\xcf\x89>\xaa\xea\xcb\xc0\xef\x16\
+\x8f\x1e\x5c\x03\xbe\xcf\x08|\xfd\x9c\xea\xf9\x13\x0c\xc4\x90\
+ \xc1\x1f\xa1&\xfc\x92\x02\xe8\xf5\x11\xfcv\x07\xac\x88\
+#\xd9/\xc1\x9f^\xca\xcf\xa1\x9a\x80\xe8\x9c\x1a\xfc.\
+u\x8a5\xab\xe4+1I\x9e\xccp\xff\xefM3\x8d\
+-\xca\x96\x9enI\x0e~\x8c\x1aUP\xc3\x0a\xbb\xbb\
+Y\x12\xc0R\xc9\x1b\x0azU\x01\xe8j\xa0\x0dHE\
+P\x0cMM2*\x86/\x80\xe6\x99\xab(O\xa0T\
+\x0e\xefF\xcf\xbb\x1aR\x0bP\xb2g\x97\xb32\xb0\x9c\
+%\x1b\xafn\xb1\x1d\x02vc\x0e!O\xfe<Oz\
+\xfa\xbc\xfaP\x15\xa1\x12Jv\x05\xe7$<\xf5\xab\xa1\
+bp\x07\xb4\xcf^\x01=\x9b?\x00\x1d\xb3WCY\
+\xefv\xc8,\x19\xe4F\xa8q\xec\xf5\x97x~5\xfe\
+\xf7u\xe8D\xe0\xeb\xd0\x9eC\xbf\xab\x1d\xbfsDF\
+\xb9\xf4\xfc~\x11\xef\xdb\xf2\x10\xfcn\x8a\xf9Y\xf63\
+\xf8\xa9\xdbrV5D\xe5\xd4\x8aET\xd4L\xc4\xd9\
+\xa8X2\xcb\xbf\x11\x9b\xe67\xc3\x01\xd3\xfeo\x98-\
+!/6*\xc9wKdf\xd5\x19Z\xb7\x1e\xe3h\
+\x5cN\x00\xbe\x0e\xcd\x0b&\xa8\x9e\xd1\x10\x0b\x87xQ\
+o\x1bW\x17\xe6bhP\xd8\xb9\x09\xeaW\x1e\x80\x96\
+\xd9\xab\x95\xba\x95\xfb\xa1zt\x0f\xe4\xb7\xad\xe3Z\x82\
+$\x7f+\xab\x03\x9a\x7f\xd7Jq\x97z\xfb\xbc%\xa4\
+\xa0N3\xaa`\xa7\xe9\xc7\xcc2\x96\xf7\xd9\xe5C\xe0\
+o^\x035\xa3\x17r\xc7\x9e\xeeM\xef\x87\x1e\x8c\xf1\
+\xebH\x8d4\xcfp'\xe4x\xaf\xf0\xf8\x0c~o[\
+\xe8\xf76\xca\x7f\xdfR\xe9\xdf\xc6y\x0fkn-\x02\
+\x1f\xc1\x9f^.\x00O\xe0\xb7;\xe9\x5cY\x91\x88J\
+ \xa5P\x80\x9f\xaa\x00sD\x8b5K.\xcd64\
+p\xdb\xf1\x18A\x02\x10\x93Y\xfaXL\xb2\x8b\xb7\x04\
++\xac\x1d\xb0\x966\x8fF\x84\xfb>0\xed=l1\
+\xb1\xe96K\xa2{sdF\xf9_\xb8i%\xde\xb0\
+\x04\x10\x06\xf8R\x90\xf8t\x80\xa8d\x10o \x87\x04\
+\x9f\xe1\x1a\xaa\x02jI\xe6\xacY\x09ETV<~\
+\x09\xb4\xad\xbb\x16\xc3\x84C\xdcT\xa3v\xfc\x22(\xe9\
+\xdd\x06\xc1\xd6Yp\xd7MB^\xf5(z\xe8~$\
+\x10ZJ\x8b`EON5\xf9\xf1\x9e\x06T&\xad\
+\x90^\xd8\x0d9\x15\xc3\xa82&8\xd7P\xdc\xbd\x89\
+\xdf\xa3i\xea\x00\xb4\xcd^\xc5\x9e\xbe\x1b\xe3\xfb\xba\x89\
+\x8b\xa1\xb0c\x13\xe4V\x8c\xf2\xac\x05%\xeb\xe2\x0c\xdf\
+\x9f\x08 \xee\xac\xbf\xd7rB\xa0\xdf)\xce\xdd\x84q\
+|\x15\x82\xbfL\x0c\x92\xfa\xd6\x1c)\xfb\xc9\xf3K\xf0\
+\xa7\x09\xcf\xcf^?\x97\x08K\x00\xdfJ\xc3\xd9\x84\xc7\
+\x061\xf2\xea\x17\xe3\x1c\xf5O\xf8\xdb6<\xe0k\xdb\
+x\xd4\xd90{$\xbbj\xf2\xe1\xf8\xdc\xaa\xa9\x82\xd6\
+5&\x19\x98\xf6\xbfo\xce\xa2\xb6\x08K\xa2kuT\
+j\xd1\x8b\x11\xb4m8\x0ejf\x91\xe0?\x9b\x874\
+&\xcb\xa4<^\x02\x9e\x04\xe3k\x90\x08\x08\x84\xdcx\
+\xa4t\x10|M3\x08\xde\xadP=\xb6\x07C\x85+\
+\xa1c\xe3\xfb\x95\xf6\xf5\xd7B\xf3\xda+\xa0q\xf5\xa5\
+\xd0\xb0\xfa\x00\xcf\xcd7\xac\xd2G#]\x9b\xbe\x0cZ\
+f\xae\xe0\x96\x5c\x94\xc1'\x0fO\xc0\xafAeAq\
+=\x91BFq?W0\x0a\xd0Sh\x82\x00\xf6\xb6\
+\xe9\xa0\xf7\xab\x04\xb0\x5c\x01\x9c\x8d\x14bPiDp\
+\xa6\x1f%\x7fj1\x81^Y.\xfb\xc9\xf3\x97q\xd7\
+\x9f(\xder]\xee\xad\xc0\xe0o\x12\xe0\xc7\xc1J\x00\
+UK\x82\xa7\x19\x0a\xba\xb7A\xd9\xf0E<\x0a\xfb\xce\
+\x07O\xdb\x16\xc8\xaa\x9c|#\xd1\xd3tOLr\xc0\
+\x16\xee\xfb\xc1\xb4\xf7\xa8Y\xe2\xb2\x03Q)\xf9_\x8c\
+\xcc\xacTh\xf3P\xbaaU5 @\xa1\x03'\x84\
+\x1c\xce\xeaA\xdb\x0c\xaf\xd1\x07\xe5\x0b\xa8G>\x85\x0a\
+\xd4\x8e,\x07=\xb5\xbba\x0a\xfc-\xeb0l\xd8\x0c\
+\xc5=[\xa1\xb8\xf7<(\xe5\xb1\x03J\xfb\xce\xc3k\
+\xdb\xa0\x04\x07\xf5\xe2\xf37\xcf\x81\xb3z\x12\xb2J\x87\
+x\xf7\xa3D\xee\xba\xdb\x84\xef\xdb\xf2\x8e\xe0\x0e\x05\xba\
+ \x838\x0d\xf4m:\xb1\xb1ri\x87X\x04)\x95\
+<\x13\xf0#\xd2K\x95\x88\x04\xcf\x93+b2\x0e\xaf\
+\xb0f*+l\x0e1\xcfOE?\x94\x04L\xd7=\
+?\x81_4\x12\x91\xc0w5K\xef\xdf\xc8\xfd\x01\xec\
+\x18\xc6\x94\xf6\x9f\x0f\x15\xa3\x97(e\x03\xbbQ\xf5\xac\
+\x84\xac\x8a1p7\xce\x82\xabi\x0e\xb2\xaaV.\xda\
+s*\x1f\x88I\xf2\xd9\xc3}/\x98\xf6\x1e5kl\
+FJt\x92gwdF\xd9\x9f#\xb3k\xb9\xa7\x9d\
+\xcd\xd9\xb8\x04Hm\x9a\x87\xff\x8f\x00\x17J\x00\xef\x00\
+J\xf2\xd2\xe8\xb5\xa9}6'\xe9<\xad\xe2\xf9t\xdd\
++\xae\x13\xc8y\xe0\xcf\xe2\xd4\xd7h\xde=t\x88\xef\
+\x15\xea\xd9U\xb0k\xca\xc0\xd7\x16\xfa\xbb\xc8cL\x9e\
+\xf4\xfa4R\x8b\xde\x8aNp^\x19eILF\x89\
+\x14\x17aI\xbe\x17\x09@Y\x11\x87\xe0O\xf0\xa2\x02\
+\x08\xd2sd\xcc/\x16E\x09\xaf\xdf\x0c1.\x1a-\
+L\x06\xe4\xfd\x09\xfc%}\xbb\xa0j|\x1f\x1ew\xf2\
+\xac\x8a\xcd\xd5\x84\x03\x7f7$E\x0c\x03\xc0\xd18\x03\
+\xe9ec\x8b\xf6\xec\x8a\x07,\x89\x1e\x93\x04L\x0b\x8f\
+ez\x1a\x22\xa2\x12\x9c=\xd1\xa9\x05_\x8a\xcc\xaaF\
+5P\xcdj \x0e=\xa3\x9e\x1b\x90\x1e\xdd\xe0YC\
+\x13\x82KUC\x9b\x01\x84g\x01\xa5\xe1\xe7!\x8aa\
+\xd9\x90\xde[\x03q\x9b\xf6^\xc6\xef\xa0?\xb7m\x09\
+\x11\xb4\xe9\xe4\xe1\x15\x09>\xfa\x9db\x11\x8c4mG\
+\xde<\x22\xa3\x5c\x89J\x0e\xbc\x14\x15\x9f\xbb:6\xd9\
+\xa1-\xe9\x8d\xb2\xa6$\xac\x88N\xfe\xb2 \x00\x9f \
+\x80\xe4\x02\x88\xc4\x10@M\xf6\x09\xc9\xdf\xac\x0dK^\
+\x1d\x97\x0b\x17\xa1\x9a\xa9\x1a\xdf\x0fe\x03\xe7\xf3\x22\x22\
+\x1b\x12\x99}\xc9\xc8\xae\x9c\x80\xbc\xfai%\xadld\
+16\xb7\xe2!k\xbc\xc3\xec#hZ\xf8\xcc\x16\x9f\
+\x9d\x1c\x9d\xe4?\x14\x95V\xf4\xf3\x88lI\x04\xe8\xc9\
+\xc8[\x0b\x89\xdf\x16\x02\xe4\xe5\x1e\xb5M\x12A\xdbr\
+\x22\xf0\xb6\x81N\x1cjf~\xa9Jh3\x80|)\
+!,\x97\xf4\xfa\xf7i;\x0b\x01\xb4ijC\xfd<\
+\xf2\xc2\x04|\x9a\xab\xa7\x18\x9e\xba\xf8D\xa6\x16\xfe>\
+2\xc1}}tl\xa6\xfb\xac\x7f\x94\xa8\xb8\x8c\x08k\
+\xfa\xb3\xac\x00\x92\xf2E\x0e\x00U@dF\xb9\x06\xfe\
+\x18\x97$\x00\xaa\xb6D\xf5R\x8c\x9e\xbfrl\x1fT\
+\x8e\x5c\xc4\xa5\xd5\xa1\xc0o\xd3\xceI\x09\xe4\xa0\x12\xc8\
+\xab\x9b\x82\x8c\xb2\xd1\xc5\xd8\x9c\xcaO\xc6\xc4\xe7\x99\xbb\
+\x08\x9b\x16>s\x94\xf7FD\xc7\xe5\x94D\xa5\x06\xef\
+\x8f\xca({=\x22\xb3J\x89\xcc\xacb\xcfF\xd2\x5c\
+\xad\x05XJ\x00\xcb\x15\x81.\xbd\x8d\x899\xed\xe8\xd5\
+\xc1n\x04k\x88\xb47\x10H\x9c\x01\xe8\xc6D\x1e\x0e\
+%\xf4\xbd\xdb\xf4\xcf\xf7\xa9\xd3z\xed\x5c\x08D\xaa\x86\
+\xf2\x1d$\xf9#\xd3K\x16\xa3\x92\xbc\x8fF\xc5f6\
+\xc4\xa4\x04\xff\xddF\x1e\x91\x96\x84\xcc\x08k\xda#\xa8\
+\x02\x14&\x80\x94\x22N\x12F\xe1\xfb\x90\xecg\x02\xa0\
+\x95\x86\x18:\x15\xf5\xee\xa4\x98\x9f\xc1Oy\x8fXo\
+\x1b\x83\x9e\x8f^q\x14\xe7\xad\xf2:\x91\xc0J$\x81\
+i%\xbdlT\x89w\xd5?\x15m\xcd4k\x07L\
+\x0b\xaf\xc5$f\xda\xfe_{\xe7\x16#\xc7U\xa7\xf1\
+\xae{UWU\xdf\xef\xd3\xb7\xb9\xcft\xb7{n\x8e\
+\xc7\x9e\xf1\x98\xc4v\x1c\xc7q\x9c\x0bZ\xed\xf2\x10.\
+\x82\x00\xca\x03\x0f\xfb\x04/\x88\x8b@\x08\x09\x10\x08\x09\
+\x1e\x22\x12%\xa0\xcd\xf2\x82\xa2\xc4\xe2\x22\x84\x90\x10 \
+\x04\x22o\x08\x09\xad\xb2Rv%D\x96\x8dv\x09\xac\
+Df\xaa8\xffS\xd5\xddU\xd5\xd5C\x08Y\x97a\
+\xbe\x9fT\x9a\x99\x9e\xf6\xa8\xbb\xe5\xf3\x9d\xef\xff\x9d\xff\
+9%\xdb\x9d}1\xbf\xfc\xacX\xec\xbd\xc6fL\x87\
+\x9fwO\xe1\x16\x9bE\xa7\xd7\xd6#\xb5\xff|p\xf6\
+\x0f[r+P\x97GC:3  \xa1\xe7\xc7X\
+\xfc\xc9\xdf\x8e\x8a\xc9\xe4u\xd0k\xa5@N\xacmy\
+\xb3~\xb1w$\xe6\x16\xbf%\xdb\xcd\x7f\xd0\xd3\xe5\xd7\
+m\xb9E\xc9\xcc\x0aZ\xe9\x19\xcf\x05x\x02\x90*\xf4\
+]\xb9\xb6\xc3\x05\xc0h\x9fuW\xee|\xb7;\xbc\xf6\
+\x01\xb7\x7f\xe5\xfd\xfc8v\xc3\x1f\xf4\xc1+\xcd^\xaf\
+\x11\x10\x03\xcf\x09\x1c\xb0r\xe0\x86\xd3`N\xa0\xba\xf9\
+\xa0c6O\xdf\xd4\xed6n*\x02\x92GN\x973\
+\x92\xd9\xb8.\xe5\x97\xfe\x95\xcd\x9a\xff'\xf83\xa8\xc4\
+\xfe\xe3\xeb\xcd]\xbe\xec\x17v\x05\xd3\xa5\xc2\xf4`\x0d\
+\xcf\xe8\x93\xc1;r\x01\xe1\x92`|\xcd_\x88\x0c\xfe\
+\xe9\xee>\xda\xb3@\xd9\x85\xde\xda\xe5a\x1d\xab\xf1\x1d\
+V\xce\xb8\xcc\xcd\xb0\x19\x7f\xe9&\x1b\xf87\xd4t\xe9\
+\x0d\x0d.I\xcd\xe6Sz\xed{\xa9\xdc\xba\xe3\x09@\
+\xcf\x15J}7\xcdf\xfe\x85\x0b\xefp\xfb\xf7<\xe6\
+\xf6\x99\x03\xa0m\xc3\xe1A\x1fv\x00\x13!\xb8\x10\xfa\
+}u\xe3\x069\x01\xb7<\xbc\xc1D\xe0\x8e\x9b\xb2\xde\
+\x80\x08\x80\xdb\x03\xdd\xae\xa4%\xbb\xfd\x16)\xb7\xfc\x84\
+XX}\x85\x0e\xc2L\xb1\x19u\x14\x18R\x1f\x01e\
+\x05^\xb7`4\x17\x98\xb2\xed\x01a\x08\xd7\xfa\xa3l\
+\xc0\x0c8\x80pi\x10N\xfbG\xdd\x89\xb4\xbf\x81\xba\
+\xefhF\x16\xa9\x91\xa7\xba\xe9\xbd\xbe\xe2\xea\x7f\x8b\xd9\
+\xc5\xaf\xc8v\xfb\x01\xdd\xac\xfc\xd5\xf5\xb5 [u\xc1\
+h|?\x95[c\xe5@\xcf\xd5\xea\xdb\xce\xe2\x85w\
+\xb9\xab\x97\xdf\xcb\xec\xff\xa3|\xf0\xa7cf~\xef\xba\
+\x10\x12\x03\xfe\xf3B\xd8\x09\x94O\xdd\xe7\x92\x13\xa0r\
+ \xdd\xd8y\xde\xb0\xbb\x08\x06\xc1\xed\x83Q^\xd6\x14\
+\xb36\x94\xb2\xdd\x7f\x96\xf3\xcb\xdfa\xe5\xc1\x1f\xf9\x91\
+\xd8\xd4K\xc0\xca\x04\x0a\xd8\xa8\xa1\x86\xeaaZ\xe2\x1b\
+\xd7\xe0\x81\xbc\xc0\x0e|\x1f\x0e\x02'\xf5{P@\xc6\
+A\xde\xc2\xc1d?\x02\xfb\xdbt\x1c7?\xb7\x90\xd9\
+{\x91\xd2|\xaa\xed\xe9u\x14\xd7\x8f\xe4\xc2\xea\x8fD\
+\xbb\xf3!\xd9\xac\x0c\xd5tY}3?\x03E\xcf\xb7\
+D\xb3yS)\xae;\xad3\xff\xe8\xae\xdc\xf5nw\
+\xed\xd2{\xf8IKFd\xa67\xfc\x0c \xee\xf1\xf4\
+\xd8\x01P/\x82\xff\x18\x13\x82\xca\xf0\xba\xdb\xd8y+\
+\x13\x81\xfb\x98\x08l?\xad\xa6[\xd6\x9b\xf9\xfa\x01x\
+SP\xedFA\xcet\x0e\xa4\xcc\xc2G\xc4\xdc\xca\xb7\
+\x85\xc2\xfa\xefR\x95\xa13ZW\xe7\x0d3|\x87\xdc\
+i\x1e\x22j\xcc\x96S\x8f\x01\xd5\xe5\xbc\x07\x80z\x01\
+h\x9d\x9f\xba\x07\xe7\xbd\xa6!\xda\xab\xcf\x1f\xa3\xa4\xbc\
+\xb3\xc7\x9fK\x03\x9d\xd6\xeb\xa9\x96\x97\xc9\xce\xfb\xf5<\
+_\xbb\xa7\xba\xbe<t\xc4\xc2\xda\xabR~\xe5[\xec\
+\xf5|X\xb1Zo\xd1\xf4\xfc\xff\xebv\x5c\xab\xb9\xfd\
+pm\xe3\xfe\xc3\xf6\xd9\xb7\xb9\x8b\xe7\x1fq3+\x17\
+')?\x0d\xec\xeeA\x8c\x13\xb8\x10*\x01\xd2\x81\xaf\
+\x13\xb1\xf0V\x07\xca\xa7\xae\xf9\x22p\xfd\xc8\xa8o}\
+\xcd\xc8/B\x04\xc0\xed\x8bj\xcf\xe5%\xb39\x14\xed\
+\xf6{\xc4L\xf7\x8bRn\xe9\xfblP\xfe\x97PX\
+s\x84\xf2\x86C\xab\x09\xe4\x12R\xfc\xfbM>\x80\xa9\
+|\xa0\x8bj\xf5\xd1\xf7\xfc\xa2\xe59>\xc8)o\xd8\
+\xe03;\xcf\x1ej\xb4\x22\xb1\xc1f\xf8\x9e#\x15\xd7\
+\xfe\x97fy)\xb7\xf8\x056\xe8\xdf.[\x8d\x0d\xcd\
+(\xdf\xb2\x9a9\xbfz\xf7WK\x83\xebNu\xf3A\
+\xbe\x1f\x82\x0f~\x7f\x00O\x06\xfc\xf9\xd0\xc0\xf6\x96\x00\
+\xa3\xa1\xe0h\xe6\x8f\x04\x84\xdd\xf3^9p\xfa\xadn\
+\xb1\x7f\xcd1\xea\x9bO\xc9F\xcd\xbcU\xef\x0f\x807\
+Lc\xed\x9c\xa0\x99\xe5\x92\x9c\xae\xf7\xe4l\xf7\xaah\
+\xb5\x1e\x93\xb2\x8b\x9fc\xa2\xf0$s\x0a?\x10\xf2+\
+/\xb0A\xfc\x1b\xe6\x18^K\x15{GB\xa9\xef\x08\
+E\xff\xa2V\x5c6\xc0S\x85\xb5C& /\xb3\xe7\
+\xbf \xb0\x7f\xc3f\xf7g\xa4\xec\xc2\xe7\xa5L\xfb1\
+%\xdb\xb9Be\x88jV\xabsk\xfb\x89l\xa8\xc9\
+.]\xfc\x95\xb9x\x97\xa3\xf3\xd3\x97\xd95\x1a\xdcq\
+\xd7\xfcA\xec\xe0\x8f\xbd\xc6\xff\xcesB\x14\x0c6v\
+\x1ev\x0b\xfdkGZ\xe5\xd4S\x9a\x89\xd5\x01\xf07\
+J\xb1{Z\x96\xcdZEV3M\xc5\xac\xaf\x0bf\
+c;e\xb5w\xa4\xdc\xc2\x199\xb7t\x96]\xbbR\
+~\xe9\x0cs\x11;)\xa3\xbe-\x1b\xd5\x9e\xacd\x9a\
+\xb2\x9a/\x17Z\x1b\xb7\xd5\xa6\x19\xb3u\xee\x97\xb4\xf6\
+O\xeeE\x0f5\xf9\xcc\x18\xf8\xdd\x83\x19eA\xb84\
+\x98,\x0fN\xbe'\x11\xa8\xed<\xe4\xe4{W\x1d\xa3\
+\xb1}S\xcft\xd0'\x00@\x92h\x85\x95\xafH\xb5\
+m^\xa2\xd0\xbe\xff\xe0\xcc=\xed\x02\xceO\x0b\xc3x\
+\x90\x87\x97\x02C\xe5\xc1\xd8\x09\x1c\xf0`\xb0\xba\xfd\x10\
+w\x02Fc\xe7\xa6jw\x91\x09\x00\x90\x14j\xbar\
+\xa7\xc4\xca\x17:4d\x22\x02\xd1v\xdf\x98\xda\x7f\x9c\
+\x15\xbc\xde\x92`\xd26\x5c\x19\xde\xef\xd6w\x1ev\x0a\
+\x83{\x1d\xa3\xb6\xf1/\xaa\xd5\x84\x08\x00\x90\x04\xaaU\
+c\xe5L\xfd\xb3t\x18(\x9d\x1a$T\x86L\x04\xce\
+\xf1\xc1Jy\x80\xee\x0f~}fI\x10\x15\x86\xf8\xd2\
+ \x94\x090\x11(\x9d\xba\xe6\xd6\x98\x13\xc8\xaf_=\
+\xd2\xab\xc3\xafif\x0b\xc1 \x00I \xa7\xcb\xb6`\
+\xd4\xbf)PG`\xf9\x14?\x15\x98o\xf9\xed\xee\x8f\
+s\x81\x91\x00\x84v\x03\x06\x84 \x1d\xfcy\xaa[0\
+\xa6\x97\x80=\xbf4\xb8\xcf\xadn=\xe8\xe4\xd6\xaf8\
+F}\xebiY\x9f\x83\x13\x00 \x09$\xd9\xae\x88F\
+\xf5\xbb\xe4\x04\xb8\x08T7]\x9d\x9a\x94:\xd1\x1d\x80\
+\x07\x91\xb0\xf0|\xc4\xea\xc7d\x00\xc7\xac\x0eP&P\
+\xd9|\xc0-\xf4\xae\x1e\x19\xb5\xcd\xa7t\xbb\x0b'\x00\
+@\x12H\xb2U\x15\x8c\xea\xd7\xc9\x09\xd0qaR\x95\
+v\x09\x9e\xe3\xcb\x83Fg2\xe0u\xff\x0a\x87\x82\x01\
+W\x10\xe8\x03\x88]\x1e\x0c\x89\x85'\x02\xd5\xcd\x07\x9c\
+\xfc\xfa=\x0e+\x07\x9e\x965\xf4\x09\x00\x90\x08\xb2\x96\
+/\x88F\xed\x1b\xde=\x02\x02\xe5\x00\x09\x00\xbb\xe8k\
+X\x00\xe2V\x0b\x82\x03\xdd\x13\x05=N\x00\xe6G\xc1\
+\xa0\xb7w\x80\x89\x80\x97\x09T\x06O\xe9\x996\xce\x13\
+\x00 \x09\x94t\xa1,Xs?\x16\x8a\x03\xee\x04\xe8\
+Vbt\x04\xd8\xc8\x09L\x95\x05\xa3N\xc1\xd0c\x07\
+\x93\xdf\x1d\x17\x12\xfa\xae!X\x0e\xe4\xd6\xae8\xe9\xb9\
+\x9d\xe7u\xbb\x85f!\x00\x92@I\x17\xe7E\xab\xf9\
+S\x81N\x0e.{\xe5\xc0(\x13\x18\xb9\x80\xa9\x01?\
+\x1f\x14\x84\x19\x03?(\x18\xc1\xbe\x01\xdaO\xe1\x97\x03\
+\x95\x8d\x1bn\xa1w\xefQ\xba\xbe\xf5\x9cb\xc3\x09\x00\
+\x90\x08\x8aQ\x5c\x91\xac\xe6\x0f\x85\xd2\xd0\xa1>\x01\xda\
+\x10\xe5\x89\xc0~H\x04\xf4`\x18\x18Z&\x8c\xd97\
+\x10\xb7L8\xee.\xf4\xca\x01\xea\x13\xe0N`\xfd\x1e\
+'\xdd<\xfd\x9c(W\xb0\x95\x18\x80$P\x94\xec\xbc\
+d6\x7fB\xa5\x00\x0f\x06\xb9\x08\xecO\x89@|\x1e\
+\x10\x09\x09g\xf6\x09\x04\x04\xa0\xeb\xed\xa8\xa4>\x81\xca\
+&s\x02}\x9e\x09<\xa9\x9as\x10\x01\x00\x92@V\
+\xb2\x8b\xa2\xd9z1$\x02~&\x10\x1f\x08\xc6\x89B\
+\xe4wS;\x0d\xc39\x82\xb7\x8b\xd0\x13\x81\xec\xeae\
+\xea\x18|B\xd6k\x10\x01\x00\x92@V2w\x88V\
+\xeb\xdfiu\xc0[\x22\xdcr';\x08g\x09@D\
+\x0cB-\xc4\xc1\x01\x1fn\x10\xf2./\x13(\xf6\xaf\
+\xbaeV\x12\xe4\xd6\xae\x1cj\x95SO*V\x13\xf7\
+\x1d\x00 \x09d5wF\xb0:/\xa5\x8a\x03\x87\x8b\
+@\xc5\x0f\x06\xd9`5F]\x83\x9d\xf0\xec?zL\
+\x0f\xfc\xac\xc79\x82\xee(8\x8c<\xce\x04\x86\x96\x08\
+K\xc3\xebN\xc6s\x02O*6\xca\x01\x00\x12A\xd6\
+\x8b{\x82\xdd\xfdO\xaf\x1c\x18\xf0S\x8dFy\x80\xd1\
+\x09\x0b@\xdcMD\xe2\xcb\x84c~\xeex\xa7-\x95\
+\x06\xd7H\x04\xdc\xdc\xea\xdd^&\x90ig\x92\xfe,\
+\x008\x91HZ\xfe\xa2`w\xfe\x8d\xdfr\x9c\x96\x08\
+\xb9\x08\xec\x85\xc2A\x83\xbb\x82\xb0\x10\xcc\x14\x84qI\
+\x10\xed-\x98<\x87\x8b\x009\x81S\xcc\x09,_r\
+\xf4\xda\xd6s\x9a\xddA\x9f\x00\x00I\xa0\xa6\xcb\xbb\x82\
+=\xff\x12\xdfF\xccD\x80\x0eQ\x9d\x08\xc0\xbeW\x16\
+\x8c\xba\x07\x8fu\x031B\x10wu\xbcL\xa0<\xe0\
+\x22\xe0fW\xefv\xf4\xfa\xd6\xb3\x8a\x05'\x00@\x22\
+\x88j\xfeN\xe6\x04~-\xf8N`J\x04:\xde\xc0\
+\xe5\x02\xd0\xd9\x8f\xe4\x00\xfe5\x1f\x1c\xe8\xd1\x00qZ\
+\x10\xf8\xea\x00+\x05\xe8\x22\x110\x98\x08\xa8V\x1b\xc1\
+ \x00I \xe9\x85K\xa2\xdd}Y`N\x80r\x01\
+:99,\x02~\xbf@`\xc9pVI\xa0O\xf5\
+\x0eL\xf7\x12\xe8|u\xe0\xc0-\x0e\xee\xe5N\x80\xef\
+\x1d(\xf7\x1e\xd73\x1d\x88\x00\x00I *\x99\xabB\
+f\xe1U\x9e\x09\xd0\x1d\x87\x1b\xbe\x08\xb4g\x0b\x01\x1f\
+\xcc\x7f\xb6\x91h\xc6j\xc1(\x13\xe0\xc1\xe0\xfdnf\
+\xf9\xd2\x91V\xee?!\xcaE\x88\x00\x00I i\x85\
+G\xc4\xcc\xe2\xabT\x0a\xf0L\x80\x8b\xc0\xde\xb4\x1b\xe8\
+\x8e\x84 ,\x063\x9b\x86f\xe5\x02~&P\xf2\x9d\
+@v\xf52\x13\x81\xc1\xe3\xaa\xd5\xc2\x12!\x00\xb7\x9a\
+\xca\xca\x9e \xa9\xb9\xb7\x0b\xd9\xc5\xdf3'\xe0\x8c\x82\
+A~\x9e\x00\xef\x1a\xdc\x9bv\x02\x9d`\x1e\x10\x14\x83\
+\x19\xad\xc4\xb1\x8e\x80\xfa\x04\xae\x93\x13p\xb8\x13\xa8\x0c\
+\x1e\xd7\x0b\x8b\xb7\xd5\xc9\xcb\x00\x9c\x08jKg\x05I\
+/\xbdK\xc8.\xfd\x9e\x9c\xc08\x18d\x22\xa0\x91\x00\
+\xb4\xa3\xe5\xc0t(8Y\x0e\xf4\xcf#\xecD\xcb\x82\
+\xb8>\x01\xef<\x01r\x02\x99\x95\xcb\x87zu\xf0E\
+=\xd3\xc6\xf1b\x00\xdcj\xca$\x02Z\xfeQ1\xbb\
+\xf8;a\xb4DX\xdb\xe6N@\x8bs\x02~\xbf\xc0\
+\x94\x08L\xcd\xf83\x0e\x1c\xf1\xff\xbd\xd7'p\xdd\x17\
+\x81K\x87F}\xe3\x99b\xe7\x0c\x9c\x00\x00\xb7\x9aR\
+s(\xcaF\xf9\x9f\x84\xdc\xf2\xab$\x00\xb4LH\x99\
+\x00\x09\x80wEs\x81\xbf\xa0W`\xc62\xe1hu\
+\x80\x9c@\x912\x81\x95\xbb_3*\xfd/\xb7{{\
+R\xd2\x9f\x07\x00'\x8eL}Md\xe5\xc0#Bv\
+\xf1\x0f\xdey\x02\xde\xea\x00\x17\x80\xa9p0\xd2\x1b\x10\
+\xbb<8}~@\x5c\x0b\xb1\xb7\x8b\xf0\xba[\x18\xdc\
+\xe7\xda\xcb\x17\xff\xc8D\xe0\xc3I\x7f\x16\x00\x9cH2\
+\xb99\xe6\x04*\xef\x14sK\x7f\x10F\x99\xc0\xdc\x19\
+_\x04bV\x06\xc6\x020Z\xf3\x1f\x89A\xcc\x0e\xc3\
+\xa9l\xc0\xbb\xe8\xef\xf0>\x81\xfe57\xb7~\x95n\
+\xcf\xfe?j\xb6\xd3O\xfa\xb3\x00\xe0Db\xe6\xe7$\
+Q+\xbcO\xc8\xaf\x1e\xa6\xcaC\xbe\x8b\x90n\xb1\xae\
+\xfb\xe5\xc0\xd4\x12a7\x1c\x0e\x86\xf7\x13\x1cL=n\
+\x84\x1e\x9f\x1cYN\x22\x90g\x02`/_v\xd4\xf2\
+\xe0\xbb\xf3\xc3\x8b\x89\xdc|\x15\x80\x13\x8f\xa2geI\
+\xaf|T\xc8\xaf\xbd\xc6w\x11R9\x10q\x02Z\xac\
+\x13\xf0R\xfe\xb8\x0dE\xb3\x97\x0cGMF\xfbl\xf6\
+\xbf\xd3\xb5\x97.:\xeco\x1c\xe9\xb9\xe6n\xd2\x9f\x03\
+\x00'\x16]3UQ/}\x8c;\x81\xa8\x08\xb4\xf7\
+BK\x83z`[q\x5c\xfb\xf0\xacc\xc9\xf5n\xb4\
+,8\xefZ\x8bw\xb9\x06\x13\x02\xad\xb8\xf2\x85\xa4?\
+\x03\x00N4\x8a\x92\xd6\x98\x08|\x829\x81\xa3\x94\x7f\
+\xda\xb0\xda<\x1b)\x05\x22\x81`g\xf25z\xb0\xc8\
+\xf1\x8e\xe0`\x5c\x0a\xe8\xf3\x17\x5c\xb5r\xea?Z\x03\
+\x94\x01\x00$\x8a\x22\x1b\x9a\xa4\x15?%\xe4\x96\x1d\x81\
+\xdf|d8\x16\x01-r\xe2\xf0\xa4]xr\xdaP\
+\xf8\xd4\xa1\x83\xc0=\x0a\xc2e@\xd0%Py\xa1\xd4\
+v\x0e5\xbb\xd9I\xfa\xfd\x03p\xe2Q\xe4\xb4.\xe8\
+\xe5\x0f2\x11\xf0\x9d\x00\x89\xc0\xeet(8n\x19\x0e\
+\x1c>\xda\x99.\x09\xc6b\x10\x12\x87\xc9\xef\xd4\xd69\
+Vn\x9c=\x14\x94\xccN\xd2\xef\x1d\x00\x90\xa2r \
+\xa3JZ\xfe3\x02\xbf-\xb9\xe7\x04\xb4V\xd0\x09\xc4\
+l$\xea\xec\x87\xcb\x82\xee~\xa8T\x08\xf5\x0e\x04Z\
+\x8d\xe5\xb9]W\x9a\xdb=\x14\xd4\xdc\x1dI\xbfo\x00\
+\x80\x8f\xa2fUQ\xaf~](\xf6\x9d\xd1\xbd\x08y\
+\xcbppe \x18\x0ev\xc3b`D\x83\xc3`n\
+\x10(#\xc4\xfa\x1d\xae\xc4J\x00Q\xcdn&\xfd\x9e\
+\x01\x00\x01\x14\xcd6d\xa3L\x22\xe0\xd2m\xc8Dr\
+\x02|\xdf\xc0d\xef\x80\x16\xe7\x04\xe2\x5cAh\xe0{\
+\xe2\xa01\xfb/\xd4v\x5c\xb1\xd8;\xca\xd7\xd7q\x86\
+ \x00\xb7\x1b\x9a\x91O\x8bF\xedY\xcf\x09xw$\
+\xa6\xba=$\x00\xed\xb8\x03F\x8e9y\xc8\xff\x99\x9a\
+\x8e\x84\xea\x8e+\x17\x96\x7f\x96\xf4\xfb\x04\x00\xcc@7\
++\x96\x9c\xae='\x14z\xce$\x18<\xeb\x97\x04{\
+1;\x09gd\x04\x81\xdfS\x89 01\x11\xaa\xdb\
+\x8el\xd6\x1fM\xfa=\x02\x00\x8eAO\x172b\xba\
+\xf6M*\x07R\xe5c\x82\xc1\xf6\xfe\xf1e\x01m\x11\
+f\xcf\xa1\xf3\x09S\x95\x0dG\xcc-\xbdbe\x1b\xb8\
+\xcb0\x00\xb7;\x9aU\xb2e\xb3\xf1=\xde#\xe0;\
+\x81Q\x1e\x10\xbc\xf4h>\x10)\x11\xd4\xb934\xf8\
+]\xb1\xbau\xa4\x98\xb5\xf7'\xfd\xbe\x00\x00\xaf\x13\xcd\
+\xc8\xe5%\xab\xf9\x0c\x13\x00\xbe\x8d\x982\x81`08\
+v\x04\xed\xfd\x88+\xf0l?m;\x16\xca\xcc\xfaW\
+6]9\xb7\xf0s\xd5.kI\xbf'\x00\xc0_\x80\
+j\x96M\xd9\x9a{\xde\x0b\x06\xfb~\xdb\xf0.O\xf5\
+\xf9N\xc2\xd1\xd7\xf1\x99\x83L\x04\xd8cRu\xd3\xa5\
+\x9b\x95\x88\xd5MG\xcc\xaf\xbc\xa8Z\x95v\xd2\xef\x05\
+\x00\xf0\x06P\x14\xd3\x96\xcc\xc67\x84b\xcf\x13\x01Z\
+*,\x0e\x5c\xa5\xbe\xe3\x89\x01\x85\x84\xad\xb3\xdc\xee\xd3\
+\xc0\xf7\x8e \x1b\xf2\xd9_\xce/\xbe\xa0Y\xf5\xf9\xa4\
+\xdf\x03\x00\xe0\xaf@\xd3K\xbad\x94>NA\x1e\x1b\
+\xfc\x0e\x09\x00]\xa9\xa2\x97\x11\xa4\xfck4\xf8\xe5\xd2\
+\xfaoe\xbb\xf9I5].&\xfd\xda\x01\x00o\x12\
+\xaa\x9e_R\xac\xfa\xa7E\xab\xfd\x0b\xa1\xb8\xfe\xdbT\
+\xb1w\x98*\x0d\x1c\xf6\x95\x89B\xff\x15)\xb7\xf4K\
+\xc9\x9a\xfb\x92fUW\x1b+\xe7\xb1\xeb\x0f\x80\xbfG\
+\x8c\x5c\xcbR\xb4\xecBJ\xafl\x89v\xeb\x8c\x98\xae\
+\x9d\x96\xb5\xc2\x92\x9e\xa9\xe0&\xa1\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xdc\x9e\
+\xfc\x09\xac\xbc\xca\x83\xc9\xab\x15\xca\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x13\xdc\
 /\
 * ==============\
 ================\
 ================\
 ================\
-=====\x0d\x0a * WinSpe\
-ctor Pro Main St\
-ylesheet - v1.4 \
-(Qt-Compatible)\x0d\
-\x0a * ============\
+=====\x0a * WinSpec\
+tor Pro Main Sty\
+lesheet - v1.4 (\
+Qt-Compatible)\x0a \
+* ==============\
 ================\
 ================\
 ================\
-======= */\x0d\x0a\x0d\x0a/*\
- ---------------\
+===== */\x0a\x0a/* ---\
 ----------------\
---\x0d\x0a * 1. \xd0\x9e\xd1\x81\xd0\xbd\
-\xd0\xbe\xd0\xb2\xd0\xbd\xd1\x8b\xd0\xb5 \xd0\xba\xd0\xbe\xd0\
-\xbd\xd1\x82\xd0\xb5\xd0\xb9\xd0\xbd\xd0\xb5\xd1\x80\xd1\x8b\x0d\
-\x0a * ------------\
+--------------\x0a \
+* 1. \xd0\x9e\xd1\x81\xd0\xbd\xd0\xbe\xd0\xb2\xd0\
+\xbd\xd1\x8b\xd0\xb5 \xd0\xba\xd0\xbe\xd0\xbd\xd1\x82\xd0\xb5\
+\xd0\xb9\xd0\xbd\xd0\xb5\xd1\x80\xd1\x8b\x0a * --\
 ----------------\
------ */\x0d\x0a \x0d\x0aQMa\
-inWindow {\x0d\x0a    \
-background: tran\
-sparent;\x0d\x0a}\x0d\x0a\x0d\x0aQ\
-ToolTip {\x0d\x0a    c\
-olor: #c8d6e5;\x0d\x0a\
-    background-c\
-olor: #2b3342;\x0d\x0a\
-    border: 1px \
-solid #4a5568;\x0d\x0a\
+--------------- \
+*/\x0a \x0aQMainWindow\
+ {\x0a    backgroun\
+d: transparent;\x0a\
+}\x0a\x0aQToolTip {\x0a  \
+  color: #c8d6e5\
+;\x0a    background\
+-color: #2b3342;\
+\x0a    border: 1px\
+ solid #4a5568;\x0a\
     border-radiu\
-s: 4px;\x0d\x0a    pad\
-ding: 5px;\x0d\x0a}\x0d\x0a\x0d\
-\x0a/* \xd0\xa1\xd1\x82\xd0\xb5\xd0\xba\xd0\xbb\xd1\x8f\
-\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb9 \xd0\xba\xd0\xbe\xd0\xbd\xd1\
-\x82\xd0\xb5\xd0\xb9\xd0\xbd\xd0\xb5\xd1\x80 \xd1\x81 \xd1\
-\x8d\xd1\x84\xd1\x84\xd0\xb5\xd0\xba\xd1\x82\xd0\xbe\xd0\xbc \
-\xd1\x80\xd0\xb0\xd0\xb7\xd0\xbc\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f\
- \xd1\x84\xd0\xbe\xd0\xbd\xd0\xb0 */\x0d\x0a#G\
-lassContainer {\x0d\
-\x0a    background-\
-color: rgba(30, \
-35, 45, 0.7); /*\
- \xd0\x9f\xd0\xbe\xd0\xbb\xd1\x83\xd0\xbf\xd1\x80\xd0\xbe\xd0\
-\xb7\xd1\x80\xd0\xb0\xd1\x87\xd0\xbd\xd1\x8b\xd0\xb9 \xd1\x84\
-\xd0\xbe\xd0\xbd */\x0d\x0a    bor\
-der-radius: 15px\
-; /* \xd0\xa1\xd0\xba\xd1\x80\xd1\x83\xd0\xb3\xd0\
-\xbb\xd0\xb5\xd0\xbd\xd0\xbd\xd1\x8b\xd0\xb5 \xd1\x83\xd0\xb3\
-\xd0\xbb\xd1\x8b \xd0\xbf\xd0\xbe \xd1\x83\xd0\xbc\xd0\xbe\
-\xd0\xbb\xd1\x87\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x8e */\x0d\
-\x0a    /* \xd0\xa3\xd0\xb1\xd0\xb8\xd1\x80\
-\xd0\xb0\xd0\xb5\xd0\xbc \xd1\x80\xd0\xb0\xd0\xbc\xd0\xba\xd1\
-\x83 \xd0\xbf\xd0\xbe\xd0\xbb\xd0\xbd\xd0\xbe\xd1\x81\xd1\x82\
-\xd1\x8c\xd1\x8e, \xd1\x82\xd0\xb0\xd0\xba \xd0\xba\xd0\
-\xb0\xd0\xba \xd0\xbe\xd0\xbd\xd0\xb0 \xd1\x8f\xd0\xb2\xd0\
-\xbb\xd1\x8f\xd0\xb5\xd1\x82\xd1\x81\xd1\x8f \xd0\xb8\xd1\x81\
-\xd1\x82\xd0\xbe\xd1\x87\xd0\xbd\xd0\xb8\xd0\xba\xd0\xbe\xd0\xbc\
- \xd0\xb0\xd1\x80\xd1\x82\xd0\xb5\xd1\x84\xd0\xb0\xd0\xba\xd1\
-\x82\xd0\xbe\xd0\xb2.\x0d\x0a       \xd0\
-\x97\xd0\xb0\xd1\x89\xd0\xb8\xd1\x82\xd0\xb0 \xd0\xbe\xd1\x82\
- \xd1\x81\xd0\xb8\xd1\x81\xd1\x82\xd0\xb5\xd0\xbc\xd0\xbd\xd0\
-\xbe\xd0\xb3\xd0\xbe \xd1\x81\xd0\xb2\xd0\xb5\xd1\x87\xd0\xb5\
-\xd0\xbd\xd0\xb8\xd1\x8f \xd0\xbe\xd0\xb1\xd0\xb5\xd1\x81\xd0\
-\xbf\xd0\xb5\xd1\x87\xd0\xb8\xd0\xb2\xd0\xb0\xd0\xb5\xd1\x82\xd1\
-\x81\xd1\x8f \xd1\x87\xd0\xb5\xd1\x80\xd0\xb5\xd0\xb7 N\
-oFocus \xd0\xb2 \xd0\xba\xd0\xbe\xd0\xb4\
-\xd0\xb5. */\x0d\x0a    bord\
-er: none;\x0d\x0a    o\
-utline: none; /*\
- \xd0\xa3\xd0\xb1\xd0\xb8\xd1\x80\xd0\xb0\xd0\xb5\xd0\xbc \
-\xd0\xba\xd0\xbe\xd0\xbd\xd1\x82\xd1\x83\xd1\x80 \xd1\x84\xd0\
-\xbe\xd0\xba\xd1\x83\xd1\x81\xd0\xb0 */\x0d\x0a}\x0d\
-\x0a\x0d\x0a/* \xd0\x9a\xd0\xbe\xd0\xb3\xd0\xb4\xd0\xb0\
- \xd0\xbe\xd0\xba\xd0\xbd\xd0\xbe \xd1\x80\xd0\xb0\xd0\xb7\
-\xd0\xb2\xd0\xb5\xd1\x80\xd0\xbd\xd1\x83\xd1\x82\xd0\xbe, \
-\xd1\x83\xd0\xb1\xd0\xb8\xd1\x80\xd0\xb0\xd0\xb5\xd0\xbc \xd1\
-\x81\xd0\xba\xd1\x80\xd1\x83\xd0\xb3\xd0\xbb\xd0\xb5\xd0\xbd\xd0\
-\xb8\xd0\xb5 \xd1\x83\xd0\xb3\xd0\xbb\xd0\xbe\xd0\xb2 *\
-/\x0d\x0a#GlassContain\
-er[maximized=\x22tr\
-ue\x22] {\x0d\x0a    bord\
-er-radius: 0px;\x0d\
-\x0a}\x0d\x0a\x0d\x0aTitleBar {\
-\x0d\x0a    background\
-: transparent;\x0d\x0a\
-}\x0d\x0a\x0d\x0a/* --------\
-----------------\
+s: 4px;\x0a    padd\
+ing: 5px;\x0a}\x0a\x0a/* \
+\xd0\xa1\xd1\x82\xd0\xb5\xd0\xba\xd0\xbb\xd1\x8f\xd0\xbd\xd0\xbd\
+\xd1\x8b\xd0\xb9 \xd0\xba\xd0\xbe\xd0\xbd\xd1\x82\xd0\xb5\xd0\
+\xb9\xd0\xbd\xd0\xb5\xd1\x80 \xd1\x81 \xd1\x8d\xd1\x84\xd1\
+\x84\xd0\xb5\xd0\xba\xd1\x82\xd0\xbe\xd0\xbc \xd1\x80\xd0\xb0\
+\xd0\xb7\xd0\xbc\xd1\x8b\xd1\x82\xd0\xb8\xd1\x8f \xd1\x84\xd0\
+\xbe\xd0\xbd\xd0\xb0 */\x0a#GlassC\
+ontainer {\x0a    b\
+ackground-color:\
+ rgba(30, 35, 45\
+, 0.7); /* \xd0\x9f\xd0\xbe\xd0\
+\xbb\xd1\x83\xd0\xbf\xd1\x80\xd0\xbe\xd0\xb7\xd1\x80\xd0\xb0\xd1\
+\x87\xd0\xbd\xd1\x8b\xd0\xb9 \xd1\x84\xd0\xbe\xd0\xbd *\
+/\x0a    border-rad\
+ius: 15px; /* \xd0\xa1\
+\xd0\xba\xd1\x80\xd1\x83\xd0\xb3\xd0\xbb\xd0\xb5\xd0\xbd\xd0\xbd\
+\xd1\x8b\xd0\xb5 \xd1\x83\xd0\xb3\xd0\xbb\xd1\x8b \xd0\xbf\
+\xd0\xbe \xd1\x83\xd0\xbc\xd0\xbe\xd0\xbb\xd1\x87\xd0\xb0\xd0\
+\xbd\xd0\xb8\xd1\x8e */\x0a    /* \
+\xd0\xa3\xd0\xb1\xd0\xb8\xd1\x80\xd0\xb0\xd0\xb5\xd0\xbc \xd1\
+\x80\xd0\xb0\xd0\xbc\xd0\xba\xd1\x83 \xd0\xbf\xd0\xbe\xd0\xbb\
+\xd0\xbd\xd0\xbe\xd1\x81\xd1\x82\xd1\x8c\xd1\x8e, \xd1\x82\
+\xd0\xb0\xd0\xba \xd0\xba\xd0\xb0\xd0\xba \xd0\xbe\xd0\xbd\
+\xd0\xb0 \xd1\x8f\xd0\xb2\xd0\xbb\xd1\x8f\xd0\xb5\xd1\x82\xd1\
+\x81\xd1\x8f \xd0\xb8\xd1\x81\xd1\x82\xd0\xbe\xd1\x87\xd0\xbd\
+\xd0\xb8\xd0\xba\xd0\xbe\xd0\xbc \xd0\xb0\xd1\x80\xd1\x82\xd0\
+\xb5\xd1\x84\xd0\xb0\xd0\xba\xd1\x82\xd0\xbe\xd0\xb2.\x0a \
+      \xd0\x97\xd0\xb0\xd1\x89\xd0\xb8\xd1\x82\
+\xd0\xb0 \xd0\xbe\xd1\x82 \xd1\x81\xd0\xb8\xd1\x81\xd1\x82\
+\xd0\xb5\xd0\xbc\xd0\xbd\xd0\xbe\xd0\xb3\xd0\xbe \xd1\x81\xd0\
+\xb2\xd0\xb5\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f \xd0\xbe\
+\xd0\xb1\xd0\xb5\xd1\x81\xd0\xbf\xd0\xb5\xd1\x87\xd0\xb8\xd0\xb2\
+\xd0\xb0\xd0\xb5\xd1\x82\xd1\x81\xd1\x8f \xd1\x87\xd0\xb5\xd1\
+\x80\xd0\xb5\xd0\xb7 NoFocus \xd0\xb2\
+ \xd0\xba\xd0\xbe\xd0\xb4\xd0\xb5. */\x0a  \
+  border: none;\x0a\
+    outline: non\
+e; /* \xd0\xa3\xd0\xb1\xd0\xb8\xd1\x80\xd0\xb0\
+\xd0\xb5\xd0\xbc \xd0\xba\xd0\xbe\xd0\xbd\xd1\x82\xd1\x83\xd1\
+\x80 \xd1\x84\xd0\xbe\xd0\xba\xd1\x83\xd1\x81\xd0\xb0 *\
+/\x0a}\x0a\x0a/* \xd0\x9a\xd0\xbe\xd0\xb3\xd0\xb4\
+\xd0\xb0 \xd0\xbe\xd0\xba\xd0\xbd\xd0\xbe \xd1\x80\xd0\xb0\
+\xd0\xb7\xd0\xb2\xd0\xb5\xd1\x80\xd0\xbd\xd1\x83\xd1\x82\xd0\xbe\
+, \xd1\x83\xd0\xb1\xd0\xb8\xd1\x80\xd0\xb0\xd0\xb5\xd0\xbc\
+ \xd1\x81\xd0\xba\xd1\x80\xd1\x83\xd0\xb3\xd0\xbb\xd0\xb5\xd0\
+\xbd\xd0\xb8\xd0\xb5 \xd1\x83\xd0\xb3\xd0\xbb\xd0\xbe\xd0\xb2\
+ */\x0a#GlassContai\
+ner[maximized=\x22t\
+rue\x22] {\x0a    bord\
+er-radius: 0px;\x0a\
+}\x0a\x0aTitleBar {\x0a  \
+  background: tr\
+ansparent;\x0a}\x0a\x0a/*\
+ ---------------\
 ----------------\
 ----------------\
----\x0d\x0a * 2. \xd0\xa1\xd1\x82\xd1\
-\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x86\xd1\x8b \xd0\xb8 \xd0\
-\xb8\xd1\x85 \xd1\x84\xd0\xbe\xd0\xbd\x0d\x0a * -\
+------------\x0a * \
+2. \xd0\xa1\xd1\x82\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\
+\x86\xd1\x8b \xd0\xb8 \xd0\xb8\xd1\x85 \xd1\x84\xd0\xbe\
+\xd0\xbd\x0a * ----------\
 ----------------\
 ----------------\
 ----------------\
----------- */\x0d\x0a\x0d\
-\x0a/* \xd0\x94\xd0\xb5\xd0\xbb\xd0\xb0\xd0\xb5\xd0\xbc\
- \xd1\x84\xd0\xbe\xd0\xbd \xd0\xb2\xd1\x81\xd0\xb5\xd1\x85\
- \xd1\x81\xd1\x82\xd1\x80\xd0\xb0\xd0\xbd\xd0\xb8\xd1\x86 \
-\xd0\xb2\xd0\xbd\xd1\x83\xd1\x82\xd1\x80\xd0\xb8 QSt\
-ackedWidget \xd0\xbf\xd1\x80\
-\xd0\xbe\xd0\xb7\xd1\x80\xd0\xb0\xd1\x87\xd0\xbd\xd1\x8b\xd0\xbc\
-,\x0d\x0a   \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b\
- \xd0\xb1\xd1\x8b\xd0\xbb \xd0\xb2\xd0\xb8\xd0\xb4\xd0\xb5\
-\xd0\xbd \xd1\x84\xd0\xbe\xd0\xbd #Glass\
-Container. */\x0d\x0a#\
-HomePageWrapper,\
- #ProcessingPage\
-, #ResultsPage {\
-\x0d\x0a    background\
-: transparent;\x0d\x0a\
-}\x0d\x0a\x0d\x0a/* --------\
+- */\x0a\x0a/* \xd0\x94\xd0\xb5\xd0\xbb\xd0\
+\xb0\xd0\xb5\xd0\xbc \xd1\x84\xd0\xbe\xd0\xbd \xd0\xb2\xd1\
+\x81\xd0\xb5\xd1\x85 \xd1\x81\xd1\x82\xd1\x80\xd0\xb0\xd0\xbd\
+\xd0\xb8\xd1\x86 \xd0\xb2\xd0\xbd\xd1\x83\xd1\x82\xd1\x80\xd0\
+\xb8 QStackedWidget\
+ \xd0\xbf\xd1\x80\xd0\xbe\xd0\xb7\xd1\x80\xd0\xb0\xd1\x87\xd0\
+\xbd\xd1\x8b\xd0\xbc,\x0a   \xd1\x87\xd1\x82\xd0\xbe\
+\xd0\xb1\xd1\x8b \xd0\xb1\xd1\x8b\xd0\xbb \xd0\xb2\xd0\xb8\
+\xd0\xb4\xd0\xb5\xd0\xbd \xd1\x84\xd0\xbe\xd0\xbd #G\
+lassContainer. *\
+/\x0a#HomePageWrapp\
+er, #ProcessingP\
+age, #ResultsPag\
+e {\x0a    backgrou\
+nd: transparent;\
+\x0a}\x0a\x0a/* ---------\
 ----------------\
----------\x0d\x0a * 3.\
- \xd0\xa2\xd0\xb8\xd0\xbf\xd0\xbe\xd0\xb3\xd1\x80\xd0\xb0\xd1\
-\x84\xd0\xb8\xd0\xba\xd0\xb0\x0d\x0a * ----\
+--------\x0a * 3. \xd0\
+\xa2\xd0\xb8\xd0\xbf\xd0\xbe\xd0\xb3\xd1\x80\xd0\xb0\xd1\x84\xd0\
+\xb8\xd0\xba\xd0\xb0\x0a * -------\
 ----------------\
-------------- */\
-\x0d\x0a\x0d\x0a#TitleLabel \
-{\x0d\x0a    font-size\
-: 32px;\x0d\x0a    fon\
-t-weight: 600;\x0d\x0a\
-    padding-top:\
- 10px;\x0d\x0a    colo\
-r: white;\x0d\x0a}\x0d\x0a\x0d\x0a\
-#SubtitleLabel {\
-\x0d\x0a    font-size:\
- 14px;\x0d\x0a    colo\
-r: #b0b0b0;\x0d\x0a   \
- padding-bottom:\
- 20px;\x0d\x0a}\x0d\x0a\x0d\x0a#St\
-atusLabel {\x0d\x0a   \
- font-size: 20px\
-;\x0d\x0a    font-weig\
-ht: 500;\x0d\x0a    co\
-lor: #FFFFFF;\x0d\x0a \
-   padding-botto\
-m: 15px;\x0d\x0a}\x0d\x0a\x0d\x0a#\
-ResultTitle {\x0d\x0a \
-   font-size: 24\
-px;\x0d\x0a    font-we\
-ight: 600;\x0d\x0a    \
-color: #EAEAEA;\x0d\
-\x0a    margin-bott\
-om: 10px;\x0d\x0a}\x0d\x0a\x0d\x0a\
+---------- */\x0a\x0a#\
+TitleLabel {\x0a   \
+ font-size: 32px\
+;\x0a    font-weigh\
+t: 600;\x0a    padd\
+ing-top: 10px;\x0a \
+   color: white;\
+\x0a}\x0a\x0a#SubtitleLab\
+el {\x0a    font-si\
+ze: 14px;\x0a    co\
+lor: #b0b0b0;\x0a  \
+  padding-bottom\
+: 20px;\x0a}\x0a\x0a#Stat\
+usLabel {\x0a    fo\
+nt-size: 20px;\x0a \
+   font-weight: \
+500;\x0a    color: \
+#FFFFFF;\x0a    pad\
+ding-bottom: 15p\
+x;\x0a}\x0a\x0a#ResultTit\
+le {\x0a    font-si\
+ze: 24px;\x0a    fo\
+nt-weight: 600;\x0a\
+    color: #EAEA\
+EA;\x0a    margin-b\
+ottom: 10px;\x0a}\x0a\x0a\
 /* -------------\
 ----------------\
-----\x0d\x0a * 4. \xd0\xad\xd0\xbb\
-\xd0\xb5\xd0\xbc\xd0\xb5\xd0\xbd\xd1\x82\xd1\x8b \xd1\x83\xd0\
-\xbf\xd1\x80\xd0\xb0\xd0\xb2\xd0\xbb\xd0\xb5\xd0\xbd\xd0\xb8\xd1\
-\x8f\x0d\x0a * ----------\
+----\x0a * 4. \xd0\xad\xd0\xbb\xd0\
+\xb5\xd0\xbc\xd0\xb5\xd0\xbd\xd1\x82\xd1\x8b \xd1\x83\xd0\xbf\
+\xd1\x80\xd0\xb0\xd0\xb2\xd0\xbb\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f\
+\x0a * ------------\
 ----------------\
-------- */\x0d\x0a\x0d\x0aQP\
-ushButton {\x0d\x0a   \
- background-colo\
-r: qlineargradie\
-nt(x1:0, y1:0, x\
-2:0, y2:1, stop:\
-0 #0078D4, stop:\
-1 #005a9e);\x0d\x0a   \
- color: white;\x0d\x0a\
-    font-size: 1\
-4px;\x0d\x0a    font-w\
-eight: bold;\x0d\x0a  \
-  border: 1px so\
-lid #0078D4;\x0d\x0a  \
-  border-radius:\
- 8px;\x0d\x0a    paddi\
-ng: 10px 25px;\x0d\x0a\
-    min-width: 1\
-50px;\x0d\x0a}\x0d\x0a\x0d\x0aQPus\
-hButton:hover {\x0d\
+----- */\x0a\x0aQPushB\
+utton {\x0a    back\
+ground-color: ql\
+ineargradient(x1\
+:0, y1:0, x2:0, \
+y2:1, stop:0 #00\
+78D4, stop:1 #00\
+5a9e);\x0a    color\
+: white;\x0a    fon\
+t-size: 14px;\x0a  \
+  font-weight: b\
+old;\x0a    border:\
+ 1px solid #0078\
+D4;\x0a    border-r\
+adius: 8px;\x0a    \
+padding: 10px 25\
+px;\x0a    min-widt\
+h: 150px;\x0a}\x0a\x0aQPu\
+shButton:hover {\
 \x0a    background-\
 color: qlineargr\
 adient(x1:0, y1:\
 0, x2:0, y2:1, s\
 top:0 #108de0, s\
-top:1 #006ac1);\x0d\
-\x0a    border-colo\
-r: #108de0;\x0d\x0a}\x0d\x0a\
-\x0d\x0aQPushButton:pr\
-essed {\x0d\x0a    bac\
-kground-color: q\
-lineargradient(x\
-1:0, y1:0, x2:0,\
- y2:1, stop:0 #0\
-05a9e, stop:1 #0\
-04b8e);\x0d\x0a    bor\
-der-color: #005a\
-9e;\x0d\x0a}\x0d\x0a\x0d\x0aQPushB\
-utton:disabled {\
-\x0d\x0a    background\
--color: #555555;\
-\x0d\x0a    border-col\
-or: #666666;\x0d\x0a  \
-  color: #999999\
-;\x0d\x0a}\x0d\x0a\x0d\x0a#CancelB\
-utton {\x0d\x0a    /* \
+top:1 #006ac1);\x0a\
+    border-color\
+: #108de0;\x0a}\x0a\x0aQP\
+ushButton:presse\
+d {\x0a    backgrou\
+nd-color: qlinea\
+rgradient(x1:0, \
+y1:0, x2:0, y2:1\
+, stop:0 #005a9e\
+, stop:1 #004b8e\
+);\x0a    border-co\
+lor: #005a9e;\x0a}\x0a\
+\x0aQPushButton:dis\
+abled {\x0a    back\
+ground-color: #5\
+55555;\x0a    borde\
+r-color: #666666\
+;\x0a    color: #99\
+9999;\x0a}\x0a\x0a#Cancel\
+Button {\x0a    /* \
 \xd0\x9e\xd1\x87\xd0\xb5\xd0\xbd\xd1\x8c \xd1\x82\xd0\xb5\xd0\
 \xbc\xd0\xbd\xd1\x8b\xd0\xb9 \xd1\x84\xd0\xbe\xd0\xbd, \
 \xd1\x87\xd1\x82\xd0\xbe\xd0\xb1\xd1\x8b \xd0\xba\xd0\xbd\xd0\
@@ -214,130 +1918,125 @@ utton {\x0d\x0a    /* \
  \xd0\xb7\xd0\xb0\xd0\xbc\xd0\xb5\xd1\x82\xd0\xbd\xd0\xb0,\
  \xd0\xbd\xd0\xbe \xd0\xbd\xd0\xb5 \xd0\xbe\xd1\x82\xd0\
 \xb2\xd0\xbb\xd0\xb5\xd0\xba\xd0\xb0\xd0\xbb\xd0\xb0 */\
-\x0d\x0a    background\
--color: qradialg\
-radient(cx:0.5, \
-cy:0.5, radius:0\
-.9, fx:0.5, fy:0\
-.5, stop:0 rgba(\
-40, 50, 65, 0.6)\
-, stop:1 rgba(30\
-, 35, 45, 0.8));\
-\x0d\x0a    color: #a0\
-a0a0;\x0d\x0a    borde\
-r: 1px solid #2a\
-3341;\x0d\x0a}\x0d\x0a\x0d\x0a#Can\
-celButton:hover \
-{\x0d\x0a    /* \xd0\xad\xd1\x84\xd1\x84\
-\xd0\xb5\xd0\xba\xd1\x82 \xd1\x81\xd0\xb2\xd0\xb5\xd1\x87\xd0\
-\xb5\xd0\xbd\xd0\xb8\xd1\x8f \xd0\xbf\xd1\x80\xd0\xb8 \xd0\
-\xbd\xd0\xb0\xd0\xb2\xd0\xb5\xd0\xb4\xd0\xb5\xd0\xbd\xd0\xb8\xd0\
-\xb8, \xd0\xb2 \xd1\x81\xd1\x82\xd0\xb8\xd0\xbb\xd0\xb5\
- \xd0\xb3\xd0\xbb\xd0\xb0\xd0\xb2\xd0\xbd\xd0\xbe\xd0\xb9 \
-\xd0\xba\xd0\xbd\xd0\xbe\xd0\xbf\xd0\xba\xd0\xb8 */\x0d\
 \x0a    background-\
 color: qradialgr\
 adient(cx:0.5, c\
 y:0.5, radius:0.\
 9, fx:0.5, fy:0.\
-5, stop:0 rgba(3\
-0, 144, 255, 0.5\
-), stop:1 rgba(3\
-0, 35, 45, 0.8))\
-;\x0d\x0a    color: wh\
-ite;\x0d\x0a    border\
-: 1px solid #1E9\
-0FF;\x0d\x0a}\x0d\x0a\x0d\x0a#Canc\
-elButton:pressed\
- {\x0d\x0a    /* \xd0\x91\xd0\xbe\xd0\
-\xbb\xd0\xb5\xd0\xb5 \xd0\xb8\xd0\xbd\xd1\x82\xd0\xb5\xd0\xbd\
-\xd1\x81\xd0\xb8\xd0\xb2\xd0\xbd\xd0\xbe\xd0\xb5 \xd1\x81\xd0\
-\xb2\xd0\xb5\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5 \xd0\xbf\
-\xd1\x80\xd0\xb8 \xd0\xbd\xd0\xb0\xd0\xb6\xd0\xb0\xd1\x82\xd0\
-\xb8\xd0\xb8 */\x0d\x0a    back\
-ground-color: qr\
-adialgradient(cx\
-:0.5, cy:0.5, ra\
-dius:0.9, fx:0.5\
-, fy:0.5, stop:0\
- rgba(30, 144, 2\
-55, 0.6), stop:1\
- rgba(30, 35, 45\
-, 0.9));\x0d\x0a    bo\
-rder-color: #007\
-8D4;\x0d\x0a}\x0d\x0a\x0d\x0aQProg\
-ressBar {\x0d\x0a    b\
-order: 1px solid\
- #2a3341;\x0d\x0a    b\
-order-radius: 6p\
-x;\x0d\x0a    text-ali\
-gn: center;\x0d\x0a   \
- background-colo\
-r: rgba(0, 0, 0,\
- 0.4);\x0d\x0a    heig\
-ht: 12px;\x0d\x0a    c\
-olor: transparen\
-t;\x0d\x0a}\x0d\x0a\x0d\x0aQProgre\
-ssBar::chunk {\x0d\x0a\
-    border-radiu\
-s: 5px;\x0d\x0a    bac\
+5, stop:0 rgba(4\
+0, 50, 65, 0.6),\
+ stop:1 rgba(30,\
+ 35, 45, 0.8));\x0a\
+    color: #a0a0\
+a0;\x0a    border: \
+1px solid #2a334\
+1;\x0a}\x0a\x0a#CancelBut\
+ton:hover {\x0a    \
+/* \xd0\xad\xd1\x84\xd1\x84\xd0\xb5\xd0\xba\xd1\x82 \
+\xd1\x81\xd0\xb2\xd0\xb5\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd1\x8f\
+ \xd0\xbf\xd1\x80\xd0\xb8 \xd0\xbd\xd0\xb0\xd0\xb2\xd0\xb5\
+\xd0\xb4\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb8, \xd0\xb2 \xd1\
+\x81\xd1\x82\xd0\xb8\xd0\xbb\xd0\xb5 \xd0\xb3\xd0\xbb\xd0\xb0\
+\xd0\xb2\xd0\xbd\xd0\xbe\xd0\xb9 \xd0\xba\xd0\xbd\xd0\xbe\xd0\
+\xbf\xd0\xba\xd0\xb8 */\x0a    bac\
 kground-color: q\
-lineargradient(\x0d\
-\x0a        x1:0, y\
-1:0.5, x2:1, y2:\
-0.5,\x0d\x0a        st\
+radialgradient(c\
+x:0.5, cy:0.5, r\
+adius:0.9, fx:0.\
+5, fy:0.5, stop:\
+0 rgba(30, 144, \
+255, 0.5), stop:\
+1 rgba(30, 35, 4\
+5, 0.8));\x0a    co\
+lor: white;\x0a    \
+border: 1px soli\
+d #1E90FF;\x0a}\x0a\x0a#C\
+ancelButton:pres\
+sed {\x0a    /* \xd0\x91\xd0\
+\xbe\xd0\xbb\xd0\xb5\xd0\xb5 \xd0\xb8\xd0\xbd\xd1\x82\xd0\xb5\
+\xd0\xbd\xd1\x81\xd0\xb8\xd0\xb2\xd0\xbd\xd0\xbe\xd0\xb5 \xd1\
+\x81\xd0\xb2\xd0\xb5\xd1\x87\xd0\xb5\xd0\xbd\xd0\xb8\xd0\xb5 \
+\xd0\xbf\xd1\x80\xd0\xb8 \xd0\xbd\xd0\xb0\xd0\xb6\xd0\xb0\xd1\
+\x82\xd0\xb8\xd0\xb8 */\x0a    bac\
+kground-color: q\
+radialgradient(c\
+x:0.5, cy:0.5, r\
+adius:0.9, fx:0.\
+5, fy:0.5, stop:\
+0 rgba(30, 144, \
+255, 0.6), stop:\
+1 rgba(30, 35, 4\
+5, 0.9));\x0a    bo\
+rder-color: #007\
+8D4;\x0a}\x0a\x0aQProgres\
+sBar {\x0a    borde\
+r: 1px solid #2a\
+3341;\x0a    border\
+-radius: 6px;\x0a  \
+  text-align: ce\
+nter;\x0a    backgr\
+ound-color: rgba\
+(0, 0, 0, 0.4);\x0a\
+    height: 12px\
+;\x0a    color: tra\
+nsparent;\x0a}\x0a\x0aQPr\
+ogressBar::chunk\
+ {\x0a    border-ra\
+dius: 5px;\x0a    b\
+ackground-color:\
+ qlineargradient\
+(\x0a        x1:0, \
+y1:0.5, x2:1, y2\
+:0.5,\x0a        st\
 op:0 #1E90FF, st\
-op:1 #00BFFF\x0d\x0a  \
-  );\x0d\x0a}\x0d\x0a\x0d\x0a#Repo\
-rtBrowser {\x0d\x0a   \
- background-colo\
-r: rgba(0, 0, 0,\
- 0.25);\x0d\x0a    bor\
-der: 1px solid #\
-444;\x0d\x0a    border\
--radius: 8px;\x0d\x0a \
-   color: #EAEAE\
-A;\x0d\x0a    font-siz\
-e: 14px;\x0d\x0a    pa\
-dding: 10px;\x0d\x0a}\x0d\
-\x0a\x0d\x0a/* ----------\
+op:1 #00BFFF\x0a   \
+ );\x0a}\x0a\x0a#ReportBr\
+owser {\x0a    back\
+ground-color: rg\
+ba(0, 0, 0, 0.25\
+);\x0a    border: 1\
+px solid #444;\x0a \
+   border-radius\
+: 8px;\x0a    color\
+: #EAEAEA;\x0a    f\
+ont-size: 14px;\x0a\
+    padding: 10p\
+x;\x0a}\x0a\x0a/* -------\
 ----------------\
--------\x0d\x0a * 5. \xd0\
-\xa1\xd0\xba\xd1\x80\xd0\xbe\xd0\xbb\xd0\xbb\xd0\xb1\xd0\xb0\xd1\
-\x80\xd1\x8b\x0d\x0a * --------\
+----------\x0a * 5.\
+ \xd0\xa1\xd0\xba\xd1\x80\xd0\xbe\xd0\xbb\xd0\xbb\xd0\xb1\xd0\
+\xb0\xd1\x80\xd1\x8b\x0a * -------\
 ----------------\
---------- */\x0d\x0a\x0d\x0a\
-QScrollBar:verti\
-cal {\x0d\x0a    borde\
-r: none;\x0d\x0a    ba\
-ckground: transp\
-arent;\x0d\x0a    widt\
-h: 10px;\x0d\x0a    ma\
-rgin: 0;\x0d\x0a}\x0d\x0a\x0d\x0aQ\
-ScrollBar::handl\
-e:vertical {\x0d\x0a  \
-  background: #5\
-55;\x0d\x0a    border-\
-radius: 5px;\x0d\x0a  \
-  min-height: 25\
-px;\x0d\x0a}\x0d\x0a\x0d\x0aQScrol\
-lBar::handle:ver\
-tical:hover {\x0d\x0a \
-   background: #\
-108de0;\x0d\x0a}\x0d\x0a\x0d\x0aQS\
-crollBar::add-li\
-ne:vertical, QSc\
-rollBar::sub-lin\
-e:vertical {\x0d\x0a  \
-  height: 0px;\x0d\x0a\
+---------- */\x0a\x0aQ\
+ScrollBar:vertic\
+al {\x0a    border:\
+ none;\x0a    backg\
+round: transpare\
+nt;\x0a    width: 1\
+0px;\x0a    margin:\
+ 0;\x0a}\x0a\x0aQScrollBa\
+r::handle:vertic\
+al {\x0a    backgro\
+und: #555;\x0a    b\
+order-radius: 5p\
+x;\x0a    min-heigh\
+t: 25px;\x0a}\x0a\x0aQScr\
+ollBar::handle:v\
+ertical:hover {\x0a\
     background: \
-none;\x0d\x0a}\x0d\x0a\x0d\x0aQScr\
-ollBar::add-page\
+#108de0;\x0a}\x0a\x0aQScr\
+ollBar::add-line\
 :vertical, QScro\
-llBar::sub-page:\
-vertical {\x0d\x0a    \
+llBar::sub-line:\
+vertical {\x0a    h\
+eight: 0px;\x0a    \
 background: none\
-;\x0d\x0a}\
+;\x0a}\x0a\x0aQScrollBar:\
+:add-page:vertic\
+al, QScrollBar::\
+sub-page:vertica\
+l {\x0a    backgrou\
+nd: none;\x0a}\
 \x00\x13\xfa\x88\
 \x89\
 PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
@@ -82184,6 +83883,10 @@ qt_resource_name = b"\
 \x07\xac\x02\xc3\
 \x00s\
 \x00t\x00y\x00l\x00e\x00s\
+\x00\x07\
+\x08sO_\
+\x00a\
+\x00p\x00p\x00.\x00i\x00c\x00o\
 \x00\x08\
 \x08\x01V\xc3\
 \x00m\
@@ -82199,18 +83902,20 @@ qt_resource_name = b"\
 "
 
 qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x04\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x05\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x01\x00\x00\x00\x04\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x97s\x17\x9d\xaa\
-\x00\x00\x008\x00\x02\x00\x00\x00\x01\x00\x00\x00\x05\
+\x00\x00\x01\x97\x82\xbc\x9e\xe8\
+\x00\x00\x006\x00\x00\x00\x00\x00\x01\x00\x00j\xcb\
+\x00\x00\x01\x97\x82\xbc\x9e\xe8\
+\x00\x00\x00L\x00\x02\x00\x00\x00\x01\x00\x00\x00\x06\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00J\x00\x00\x00\x00\x00\x01\x00\x00\x14\x99\
-\x00\x00\x01\x97s\x17\x9d\x84\
+\x00\x00\x00^\x00\x00\x00\x00\x00\x01\x00\x00~\xab\
+\x00\x00\x01\x97\x82\xbc\x9e\xe8\
 "
 
 def qInitResources():
@@ -0,0 +1,12 @@
+# src/winspector/utils/__init__.py
+"""
+Вспомогательные функции приложения WinSpector Pro, не зависящие от GUI.
+"""
+
+from .admin import check_admin_rights, relaunch_as_admin, set_app_user_model_id
+
+__all__ = [
+    "check_admin_rights",
+    "relaunch_as_admin",
+    "set_app_user_model_id",
+]
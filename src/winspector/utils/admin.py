@@ -0,0 +1,110 @@
+# src/winspector/utils/admin.py
+"""
+Проверка прав администратора и перезапуск приложения с повышенными правами.
+"""
+import ctypes
+from ctypes import wintypes
+import functools
+import subprocess
+import sys
+import logging
+from typing import Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Функции shell32 разрешаются один раз при импорте модуля, с явными
+# argtypes/restype: ctypes не приходится угадывать типы при каждом вызове.
+if sys.platform == "win32":
+    _shell32 = ctypes.WinDLL("shell32", use_last_error=True)
+
+    _IsUserAnAdmin = _shell32.IsUserAnAdmin
+    _IsUserAnAdmin.argtypes = ()
+    _IsUserAnAdmin.restype = wintypes.BOOL
+
+    _ShellExecuteW = _shell32.ShellExecuteW
+    _ShellExecuteW.argtypes = (
+        wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR,
+        wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_int,
+    )
+    _ShellExecuteW.restype = wintypes.HINSTANCE
+
+    _SetAppUserModelID = _shell32.SetCurrentProcessExplicitAppUserModelID
+    _SetAppUserModelID.argtypes = (wintypes.LPCWSTR,)
+    _SetAppUserModelID.restype = ctypes.HRESULT
+else:
+    # На системах, отличных от Windows, или в тестовых окружениях
+    _shell32 = None
+
+@functools.lru_cache(maxsize=None)
+def check_admin_rights() -> bool:
+    """
+    Проверяет, запущено ли приложение с правами администратора.
+    Токен процесса не меняется за время его жизни, поэтому результат
+    вычисляется один раз и кэшируется.
+    """
+    if _shell32 is None:
+        return False
+    try:
+        return _IsUserAnAdmin() != 0
+    except OSError:
+        return False
+
+def set_app_user_model_id(app_id: str) -> bool:
+    """
+    Устанавливает AppUserModelID процесса для корректного отображения
+    иконки в панели задач.
+
+    Returns:
+        True, если идентификатор был установлен.
+    """
+    if _shell32 is None:
+        return False
+    try:
+        _SetAppUserModelID(app_id)
+    except OSError as e:
+        # restype HRESULT превращает код ошибки в OSError
+        logger.warning(f"Не удалось установить AppUserModelID: {e}")
+        return False
+    return True
+
+def _build_relaunch_params(extra_args: Sequence[str]) -> Optional[str]:
+    """
+    Формирует командную строку для нового процесса с корректным экранированием.
+
+    В собранном .exe sys.executable - само приложение, поэтому передаются
+    только аргументы; при запуске из исходников первым аргументом
+    интерпретатора должен идти путь к скрипту.
+    """
+    args = sys.argv[1:] if getattr(sys, 'frozen', False) else sys.argv
+    cmdline = subprocess.list2cmdline([*args, *extra_args])
+    # Пустая строка не нужна: None избавляет ShellExecuteW от разбора аргументов
+    return cmdline or None
+
+def relaunch_as_admin(extra_args: Sequence[str] = ()) -> bool:
+    """
+    Пытается перезапустить приложение с правами администратора.
+
+    Args:
+        extra_args: Дополнительные аргументы, добавляемые к аргументам
+            текущего процесса.
+
+    Returns:
+        True, если запрос на перезапуск был успешно отправлен.
+    """
+    logger.info("Отправлен запрос на перезапуск с правами администратора.")
+    if _shell32 is None:
+        return False
+    params = _build_relaunch_params(extra_args)
+    try:
+        # HINSTANCE - это указатель; None соответствует значению 0
+        result = _ShellExecuteW(None, "runas", sys.executable, params, None, 1) or 0
+    except Exception as e:
+        logger.error(f"Не удалось перезапустить с правами администратора: {e}")
+        return False
+
+    # ShellExecuteW возвращает значение > 32 при успехе; иначе это код ошибки
+    # (например, 5, если пользователь отклонил запрос UAC).
+    if result <= 32:
+        logger.error(f"Перезапуск с правами администратора не выполнен (код {result}).")
+        return False
+    return True
@@ -7,6 +7,7 @@ import re
 import subprocess
 import sys
 import winreg
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -202,21 +203,23 @@ class ResearcherV3_Final:
         if self.system_data_cache:
             return self.system_data_cache
         logger.info("Начало полного сбора системных данных (ResearcherV3_Final)...")
-        profiler = UserProfiler(profiler_config={})
-        optimizer = WindowsOptimizer()
-        profile_task = profiler.get_system_profile()
-        components_task = optimizer.get_system_components()
-        dynamic_task = self._collect_dynamic_data()
-        startup_items = self._collect_startup_items()
-        scheduled_tasks = self._collect_scheduled_tasks()
-        hosts_entries = self._collect_hosts_file_entries()
-        logger.info("Поиск точных путей установки для ключевых программ...")
-        steam_path = self._get_install_path_from_registry("Steam")
-        known_paths = {}
-        if steam_path:
-            known_paths["steam_install_path"] = steam_path
-            logger.info(f"Найден путь установки Steam: {steam_path}")
-        profile, components, dynamic = await asyncio.gather(profile_task, components_task, dynamic_task)
+        # Пул для WMI-воркеров принадлежит исследователю и закрывается после сбора
+        with ProcessPoolExecutor(max_workers=1) as wmi_pool:
+            profiler = UserProfiler(process_pool=wmi_pool)
+            optimizer = WindowsOptimizer(optimization_rules=[], process_pool=wmi_pool)
+            profile_task = profiler.get_system_profile()
+            components_task = optimizer.get_system_components()
+            dynamic_task = self._collect_dynamic_data()
+            startup_items = self._collect_startup_items()
+            scheduled_tasks = self._collect_scheduled_tasks()
+            hosts_entries = self._collect_hosts_file_entries()
+            logger.info("Поиск точных путей установки для ключевых программ...")
+            steam_path = self._get_install_path_from_registry("Steam")
+            known_paths = {}
+            if steam_path:
+                known_paths["steam_install_path"] = steam_path
+                logger.info(f"Найден путь установки Steam: {steam_path}")
+            profile, components, dynamic = await asyncio.gather(profile_task, components_task, dynamic_task)
         self.system_data_cache = {
             "profile": profile,
             "components": components,